@@ -0,0 +1,207 @@
+"""Productivity aggregates over the session history, computed column-wise with NumPy.
+
+History rows are loaded into structured NumPy arrays, and each refresh loads only the rows
+added since the last one. All aggregates come from a per-day rollup built with a few bincount
+passes over the new rows. Prefix sums over the rollup answer any date range in constant time,
+so once refresh() has run (e.g. on a background thread at startup), opening an analytics view
+costs no queries.
+
+    python analytics.py --history history.sqlite3
+"""
+import argparse
+import datetime
+import os
+import sqlite3
+import sys
+import threading
+
+import numpy as np
+
+from engine import State
+from history import COMPLETED_WORK_SQL, EventKind
+
+EVENT_DTYPE = np.dtype([('id', 'i8'), ('ts', 'f8'), ('day', 'i4'), ('kind', 'u1'), ('from_state', 'u1'),
+                        ('to_state', 'u1'), ('rests', 'u1'), ('elapsed', 'f8'),
+                        ('completed', '?')])  # COMPLETED_WORK_SQL, evaluated by SQLite as rows are loaded
+EMPTY = np.empty(0, EVENT_DTYPE)
+
+
+class DailyRollup:
+    """Per-day totals for every day from first_day to last_day, plus prefix sums for range queries.
+
+    Built from `events`, added on top of `base` (an earlier rollup) if given, so a refresh only
+    has to count the new rows.
+    """
+
+    COLUMNS = ('focus_seconds', 'completed', 'skipped', 'resets', 'pauses')
+
+    def __init__(self, events, base=None):
+        days = events['day']
+        if base is not None and base.last_day >= base.first_day:
+            self.first_day = min(base.first_day, int(days.min())) if len(events) else base.first_day
+            self.last_day = max(base.last_day, int(days.max())) if len(events) else base.last_day
+        else:
+            base = None
+            self.first_day = int(days.min()) if len(events) else 0
+            self.last_day = int(days.max()) if len(events) else -1
+        length = self.last_day - self.first_day + 1
+        offset = days - self.first_day
+        working = events['from_state'] == State.Working.value
+        kind = events['kind']
+
+        def per_day(mask, weights=None):
+            return np.bincount(offset[mask], weights=None if weights is None else weights[mask], minlength=length)
+
+        self.focus_seconds = per_day(working, events['elapsed'])
+        self.completed = per_day(events['completed'])
+        self.skipped = per_day(working & (kind == EventKind.Skip))
+        self.resets = per_day(working & (kind == EventKind.Reset))
+        self.pauses = per_day(kind == EventKind.Pause)
+        if base is not None:
+            start = base.first_day - self.first_day
+            for column in self.COLUMNS:
+                getattr(self, column)[start:start + len(base.focus_seconds)] += getattr(base, column)
+        # _prefix[column][i] is the total over the first i days, so any range is one subtraction
+        self._prefix = {column: np.concatenate(([0], np.cumsum(getattr(self, column)))) for column in self.COLUMNS}
+
+    @property
+    def days(self):
+        return np.arange(self.first_day, self.last_day + 1)
+
+    def total(self, column, start_day, end_day):
+        """Sum of `column` over date ordinals start_day..end_day, inclusive."""
+        start = min(max(start_day - self.first_day, 0), self.last_day - self.first_day + 1)
+        end = min(max(end_day - self.first_day + 1, 0), self.last_day - self.first_day + 1)
+        if end <= start:
+            return 0
+        prefix = self._prefix[column]
+        return prefix[end] - prefix[start]
+
+
+class Analytics:
+    """Cached aggregates over a history database written by HistoryStore.
+
+    refresh() is safe to call from a background thread; readers always see a complete rollup.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.rollup = DailyRollup(EMPTY)
+        self._chunks = []  # One array per refresh that found new rows
+        self._last_id = 0
+        self._lock = threading.Lock()  # Serializes refreshes
+
+    @property
+    def events(self):
+        """Every loaded row as one structured array, joined on first use after a refresh."""
+        chunks = self._chunks
+        if len(chunks) > 1:
+            chunks = self._chunks = [np.concatenate(chunks)]
+        return chunks[0] if chunks else EMPTY
+
+    def refresh(self):
+        """Loads rows added since the last refresh and counts them into the rollup. Returns how many there were."""
+        with self._lock:
+            new = self._load(self._last_id)
+            if len(new):
+                self._chunks = self._chunks + [new]
+                self._last_id = int(new['id'][-1])
+                self.rollup = DailyRollup(new, base=self.rollup)
+            return len(new)
+
+    def _load(self, after_id):
+        try:
+            connection = sqlite3.connect(f'file:{self.path}?mode=ro', uri=True)
+        except sqlite3.OperationalError:
+            return EMPTY  # Nothing recorded yet
+        try:
+            cursor = connection.execute(f'SELECT id, ts, day, kind, from_state, to_state, rests, elapsed, '
+                                        f'{COMPLETED_WORK_SQL} FROM events WHERE id > ? ORDER BY id', (after_id,))
+            return np.fromiter(cursor, dtype=EVENT_DTYPE)
+        except sqlite3.OperationalError:
+            return EMPTY  # The writer hasn't created the table yet
+        finally:
+            connection.close()
+
+    def focus_minutes(self, start_day, end_day):
+        """Minutes spent in Working phases between two date ordinals, inclusive (like HistoryStore)."""
+        return float(self.rollup.total('focus_seconds', start_day, end_day)) / 60
+
+    def daily_focus_minutes(self, start_day, end_day):
+        """(date ordinals, focus minutes) for every day in the range, including empty days."""
+        rollup = self.rollup
+        days = np.arange(start_day, end_day + 1)
+        minutes = np.zeros(len(days))
+        inside = (days >= rollup.first_day) & (days <= rollup.last_day)
+        minutes[inside] = rollup.focus_seconds[days[inside] - rollup.first_day] / 60
+        return days, minutes
+
+    def weekly_focus_minutes(self):
+        """(Monday date ordinals, focus minutes) for every week from the first recorded week to the last."""
+        rollup = self.rollup
+        if rollup.last_day < rollup.first_day:
+            return np.empty(0, 'i8'), np.empty(0)
+        week = (rollup.days - 1) // 7  # Ordinal 1 (1 January of year 1) was a Monday
+        minutes = np.bincount(week - week[0], weights=rollup.focus_seconds) / 60
+        return (np.arange(len(minutes)) + week[0]) * 7 + 1, minutes
+
+    def completion_rate(self, start_day, end_day):
+        """Fraction of Working phases ended in the range that ran to completion rather than being skipped or reset.
+
+        None if no Working phase ended in the range.
+        """
+        completed = self.rollup.total('completed', start_day, end_day)
+        ended = completed + self.rollup.total('skipped', start_day, end_day) + self.rollup.total('resets', start_day, end_day)
+        return float(completed / ended) if ended else None
+
+    def pauses(self, start_day, end_day):
+        return int(self.rollup.total('pauses', start_day, end_day))
+
+    def streaks(self, today=None):
+        """(longest, current) runs of consecutive days with at least one completed Working phase.
+
+        The current streak still counts if today has nothing completed yet but yesterday did.
+        """
+        rollup = self.rollup
+        active = rollup.completed > 0
+        if not active.any():
+            return 0, 0
+        # Run lengths of consecutive active days, from the indices where activity starts and stops
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], active.view(np.int8), [0]))))
+        starts, ends = edges[::2], edges[1::2]
+        longest = int((ends - starts).max())
+        today = (today or datetime.date.today()).toordinal()
+        last_active = rollup.first_day + int(ends[-1]) - 1
+        current = int(ends[-1] - starts[-1]) if today - last_active <= 1 else 0
+        return longest, current
+
+    def summary(self, today=None):
+        """The headline numbers for an analytics view."""
+        today = today or datetime.date.today()
+        day = today.toordinal()
+        monday = day - today.weekday()
+        longest, current = self.streaks(today)
+        return {'focus_minutes_today': self.focus_minutes(day, day),
+                'focus_minutes_this_week': self.focus_minutes(monday, day),
+                'focus_minutes_last_30_days': self.focus_minutes(day - 29, day),
+                'completion_rate_last_30_days': self.completion_rate(day - 29, day),
+                'pauses_this_week': self.pauses(monday, day),
+                'longest_streak': longest,
+                'current_streak': current}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Print productivity aggregates from the Pymodoro history')
+    parser.add_argument('--history', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'history.sqlite3'))
+    args = parser.parse_args(argv)
+    analytics = Analytics(args.history)
+    analytics.refresh()
+    for name, value in analytics.summary().items():
+        if isinstance(value, float):
+            value = f'{value:.2f}'
+        print(f'{name.replace("_", " ")}: {"-" if value is None else value}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
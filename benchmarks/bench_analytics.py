@@ -0,0 +1,94 @@
+"""Benchmark: analytics over a synthetic history of a million events.
+
+Builds a history database with HistoryStore's schema in a temp directory, then times the cold
+load and rollup, the cached queries an analytics view would make, an incremental refresh after
+a day's worth of new events, and HistoryStore's SQL queries for the same numbers.
+
+    python benchmarks/bench_analytics.py --events 1000000
+"""
+import argparse
+import datetime
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics import Analytics, DailyRollup  # noqa: E402
+from engine import State  # noqa: E402
+from history import SCHEMA, EventKind, HistoryStore, day_of  # noqa: E402
+
+
+def synthetic_rows(count, days, seed=0):
+    """`count` plausible events spread over the `days` days ending today, in time order."""
+    rng = np.random.default_rng(seed)
+    end = time.time()
+    ts = np.sort(rng.uniform(end - days * 86400, end, count))
+    kind = rng.choice([EventKind.Transition, EventKind.Skip, EventKind.Reset, EventKind.Pause, EventKind.Resume,
+                       EventKind.CatchUp], size=count, p=[0.58, 0.1, 0.05, 0.125, 0.125, 0.02])
+    from_state = rng.choice([State.Working.value, State.Rest.value, State.LongRest.value], size=count, p=[0.5, 0.4, 0.1])
+    to_state = np.where(from_state == State.Working.value, State.Rest.value, State.Working.value)
+    elapsed = np.where(kind == EventKind.Transition, 1500.0, rng.uniform(0, 1500, count))
+    elapsed[(kind == EventKind.Pause) | (kind == EventKind.Resume)] = 0.0
+    elapsed[(kind == EventKind.CatchUp) & (rng.random(count) < 0.5)] = 0.0  # Phases that passed whole while asleep
+    rests = rng.integers(0, 4, count)
+    day = [day_of(t) for t in ts.tolist()]
+    return zip(ts.tolist(), day, kind.tolist(), from_state.tolist(), to_state.tolist(), rests.tolist(), elapsed.tolist())
+
+
+def timed(function, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = function()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--events', type=int, default=1_000_000)
+    parser.add_argument('--days', type=int, default=3 * 365, help='days of history the events are spread over')
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'history.sqlite3')
+        connection = sqlite3.connect(path)
+        connection.executescript(SCHEMA)
+        with connection:
+            connection.executemany('INSERT INTO events (ts, day, kind, from_state, to_state, rests, elapsed) '
+                                   'VALUES (?, ?, ?, ?, ?, ?, ?)', synthetic_rows(args.events, args.days))
+        connection.close()
+
+        analytics = Analytics(path)
+        load, _ = timed(analytics.refresh)
+        rollup_time, _ = timed(lambda: DailyRollup(analytics.events), repeat=5)
+        summary_time, summary = timed(analytics.summary, repeat=1000)
+        weekly_time, _ = timed(analytics.weekly_focus_minutes, repeat=100)
+
+        history = HistoryStore(path)
+        today = datetime.date.today()
+        for _ in range(40):  # A day of new events
+            history.record(EventKind.Transition, State.Working, State.Rest, 1, 1500)
+        history.flush()
+        incremental, new_rows = timed(analytics.refresh)
+        sql_week, _ = timed(lambda: history.focus_minutes_this_week(today), repeat=10)
+        sql_streak, sql_longest = timed(history.longest_streak, repeat=3)
+        history.close()
+
+    print(f'{args.events} events over {args.days} days')
+    print(f'  cold load + rollup:           {load * 1e3:9.1f} ms')
+    print(f'    of which the rollup:        {rollup_time * 1e3:9.1f} ms')
+    print(f'  refresh, {new_rows} new rows:         {incremental * 1e3:9.1f} ms')
+    print(f'  summary() from the rollup:    {summary_time * 1e6:9.1f} us')
+    print(f'  weekly_focus_minutes():       {weekly_time * 1e6:9.1f} us')
+    print(f'  SQL focus_minutes_this_week:  {sql_week * 1e6:9.1f} us')
+    print(f'  SQL longest_streak:           {sql_streak * 1e3:9.1f} ms')
+    print(f'  summary: {summary}')
+    print(f'  longest streak, analytics vs SQL: {analytics.streaks()[0]} vs {sql_longest}')
+
+
+if __name__ == '__main__':
+    main()
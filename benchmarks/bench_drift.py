@@ -0,0 +1,180 @@
+"""Drift benchmark: legacy per-second decrement vs. the PhaseTimer deadline scheduler.
+
+Runs a full four-cycle schedule (Working/Rest x3, Working, LongRest) under synthetic CPU load
+and reports how far each phase end lands from its ideal time. Phases are compressed by --scale
+so the run takes minutes instead of hours; all reported numbers are in unscaled seconds. At high
+scales one unscaled second is only a few real milliseconds, so GIL hand-offs to the load threads
+show up as a second or two of error even for the deadline scheduler.
+
+    python benchmarks/bench_drift.py --scale 200 --load-threads 2
+"""
+import argparse
+import heapq
+import itertools
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from phase_timer import PhaseTimer  # noqa: E402
+
+SCHEDULE = [('Working', 25*60), ('Rest', 5*60)] * 3 + [('Working', 25*60), ('LongRest', 15*60)]
+
+
+class AfterLoop:
+    """Minimal stand-in for Tk's after()/mainloop() running on a scaled clock."""
+
+    def __init__(self, scale):
+        self.scale = scale
+        self.queue = []
+        self.seq = itertools.count()
+        self.stopped = False
+
+    def clock(self):
+        return time.monotonic() * self.scale
+
+    def after(self, ms, callback):
+        due = time.monotonic() + ms / 1000 / self.scale
+        heapq.heappush(self.queue, (due, next(self.seq), callback))
+
+    def run(self):
+        while self.queue and not self.stopped:
+            due, _, callback = heapq.heappop(self.queue)
+            delay = due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            callback()
+
+
+class SyntheticLoad:
+    """Per-callback busy work plus optional background threads competing for the CPU/GIL."""
+
+    def __init__(self, scale, mean_ms, stall_ms, stall_probability, threads, seed):
+        self.scale = scale
+        self.mean_ms = mean_ms
+        self.stall_ms = stall_ms
+        self.stall_probability = stall_probability
+        self.random = random.Random(seed)
+        self.stop_event = threading.Event()
+        self.threads = [threading.Thread(target=self._burn_forever, daemon=True) for _ in range(threads)]
+
+    def __enter__(self):
+        for thread in self.threads:
+            thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop_event.set()
+        for thread in self.threads:
+            thread.join()
+
+    def _burn_forever(self):
+        while not self.stop_event.is_set():
+            sum(i * i for i in range(2000))
+
+    def callback_cost(self):
+        """Burns CPU for one callback; durations are in unscaled ms (GC pause, image decode, dialog)."""
+        ms = self.random.expovariate(1 / self.mean_ms) if self.mean_ms else 0.0
+        if self.random.random() < self.stall_probability:
+            ms += self.stall_ms
+        end = time.perf_counter() + ms / 1000 / self.scale
+        while time.perf_counter() < end:
+            pass
+
+
+def ideal_phase_ends(start):
+    ends = []
+    t = start
+    for _, duration in SCHEDULE:
+        t += duration
+        ends.append(t)
+    return ends
+
+
+def run_legacy(loop, load):
+    """The original continuous_increment: after(1000) and subtract one second per callback."""
+    phases = iter(SCHEDULE)
+    state = {'remaining': next(phases)[1], 'ends': []}
+    start = loop.clock()
+
+    def tick():
+        load.callback_cost()
+        state['remaining'] -= 1
+        if state['remaining'] <= 0:
+            state['ends'].append(loop.clock())
+            phase = next(phases, None)
+            if phase is None:
+                loop.stopped = True
+                return
+            state['remaining'] = phase[1]
+        loop.after(1000, tick)
+
+    loop.after(1000, tick)
+    loop.run()
+    return start, state['ends']
+
+
+def run_deadline(loop, load):
+    """PhaseTimer: remaining derived from the deadline, wake-ups aligned to its whole seconds."""
+    phases = iter(SCHEDULE)
+    timer = PhaseTimer(clock=loop.clock)
+    timer.start(next(phases)[1])
+    timer.resume()
+    start = loop.clock()
+    ends = []
+
+    def tick():
+        load.callback_cost()
+        timer.seconds_remaining()
+        if timer.remaining() <= 0:
+            ends.append(loop.clock())
+            phase = next(phases, None)
+            if phase is None:
+                loop.stopped = True
+                return
+            timer.start(phase[1])
+        loop.after(timer.next_tick_delay_ms(), tick)
+
+    loop.after(timer.next_tick_delay_ms(), tick)
+    loop.run()
+    return start, ends
+
+
+def report(name, start, ends):
+    errors = [actual - ideal for actual, ideal in zip(ends, ideal_phase_ends(start))]
+    print(f'{name}:')
+    for (phase, _), error in zip(SCHEDULE, errors):
+        print(f'  {phase:<9} end error {error:+8.2f} s')
+    print(f'  max |error| {max(abs(e) for e in errors):.2f} s, final {errors[-1]:+.2f} s')
+    return errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=float, default=200.0, help='time compression factor (default 200)')
+    parser.add_argument('--mean-ms', type=float, default=15.0, help='mean per-callback work, unscaled ms')
+    parser.add_argument('--stall-ms', type=float, default=400.0, help='size of an occasional stall, unscaled ms')
+    parser.add_argument('--stall-probability', type=float, default=0.01)
+    parser.add_argument('--load-threads', type=int, default=2, help='background CPU-burning threads')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--only', choices=['legacy', 'deadline'])
+    args = parser.parse_args(argv)
+
+    total = sum(duration for _, duration in SCHEDULE)
+    print(f'Four-cycle schedule, {total / 60:.0f} min compressed {args.scale:g}x '
+          f'(~{total / args.scale:.0f} s per run)')
+    for name, runner in (('legacy', run_legacy), ('deadline', run_deadline)):
+        if args.only and args.only != name:
+            continue
+        load = SyntheticLoad(args.scale, args.mean_ms, args.stall_ms, args.stall_probability,
+                             args.load_threads, args.seed)
+        with load:
+            start, ends = runner(AfterLoop(args.scale), load)
+        report(name, start, ends)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark: ProgressRing frame cost over a whole phase, at the tick rate and at animation rates.
+
+Runs headless against benchmarks/headless.py. The ring is built on CanvasStub, which counts
+item calls, so the numbers are the Python cost of each show() plus how often Tk would be
+touched; Tk's own redraw of the changed items is not included.
+
+    python benchmarks/bench_progress_ring.py --phase 1500 --fps 1 10 30
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import headless  # noqa: E402
+
+
+def run_phase(ring, phase_seconds, fps):
+    """Shows every frame of a phase of `phase_seconds` at `fps`. Returns the per-frame times."""
+    samples = []
+    frames = int(phase_seconds * fps)
+    for frame in range(frames + 1):
+        remaining = phase_seconds - frame / fps
+        seconds = int(-(-remaining // 1))  # Rounded up, like PhaseTimer.seconds_remaining
+        text = f'{seconds // 60:0>2}:{seconds % 60:0>2}'
+        start = time.perf_counter()
+        ring.show(remaining / phase_seconds, text)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--phase', type=int, default=1500, help='phase length in seconds (default 25:00)')
+    parser.add_argument('--fps', type=float, nargs='+', default=[1, 10, 30])
+    parser.add_argument('--size', type=int, default=110, help='ring diameter in pixels')
+    args = parser.parse_args(argv)
+
+    progress_ring = headless.load_progress_ring()
+    print(f'{args.phase}s phase, {args.size}px ring')
+    print(f'{"fps":>6} {"frames":>8} {"median":>10} {"p99":>10} {"max":>10} {"item calls/frame":>18}')
+    for fps in args.fps:
+        ring = progress_ring.ProgressRing(headless.CanvasStub(), size=args.size)
+        calls = ring.item_calls
+        samples = sorted(run_phase(ring, args.phase, fps))
+        print(f'{fps:6g} {len(samples):8} {statistics.median(samples) * 1e6:8.2f}us '
+              f'{samples[int(len(samples) * 0.99) - 1] * 1e6:8.2f}us {samples[-1] * 1e6:8.2f}us '
+              f'{(ring.item_calls - calls) / len(samples):18.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""Micro-benchmark: state-graphic transition latency, per-transition decode vs. StateGraphicCache.
+
+Cycles through the nine state graphics the way a full four-cycle schedule does. With a display
+the timings include PhotoImage creation; without one (no $DISPLAY) only the decode step is
+measured, which is the part the cache removes.
+
+    python benchmarks/bench_state_graphics.py --rounds 50
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import PIL.Image  # noqa: E402
+
+from state_graphics import StateGraphicCache  # noqa: E402
+
+res_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'res')
+IMAGE_KEYS = {'Ready': 'ReadyState.png', 'Working1': 'Working1State.png', 'Rest1': 'Rest1State.png',
+              'Working2': 'Working2State.png', 'Rest2': 'Rest2State.png', 'Working3': 'Working3State.png',
+              'Rest3': 'Rest3State.png', 'Working4': 'Working4State.png', 'LongRest1': 'Rest4State.png'}
+image_paths = {key: os.path.join(res_dir, name) for key, name in IMAGE_KEYS.items()}
+
+
+def decode_only(image):
+    image.load()
+    return image
+
+
+def photo_factory():
+    """Returns (factory, label): real PhotoImage when Tk can open a display, a plain decode otherwise."""
+    try:
+        import tkinter as tk
+        import PIL.ImageTk
+        root = tk.Tk()
+        root.withdraw()
+        return PIL.ImageTk.PhotoImage, 'decode + PhotoImage'
+    except Exception:
+        return decode_only, 'decode only (no display)'
+
+
+def time_transitions(show, rounds):
+    samples = []
+    for _ in range(rounds):
+        for key in image_paths:
+            start = time.perf_counter()
+            show(key)
+            samples.append((time.perf_counter() - start) * 1e6)
+    return samples
+
+
+def summarize(name, samples):
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f'  {name:<8} mean {statistics.mean(samples):9.1f} us   median {statistics.median(samples):9.1f} us'
+          f'   p95 {p95:9.1f} us')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rounds', type=int, default=50)
+    args = parser.parse_args(argv)
+
+    factory, label = photo_factory()
+    photos = []  # Keep legacy PhotoImages alive like state_image_lbl.image does
+
+    def legacy(key):
+        photos[:] = [factory(PIL.Image.open(image_paths[key]))]
+
+    cache = StateGraphicCache(image_paths, photo_factory=factory)
+    cache.preload_in_background().join()
+
+    print(f'State graphic transition latency ({label}), {args.rounds} rounds x {len(image_paths)} states:')
+    summarize('before', time_transitions(legacy, args.rounds))
+    summarize('after', time_transitions(cache.get, args.rounds))
+
+
+if __name__ == '__main__':
+    main()
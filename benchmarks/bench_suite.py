@@ -0,0 +1,203 @@
+"""Benchmark suite for the hot paths in main.py, with JSON results and baseline comparison.
+
+Runs headless against benchmarks/headless.py. Each case times single calls with an untimed
+prepare step before each one, and reports the median, p95 and minimum in microseconds.
+
+    python benchmarks/bench_suite.py --output results.json
+    python benchmarks/bench_suite.py --baseline results.json --threshold 0.25
+
+With --baseline, any case whose median is more than --threshold slower than the baseline
+is reported as a regression, and the exit status is 1.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import headless  # noqa: E402
+
+
+def measure(prepare, operation, iterations):
+    for _ in range(max(1, iterations // 10)):  # Warm up caches and lazily created state
+        prepare()
+        operation()
+    samples = []
+    for _ in range(iterations):
+        prepare()
+        start = time.perf_counter()
+        operation()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return {'median_us': statistics.median(samples) * 1e6,
+            'p95_us': samples[int(len(samples) * 0.95) - 1] * 1e6,
+            'min_us': samples[0] * 1e6,
+            'iterations': iterations}
+
+
+def nothing():
+    pass
+
+
+def build_cases(pymodoro, main):
+    """Returns [(name, prepare, operation)] for the running app."""
+    from engine import SHORT_RESTS_PER_CYCLE
+    State = main.State
+    cases = []
+
+    # Tick: a running 25:00 phase on a fake clock that moves a quarter second per tick
+    clock = [0.0]
+    timer = pymodoro.phase_timer
+    timer.clock = lambda: clock[0]
+
+    def start_phase(state=State.Working, rests=0):
+        pymodoro.engine.state = state
+        pymodoro.engine.rests = rests
+        timer.deadline = None
+        timer.paused_remaining = pymodoro.engine.durations[state.name]
+        timer.resume()
+
+    def advance_clock():
+        clock[0] += 0.25
+        if timer.deadline - clock[0] < 1:
+            start_phase()
+
+    start_phase()
+    cases.append(('tick', advance_clock, pymodoro.continuous_increment))
+
+    # One case per edge of the state machine
+    for previous, rests in ((State.Ready, 0), (State.Working, 0), (State.Working, SHORT_RESTS_PER_CYCLE),
+                            (State.Rest, 1), (State.LongRest, 0)):
+        name = f'transition_state {previous.name}' + (f' rests={rests}' if previous == State.Working else '')
+        cases.append((name, lambda previous=previous, rests=rests: start_phase(previous, rests),
+                      pymodoro.transition_state))
+
+    cases.append(('refresh_window unchanged', lambda: start_phase(State.Working), pymodoro.refresh_window))
+
+    def flip_layout():
+        start_phase(State.Ready if pymodoro.state != State.Ready else State.Working)
+
+    cases.append(('refresh_window layout swap', flip_layout, pymodoro.refresh_window))
+
+    cases.append(('load_options', nothing, pymodoro.load_options))
+
+    def change_voice():
+        pymodoro.voice_active_var.set(not pymodoro.voice_active_var.get())
+
+    cases.append(('save_options', change_voice, pymodoro.save_options))
+
+    def save_and_flush():
+        pymodoro.save_options()
+        pymodoro.options.flush()
+
+    cases.append(('save_options + flush', change_voice, save_and_flush))
+
+    def enable_voice():
+        pymodoro.voice_active_var.set(True)
+
+    cases.append(('play_sound', enable_voice, lambda: pymodoro.play_sound('lets_get_back_to_work')))
+
+    toggle_switch = headless.load_toggle_switch()
+    switch = toggle_switch.ToggleSwitch(headless.CanvasStub(), pymodoro.voice_active_var)
+    cases.append(('ToggleSwitch._draw_switch', change_voice, switch._draw_switch))
+
+    # A whole toggle: the variable write, every animation frame and the command, on a fake clock
+    variable = headless.BooleanVarStub(False)
+    animated = toggle_switch.ToggleSwitch(headless.CanvasStub(), variable, command=nothing)
+    frame_clock = [0.0]
+    animated.clock = lambda: frame_clock[0]
+
+    def toggle():
+        variable.set(not variable.get())
+        while animated.run_pending():
+            frame_clock[0] += animated.frame_ms / 1000
+
+    cases.append(('ToggleSwitch toggle', nothing, toggle))
+
+    # One ring frame at 30 fps through a 25:00 phase; most frames change nothing
+    ring = headless.load_progress_ring().ProgressRing(headless.CanvasStub())
+    ring_frame = [0]
+
+    def next_ring_frame():
+        ring_frame[0] = (ring_frame[0] + 1) % (1500 * 30)
+
+    def show_ring_frame():
+        remaining = 1500 - ring_frame[0] / 30
+        ring.show(remaining / 1500, pymodoro.format_time_value(int(-(-remaining // 1))))
+
+    cases.append(('ProgressRing.show', next_ring_frame, show_ring_frame))
+    return cases
+
+
+def compare(results, baseline, threshold):
+    """Prints current vs baseline medians. Returns the names of regressed cases."""
+    regressions = []
+    print(f'{"case":40} {"baseline":>12} {"current":>12} {"change":>8}')
+    for name, result in results['cases'].items():
+        previous = baseline['cases'].get(name)
+        if previous is None:
+            print(f'{name:40} {"-":>12} {result["median_us"]:10.2f}us {"new":>8}')
+            continue
+        change = result['median_us'] / previous['median_us'] - 1
+        flag = '  REGRESSION' if change > threshold else ''
+        print(f'{name:40} {previous["median_us"]:10.2f}us {result["median_us"]:10.2f}us {change:+8.1%}{flag}')
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=2000)
+    parser.add_argument('--filter', default='', help='only run cases whose name contains this text')
+    parser.add_argument('--output', metavar='PATH', help='write results as JSON to PATH')
+    parser.add_argument('--baseline', metavar='PATH', help='compare against results previously written with --output')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='median slowdown counted as a regression (default 0.25, i.e. 25%%)')
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pymodoro, _ = headless.make_pymodoro(options_file=os.path.join(tmp, 'options.json'),
+                                             history_file=os.path.join(tmp, 'history.sqlite3'),
+                                             resume_file=os.path.join(tmp, 'resume.journal'))
+        import main as app
+        from loguru import logger
+        logger.remove()
+        pymodoro.trace_enabled = False
+        pymodoro.subsystems_ready.wait(5)
+        pymodoro.state_graphics.preload()  # Steady state: the app preloads these after the first paint
+        pymodoro.options.flush()
+
+        results = {'python': platform.python_version(), 'platform': platform.platform(), 'cases': {}}
+        for name, prepare, operation in build_cases(pymodoro, app):
+            if args.filter in name:
+                results['cases'][name] = measure(prepare, operation, args.iterations)
+        pymodoro.options.close()
+        pymodoro.history.close()
+        pymodoro.media_keys.stop()
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f'{len(regressions)} regression(s): {", ".join(regressions)}')
+            return 1
+    else:
+        print(f'{"case":40} {"median":>10} {"p95":>10} {"min":>10}')
+        for name, result in results['cases'].items():
+            print(f'{name:40} {result["median_us"]:8.2f}us {result["p95_us"]:8.2f}us {result["min_us"]:8.2f}us')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""Micro-benchmark: per-tick cost of Pymodoro.continuous_increment.
+
+Runs headless (benchmarks/headless.py). Both rows draw into the same ProgressRing built on
+CanvasStub, which counts item calls, and every item call also waits --write-cost-us to stand
+in for the Tcl round trip a real widget configure costs. The "legacy" row replays the old tick
+body (decrease() + math.floor formatting with eager f-string trace calls and an unconditional
+text write) on every wake-up; the current row is continuous_increment. The timer wakes four
+times per displayed second, so early and late wake-ups around each boundary are included.
+With --write-cost-us 0 the current tick is slower than the legacy body: it also does suspend
+detection, metrics and status publishing, which the legacy replay leaves out.
+
+    python benchmarks/bench_tick.py --ticks 100000 --write-cost-us 20
+"""
+import argparse
+import math
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import headless  # noqa: E402
+
+
+def make_ring(write_cost):
+    """A ProgressRing on CanvasStub whose item calls each take `write_cost` seconds."""
+    base = headless.load_progress_ring().ProgressRing
+
+    class CostlyRing(base):
+        def itemconfig(self, item, **options):
+            end = time.perf_counter() + write_cost
+            while time.perf_counter() < end:
+                pass
+            super().itemconfig(item, **options)
+
+    return CostlyRing(headless.CanvasStub())
+
+
+def legacy_tick(pymodoro, logger, ring):
+    """The tick body before precomputed labels (without the inactivity check it also ran)."""
+    logger.trace('Decrementing timer...')
+    remaining = pymodoro.engine.time_remaining - 1
+    pymodoro.engine.time_remaining = remaining
+    secconds = remaining % 60
+    mininutes = math.floor(remaining / 60)
+    logger.trace(f'Timer value: {mininutes:0>2}:{secconds:0>2}')
+    ring.itemconfig(ring._text, text=f'{f"{mininutes:0>2}:{secconds:0>2}"}')  # timer_lbl['text'] = ...
+    if remaining <= 0:
+        pymodoro.engine.time_remaining = 1500
+    pymodoro.root.after(1000, None)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--ticks', type=int, default=100_000)
+    parser.add_argument('--write-cost-us', type=float, default=20.0,
+                        help='simulated cost of one Tk item call, in microseconds (default: 20)')
+    args = parser.parse_args(argv)
+    write_cost = args.write_cost_us / 1e6
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pymodoro, _ = headless.make_pymodoro(options_file=os.path.join(tmp, 'options.json'),
+                                             history_file=os.path.join(tmp, 'history.sqlite3'),
+                                             resume_file=os.path.join(tmp, 'resume.journal'))
+    from loguru import logger
+    logger.remove()
+    logger.add(lambda message: None, level='INFO')  # Typical: TRACE disabled but a sink installed
+    pymodoro.trace_enabled = False
+    pymodoro.root = type('Root', (), {'after': lambda self, ms, callback: None})()
+
+    # Simulate a running 25:00 phase whose clock advances a quarter second per call, so one in
+    # four ticks changes the displayed second (late/early wake-ups around boundaries). The phase
+    # is restarted before it ends so no transition is timed.
+    clock = [0.0]
+    timer = pymodoro.phase_timer
+    timer.clock = lambda: clock[0]
+    timer.deadline = None
+    timer.paused_remaining = 1500
+    timer.resume()
+
+    ring = pymodoro.timer_ring = make_ring(write_cost)
+    start = time.perf_counter()
+    for _ in range(args.ticks):
+        clock[0] += 0.25
+        if timer.deadline - clock[0] < 1:
+            timer.deadline = clock[0] + 1500
+        pymodoro.continuous_increment()
+    new_cost = (time.perf_counter() - start) / args.ticks
+    new_writes = ring.item_calls / args.ticks
+
+    ring = make_ring(write_cost)
+    pymodoro.engine.time_remaining = 1500
+    start = time.perf_counter()
+    for _ in range(args.ticks):
+        legacy_tick(pymodoro, logger, ring)
+    legacy_cost = (time.perf_counter() - start) / args.ticks
+    legacy_writes = ring.item_calls / args.ticks
+
+    print(f'{args.ticks} ticks, {args.write_cost_us:g} us per Tk item call:')
+    print(f'  legacy  {legacy_cost * 1e6:6.2f} us/tick, Tk item calls per tick {legacy_writes:.2f}')
+    print(f'  current {new_cost * 1e6:6.2f} us/tick, Tk item calls per tick {new_writes:.2f}')
+    print(f'  change:  {new_writes / legacy_writes - 1:+.0%} Tk item calls, {new_cost / legacy_cost - 1:+.0%} time per tick')
+
+
+if __name__ == '__main__':
+    main()
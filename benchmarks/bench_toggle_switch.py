@@ -0,0 +1,60 @@
+"""Benchmark: canvas item churn and redraw time per ToggleSwitch toggle.
+
+Runs headless against benchmarks/headless.py. ToggleSwitch is built on CanvasStub, which counts
+item creations and item calls (coords/itemconfig/delete). The animation runs on a fake clock
+that moves one frame interval per frame, so every toggle draws the full slide.
+
+    python benchmarks/bench_toggle_switch.py --toggles 500
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import headless  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--toggles', type=int, default=500)
+    parser.add_argument('--writes-per-toggle', type=int, default=1,
+                        help='variable writes per event-loop turn, to show commands being coalesced')
+    args = parser.parse_args(argv)
+
+    toggle_switch = headless.load_toggle_switch()
+    variable = headless.BooleanVarStub(False)
+    commands = [0]
+    clock = [0.0]
+    switch = toggle_switch.ToggleSwitch(headless.CanvasStub(), variable,
+                                        command=lambda: commands.__setitem__(0, commands[0] + 1))
+    switch.clock = lambda: clock[0]
+    built = switch.created
+
+    item_calls = switch.item_calls
+    frames = 0
+    redraw_time = 0.0
+    start = time.perf_counter()
+    for _ in range(args.toggles):
+        variable.set(not variable.get())
+        for _ in range(args.writes_per_toggle - 1):
+            variable.set(variable.get())  # Repeated writes in the same turn
+        while switch.pending:
+            redraw_start = time.perf_counter()
+            frames += switch.run_pending()
+            redraw_time += time.perf_counter() - redraw_start
+            clock[0] += switch.frame_ms / 1000
+    elapsed = time.perf_counter() - start
+
+    print(f'Canvas items created at construction: {built}')
+    print(f'Toggles: {args.toggles}')
+    print(f'  items created per toggle: {(switch.created - built) / args.toggles:.1f}')
+    print(f'  item calls per toggle: {(switch.item_calls - item_calls) / args.toggles:.1f}')
+    print(f'  callbacks per toggle (frames + command): {frames / args.toggles:.1f}')
+    print(f'  commands per toggle: {commands[0] / args.toggles:.2f}')
+    print(f'  time per toggle: {elapsed / args.toggles * 1e6:.1f}us ({redraw_time / args.toggles * 1e6:.1f}us in callbacks)')
+
+
+if __name__ == '__main__':
+    main()
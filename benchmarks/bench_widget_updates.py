@@ -0,0 +1,47 @@
+"""Benchmark: Tk widget creations and wall time per go/reset cycle.
+
+Runs headless against the mocked tkinter from benchmarks/headless.py, so the time measures the
+Python side of each transition; widget creations are counted on the mocked constructors.
+
+    python benchmarks/bench_widget_updates.py --cycles 200
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import headless  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--cycles', type=int, default=200)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pymodoro, mock_tkinter = headless.make_pymodoro(options_file=os.path.join(tmp, 'options.json'),
+                                                        history_file=os.path.join(tmp, 'history.sqlite3'),
+                                                        resume_file=os.path.join(tmp, 'resume.journal'))
+        from loguru import logger
+        logger.remove()
+        pymodoro.play_pause_media = lambda: None
+
+        built = headless.widget_creations(mock_tkinter)
+        start = time.perf_counter()
+        for _ in range(args.cycles):
+            pymodoro.go()
+            pymodoro.reset()
+        elapsed = time.perf_counter() - start
+        created = headless.widget_creations(mock_tkinter) - built
+
+    print(f'Initial window build: {built} widgets')
+    print(f'go/reset cycles: {args.cycles}')
+    print(f'  widget creations per cycle: {created / args.cycles:.1f}')
+    print(f'  time per cycle: {elapsed / args.cycles * 1e6:.1f} us')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,211 @@
+"""Mock scaffolding for running Pymodoro headless, mirroring the module mocks in test_main.py.
+
+Call install() before importing main. tkinter, pyautogui and pygame are replaced by MagicMocks;
+tkinter widget constructors are counted so benchmarks can report widget creations. There is no
+X server involved, so these benchmarks time the Python side of each operation, not Tk's drawing.
+"""
+import atexit
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+from unittest.mock import MagicMock, PropertyMock
+
+repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if repo_dir not in sys.path:
+    sys.path.insert(0, repo_dir)
+
+WIDGET_CLASSES = ('Frame', 'Label', 'Button', 'Canvas', 'Toplevel')
+
+
+def _boolean_var(*args, **kwargs):
+    instance = MagicMock(name='MockBooleanVar')
+    value = [kwargs.get('value', False)]
+    instance.get.side_effect = lambda: value[0]
+    instance.set.side_effect = lambda new_value: value.__setitem__(0, bool(new_value))
+    return instance
+
+
+def install():
+    """Installs the mock modules and returns the mocked tkinter module."""
+    if isinstance(sys.modules.get('tkinter'), MagicMock):
+        return sys.modules['tkinter']
+    mock_tkinter = MagicMock(name='tkinter')
+    type(mock_tkinter).TkVersion = PropertyMock(return_value=8.6)
+    mock_tkinter.BooleanVar = MagicMock(side_effect=_boolean_var)
+    mock_tkinter.TclError = type('TclError', (Exception,), {})
+    sys.modules['tkinter'] = mock_tkinter
+    sys.modules['tkinter.messagebox'] = mock_tkinter.messagebox
+
+    sys.modules['pyautogui'] = MagicMock(name='pyautogui')
+
+    mock_pygame = MagicMock(name='pygame')
+    mock_pygame.error = type('PygameError', (Exception,), {})
+    sys.modules['pygame'] = mock_pygame
+    return mock_tkinter
+
+
+def widget_creations(mock_tkinter):
+    """Total number of widgets constructed through the mocked tkinter so far."""
+    return sum(getattr(mock_tkinter, name).call_count for name in WIDGET_CLASSES)
+
+
+class CanvasStub:
+    """Stand-in base class for tk.Canvas subclasses such as ToggleSwitch.
+
+    A MagicMock can't be subclassed usefully, so this implements the item calls the widgets use
+    and counts how many canvas items get created. after() callbacks are queued until run_pending().
+    """
+
+    def __init__(self, master=None, **kwargs):
+        self.master = master
+        self.options = dict(kwargs)
+        self.items = {}
+        self.created = 0
+        self.item_calls = 0
+        self.pending = {}  # after() callbacks, run by run_pending()
+        self.scheduled = 0
+
+    def _create(self, kind, coords, options):
+        self.created += 1
+        self.items[self.created] = [kind, coords, options]
+        return self.created
+
+    def create_oval(self, *coords, **options):
+        return self._create('oval', coords, options)
+
+    def create_rectangle(self, *coords, **options):
+        return self._create('rectangle', coords, options)
+
+    def create_arc(self, *coords, **options):
+        return self._create('arc', coords, options)
+
+    def create_text(self, *coords, **options):
+        return self._create('text', coords, options)
+
+    def delete(self, *items):
+        self.item_calls += 1
+        if 'all' in items:
+            self.items.clear()
+        for item in items:
+            self.items.pop(item, None)
+
+    def coords(self, item, *coords):
+        self.item_calls += 1
+        if coords:
+            self.items[item][1] = coords
+        return self.items[item][1]
+
+    def itemconfig(self, item, **options):
+        self.item_calls += 1
+        self.items[item][2].update(options)
+
+    def cget(self, option):
+        return self.options.get(option, '')
+
+    def configure(self, **kwargs):
+        self.options.update(kwargs)
+
+    config = configure
+
+    def bind(self, *args, **kwargs):
+        pass
+
+    def after(self, ms, callback=None, *args):
+        self.scheduled += 1
+        self.pending[self.scheduled] = (callback, args)
+        return self.scheduled
+
+    def after_idle(self, callback, *args):
+        return self.after('idle', callback, *args)
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def run_pending(self):
+        """Runs the callbacks scheduled so far, like one pass of the event loop. Returns how many ran."""
+        pending, self.pending = self.pending, {}
+        for callback, args in pending.values():
+            callback(*args)
+        return len(pending)
+
+    def destroy(self):
+        self.pending.clear()
+
+
+class BooleanVarStub:
+    """A BooleanVar whose "write" traces fire, unlike the mocked tkinter's."""
+
+    def __init__(self, value=False):
+        self.value = bool(value)
+        self.traces = {}
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = bool(value)
+        for callback in list(self.traces.values()):
+            callback('', '', 'write')
+
+    def trace_add(self, mode, callback):
+        trace_id = f'trace{len(self.traces)}'
+        self.traces[trace_id] = callback
+        return trace_id
+
+    def trace_remove(self, mode, trace_id):
+        del self.traces[trace_id]
+
+
+def load_canvas_module(name):
+    """Imports module `name` with its tk.Canvas subclasses built on CanvasStub instead of the mocked tk.Canvas.
+
+    The module is imported afresh and left out of sys.modules, so main keeps the mocked widgets.
+    """
+    mock_tkinter = install()
+    canvas = mock_tkinter.Canvas
+    mock_tkinter.Canvas = CanvasStub
+    previous = sys.modules.pop(name, None)
+    try:
+        return importlib.import_module(name)
+    finally:
+        mock_tkinter.Canvas = canvas
+        if previous is not None:
+            sys.modules[name] = previous
+        else:
+            sys.modules.pop(name, None)
+
+
+def load_toggle_switch():
+    return load_canvas_module('toggle_switch')
+
+
+def load_progress_ring():
+    return load_canvas_module('progress_ring')
+
+
+def make_pymodoro(options_file=None, history_file=None, resume_file=None):
+    """Builds a Pymodoro against the mocks without entering the mainloop.
+
+    Any file not given goes in a temp directory removed at exit, so a benchmark never touches
+    the real options, history or resume journal.
+    """
+    mock_tkinter = install()
+    import main
+    if None in (options_file, history_file, resume_file):
+        tmp = tempfile.mkdtemp(prefix='pymodoro-bench-')
+        atexit.register(shutil.rmtree, tmp, ignore_errors=True)
+        options_file = options_file or os.path.join(tmp, 'options.json')
+        history_file = history_file or os.path.join(tmp, 'history.sqlite3')
+        resume_file = resume_file or os.path.join(tmp, 'resume.journal')
+    main.OPTIONS_FILE = options_file
+    main.HISTORY_FILE = history_file
+    main.RESUME_FILE = resume_file
+    original_start = main.Pymodoro.start
+    main.Pymodoro.start = lambda self: None
+    try:
+        pymodoro = main.Pymodoro()
+    finally:
+        main.Pymodoro.start = original_start
+    return pymodoro, mock_tkinter
@@ -0,0 +1,178 @@
+"""Single-instance guard and local control socket for a running Pymodoro.
+
+The first instance binds the control socket, which doubles as the instance lock; later launches
+find it taken and hand over to the running instance instead. The client side imports only the
+standard library (no tkinter, pygame or PIL), so scripted commands return in milliseconds:
+
+    python main.py ctl skip
+    python control.py status
+
+The socket is a Unix-domain socket in $XDG_RUNTIME_DIR (or the temp dir), readable only by its
+owner. Where AF_UNIX isn't available (Windows) it falls back to a TCP socket on 127.0.0.1.
+"""
+import argparse
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+
+COMMANDS = ('go', 'skip', 'reset', 'pause', 'status', 'show')
+DEFAULT_TCP_PORT = 47213
+TIMEOUT = 2.0  # Seconds a command may take, including the hop onto the Tk thread
+
+
+class AlreadyRunning(Exception):
+    pass
+
+
+def control_address():
+    """Returns (socket family, address), honouring PYMODORO_SOCKET / PYMODORO_CONTROL_PORT."""
+    if hasattr(socket, 'AF_UNIX'):
+        path = os.environ.get('PYMODORO_SOCKET')
+        if not path:
+            runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+            uid = os.getuid() if hasattr(os, 'getuid') else 0
+            path = os.path.join(runtime_dir, f'pymodoro-{uid}.sock')
+        return socket.AF_UNIX, path
+    return socket.AF_INET, ('127.0.0.1', int(os.environ.get('PYMODORO_CONTROL_PORT', DEFAULT_TCP_PORT)))
+
+
+def send_command(command, address=None, timeout=TIMEOUT):
+    """Sends one command to the running instance and returns its decoded JSON reply.
+
+    Raises OSError (FileNotFoundError/ConnectionRefusedError when nothing is running).
+    """
+    family, address = address or control_address()
+    with socket.socket(family, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout + 1)
+        sock.connect(address)
+        sock.sendall(command.encode() + b'\n')
+        with sock.makefile('r') as reply:
+            line = reply.readline()
+    if not line:
+        raise ConnectionError('no reply from the running instance')
+    return json.loads(line)
+
+
+class ControlServer:
+    """Listens on the control socket and answers one command per connection.
+
+    `handler(command)` is called on the server thread and must return a JSON-serializable dict;
+    the app's handler is responsible for hopping onto the Tk thread.
+    """
+
+    def __init__(self, sock, family, address):
+        self.sock = sock
+        self.family = family
+        self.address = address
+        self.handler = None
+        self._thread = None
+
+    @classmethod
+    def bind(cls, address=None):
+        """Takes the control socket, or raises AlreadyRunning if another instance holds it."""
+        family, address = address or control_address()
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        try:
+            try:
+                sock.bind(address)
+            except OSError:
+                if family != socket.AF_UNIX or _answers(family, address):
+                    raise AlreadyRunning(f'Pymodoro is already running ({address})')
+                os.unlink(address)  # Left behind by an instance that crashed
+                sock.bind(address)
+            if family == socket.AF_UNIX:
+                os.chmod(address, 0o600)
+            sock.listen(8)
+        except BaseException:
+            sock.close()
+            raise
+        return cls(sock, family, address)
+
+    def start(self, handler):
+        self.handler = handler
+        self._thread = threading.Thread(target=self._serve, name='control-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self):
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)  # Wakes the blocked accept()
+        except OSError:
+            pass
+        self.sock.close()
+        if self._thread is not None:
+            self._thread.join(TIMEOUT)
+        if self.family == socket.AF_UNIX:
+            try:
+                os.unlink(self.address)
+            except OSError:
+                pass
+
+    def _serve(self):
+        while True:
+            try:
+                connection, _ = self.sock.accept()
+            except OSError:
+                return  # Closed
+            with connection:
+                try:
+                    connection.settimeout(TIMEOUT)
+                    with connection.makefile('r') as request:
+                        command = request.readline().strip()
+                    reply = self._handle(command)
+                    connection.sendall(json.dumps(reply).encode() + b'\n')
+                except OSError:
+                    pass  # Client went away
+
+    def _handle(self, command):
+        if command not in COMMANDS:
+            return {'ok': False, 'error': f'unknown command {command!r}'}
+        try:
+            return self.handler(command)
+        except Exception as e:
+            return {'ok': False, 'error': str(e)}
+
+
+def _answers(family, address):
+    try:
+        with socket.socket(family, socket.SOCK_STREAM) as probe:
+            probe.settimeout(TIMEOUT)
+            probe.connect(address)
+        return True
+    except OSError:
+        return False
+
+
+def format_status(status):
+    minutes, seconds = divmod(status['time_remaining'], 60)
+    paused = '' if status['timer_active'] or status['state'] == 'Ready' else ' (paused)'
+    return f"{status['state']}{paused} {minutes:02}:{seconds:02}, {status['rests']} rests"
+
+
+def run_client(argv=None):
+    parser = argparse.ArgumentParser(prog='pymodoro ctl', description='Control the running Pymodoro')
+    parser.add_argument('command', choices=COMMANDS,
+                        help='go: start from Ready; skip: end the current phase; reset: back to Ready; '
+                             'pause: pause or resume; status: print the current phase; show: raise the window')
+    args = parser.parse_args(argv)
+    try:
+        reply = send_command(args.command)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print('Pymodoro is not running', file=sys.stderr)
+        return 1
+    except (OSError, ValueError) as e:
+        print(f'Could not reach Pymodoro: {e}', file=sys.stderr)
+        return 1
+    if 'status' in reply:
+        print(format_status(reply['status']))
+    if not reply.get('ok'):
+        print(f"Error: {reply.get('error')}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(run_client())
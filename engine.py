@@ -0,0 +1,172 @@
+"""Headless Pomodoro state machine. Imports nothing from tkinter, pygame or pyautogui."""
+from enum import Enum
+from typing import NamedTuple, Optional
+
+
+class State(Enum):
+    Ready = 0
+    Working = 1
+    Rest = 2
+    LongRest = 3
+
+
+timer_dict = {'Ready': 25*60,
+            'Working': 25*60,
+             'Rest': 5*60,
+             'LongRest': 15*60}
+
+SHORT_RESTS_PER_CYCLE = 3  # Working -> Rest this many times before Working -> LongRest
+
+
+class Transition(NamedTuple):
+    previous: State
+    state: State
+    rests: int
+    prompt: Optional[str]  # Voice prompt to play for this transition, if any
+
+
+def next_phase(state, rests):
+    """Returns (next state, next rests, voice prompt) for a transition out of `state`."""
+    if state == State.Ready:
+        return State.Working, rests, None
+    if state == State.Working:
+        if rests < SHORT_RESTS_PER_CYCLE:
+            return State.Rest, rests + 1, "lets_take_a_quick_break"
+        return State.LongRest, 0, "lets_take_a_longer_break"
+    return State.Working, rests, "lets_get_back_to_work"
+
+
+def cycle_length(durations=timer_dict):
+    """Seconds in one full Working/Rest x3, Working/LongRest cycle."""
+    return ((SHORT_RESTS_PER_CYCLE + 1) * durations['Working'] + SHORT_RESTS_PER_CYCLE * durations['Rest']
+            + durations['LongRest'])
+
+
+class PomodoroEngine:
+    """One Pomodoro timer: state, completed short rests and the countdown, advanced in seconds."""
+
+    def __init__(self, durations=None):
+        self.durations = dict(durations or timer_dict)
+        self.listeners = []  # Called with each Transition
+        self.reset()
+
+    def reset(self):
+        self.state = State.Ready
+        self.rests = 0
+        self.time_remaining = self.durations[self.state.name]
+        self.timer_active = False
+
+    def transition(self):
+        """Moves to the next phase and restarts the countdown. Returns the Transition."""
+        previous = self.state
+        self.state, self.rests, prompt = next_phase(self.state, self.rests)
+        self.time_remaining = self.durations[self.state.name]
+        if previous == State.Ready:
+            self.timer_active = True
+        event = Transition(previous, self.state, self.rests, prompt)
+        for listener in self.listeners:
+            listener(event)
+        return event
+
+    def skip(self):
+        return self.transition()
+
+    def pause(self):
+        self.timer_active = False
+
+    def resume(self):
+        self.timer_active = True
+
+    def tick(self):
+        """Advances one second. Returns the list of transitions that fired."""
+        return self.advance(1)
+
+    def advance(self, seconds):
+        """Advances the countdown by `seconds`, firing every transition crossed on the way.
+
+        Overflow carries into the next phase, so the cost is O(phases crossed), not O(seconds).
+        """
+        events = []
+        if not self.timer_active:
+            return events
+        self.time_remaining -= seconds
+        while self.time_remaining <= 0:
+            overflow = -self.time_remaining
+            events.append(self.transition())
+            self.time_remaining -= overflow
+        return events
+
+
+class EngineFleet:
+    """Many independent engines stored column-wise and advanced together.
+
+    advance() skips whole cycles arithmetically, so advancing every engine by days of schedule
+    costs a handful of phase steps per engine rather than one step per second.
+    """
+
+    def __init__(self, count, durations=None):
+        self.durations = dict(durations or timer_dict)
+        self._phase_seconds = [self.durations[state.name] for state in State]
+        self._cycle = cycle_length(self.durations)
+        self.states = [State.Ready.value] * count
+        self.rests = [0] * count
+        self.remaining = [self.durations['Ready']] * count
+        self.active = [False] * count
+
+    def __len__(self):
+        return len(self.states)
+
+    @classmethod
+    def from_engines(cls, engines, durations=None):
+        fleet = cls(len(engines), durations)
+        for i, engine in enumerate(engines):
+            fleet.states[i] = engine.state.value
+            fleet.rests[i] = engine.rests
+            fleet.remaining[i] = engine.time_remaining
+            fleet.active[i] = engine.timer_active
+        return fleet
+
+    def engine(self, index):
+        """Returns a standalone PomodoroEngine with the state of engine `index`."""
+        engine = PomodoroEngine(self.durations)
+        engine.state = State(self.states[index])
+        engine.rests = self.rests[index]
+        engine.time_remaining = self.remaining[index]
+        engine.timer_active = self.active[index]
+        return engine
+
+    def start_all(self):
+        """Transitions every Ready engine to Working, as pressing Go! would."""
+        for i, state in enumerate(self.states):
+            if state == State.Ready.value:
+                self.states[i] = State.Working.value
+                self.remaining[i] = self._phase_seconds[State.Working.value]
+                self.active[i] = True
+
+    def advance(self, seconds):
+        """Advances every active engine by `seconds`. Returns the number of transitions per engine."""
+        phase_seconds = self._phase_seconds
+        cycle = self._cycle
+        states, rests, remaining, active = self.states, self.rests, self.remaining, self.active
+        working = State.Working.value
+        transitions = [0] * len(states)
+        for i in range(len(states)):
+            if not active[i]:
+                continue
+            left = seconds
+            state, rest_count, remain = states[i], rests[i], remaining[i]
+            count = 0
+            while left >= remain:
+                left -= remain
+                next_state, rest_count, _ = next_phase(State(state), rest_count)
+                state = next_state.value
+                remain = phase_seconds[state]
+                count += 1
+                if state == working and rest_count == 0 and left >= cycle:
+                    # At the start of a cycle: skip whole cycles without stepping through them
+                    whole = int(left // cycle)
+                    left -= whole * cycle
+                    count += whole * 2 * (SHORT_RESTS_PER_CYCLE + 1)
+            states[i], rests[i], remaining[i] = state, rest_count, remain - left
+            transitions[i] = count
+        return transitions
@@ -0,0 +1,142 @@
+"""Append-only session history, stored in SQLite (WAL mode) and written off the Tk thread."""
+import datetime
+import queue
+import sqlite3
+import threading
+import time
+from enum import IntEnum
+
+from loguru import logger
+
+from engine import State
+
+
+class EventKind(IntEnum):
+    Transition = 0  # Phase ended by the timer (or Go!)
+    Skip = 1
+    Reset = 2
+    Pause = 3
+    Resume = 4
+    CatchUp = 5  # Phase boundary passed while suspended; elapsed only counts time awake
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,           -- Unix time of the event
+    day INTEGER NOT NULL,       -- Local date as a proleptic Gregorian ordinal
+    kind INTEGER NOT NULL,      -- EventKind
+    from_state INTEGER NOT NULL,
+    to_state INTEGER NOT NULL,
+    rests INTEGER NOT NULL,     -- Completed short rests after the event
+    elapsed REAL NOT NULL       -- Seconds spent in from_state's phase (0 for pause/resume)
+);
+CREATE INDEX IF NOT EXISTS events_day ON events (day);
+CREATE INDEX IF NOT EXISTS events_state_day ON events (from_state, day);
+"""
+
+# The one definition of a completed Working phase, shared by HistoryStore's queries and analytics.py:
+# the timer ended it, or part of it ran before a suspend that caught up past its end. Phases that
+# passed whole during a suspend are CatchUp rows with elapsed 0 and don't count.
+COMPLETED_WORK_SQL = (f'(from_state = {State.Working.value} AND (kind = {int(EventKind.Transition)} '
+                      f'OR (kind = {int(EventKind.CatchUp)} AND elapsed > 0)))')
+
+
+def day_of(ts):
+    return datetime.date.fromtimestamp(ts).toordinal()
+
+
+class HistoryStore:
+    """Queues events from the Tk thread and writes them in batches on a background thread.
+
+    Queries open their own connection, so they can run from any thread while writes continue.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='history-writer', daemon=True)
+        self._thread.start()
+
+    def record(self, kind, from_state, to_state, rests, elapsed=0.0, ts=None):
+        """Queues an event and returns immediately."""
+        ts = time.time() if ts is None else ts
+        self._queue.put((ts, day_of(ts), int(kind), from_state.value, to_state.value, rests, float(elapsed)))
+
+    def flush(self):
+        """Blocks until every queued event has been written."""
+        self._queue.join()
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')  # Safe with WAL; only the last batch can be lost on power loss
+        connection.executescript(SCHEMA)
+        return connection
+
+    def _run(self):
+        connection = None
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            rows = [row for row in batch if row is not None]
+            try:
+                if rows:
+                    if connection is None:
+                        connection = self._connect()
+                    with connection:
+                        connection.executemany('INSERT INTO events (ts, day, kind, from_state, to_state, rests, elapsed) '
+                                               'VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+            except sqlite3.Error as e:
+                logger.error("Failed to write {} history events to {}: {}", len(rows), self.path, e)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if len(rows) != len(batch):
+                if connection is not None:
+                    connection.close()
+                return
+
+    def _query(self, sql, params=()):
+        try:
+            connection = sqlite3.connect(f'file:{self.path}?mode=ro', uri=True)
+        except sqlite3.OperationalError:
+            return []  # Nothing recorded yet
+        try:
+            return connection.execute(sql, params).fetchall()
+        finally:
+            connection.close()
+
+    def focus_minutes(self, start_day, end_day):
+        """Minutes spent in Working phases between two date ordinals, inclusive."""
+        rows = self._query('SELECT TOTAL(elapsed) FROM events WHERE from_state = ? AND day BETWEEN ? AND ?',
+                           (State.Working.value, start_day, end_day))
+        return rows[0][0] / 60 if rows else 0.0
+
+    def focus_minutes_this_week(self, today=None):
+        today = today or datetime.date.today()
+        monday = today - datetime.timedelta(days=today.weekday())
+        return self.focus_minutes(monday.toordinal(), today.toordinal())
+
+    def completed_work_days(self):
+        """Sorted date ordinals on which at least one Working phase ran to completion."""
+        rows = self._query(f'SELECT DISTINCT day FROM events WHERE {COMPLETED_WORK_SQL} ORDER BY day')
+        return [row[0] for row in rows]
+
+    def longest_streak(self):
+        """Longest run of consecutive days with at least one completed Working phase."""
+        longest = current = 0
+        previous = None
+        for day in self.completed_work_days():
+            current = current + 1 if previous is not None and day == previous + 1 else 1
+            longest = max(longest, current)
+            previous = day
+        return longest
@@ -0,0 +1,47 @@
+import tkinter as tk
+
+
+class InactivityPrompt:
+    """Non-modal "Are you still listening?" window.
+
+    Unlike messagebox.askyesno it doesn't block the mainloop, so the countdown keeps running
+    while it is shown. `on_answer(still_there)` is called exactly once: with True for "Yes" or
+    closing the window, with False for "No" or when nobody answers within `timeout_ms`. The colours
+    and font come from the caller, so the prompt matches the main window.
+    """
+
+    def __init__(self, root, on_answer, timeout_ms, bg, button_bg, button_font):
+        self.root = root
+        self.on_answer = on_answer
+        self.answered = False
+
+        self.window = tk.Toplevel(root)
+        self.window.title("Still there?")
+        self.window.configure(bg=bg)
+        self.window.transient(root)
+        self.window.protocol("WM_DELETE_WINDOW", lambda: self.answer(True))
+
+        message = tk.Label(self.window, text="Are you still listening?", bg=bg, fg='white', font=("Arial", 16))
+        message.pack(padx=20, pady=(20, 10))
+        buttons = tk.Frame(self.window, bg=bg)
+        buttons.pack(pady=(0, 20))
+        yes_button = tk.Button(buttons, text='Yes', width='8', command=lambda: self.answer(True), bg=button_bg, font=button_font)
+        yes_button.pack(side='left', padx='5')
+        no_button = tk.Button(buttons, text='No', width='8', command=lambda: self.answer(False), bg=button_bg, font=button_font)
+        no_button.pack(side='left', padx='5')
+
+        self.window.lift()
+        self._timeout_id = root.after(timeout_ms, self.expire)
+
+    def expire(self):
+        self._timeout_id = None
+        self.answer(False)
+
+    def answer(self, still_there):
+        if self.answered:
+            return
+        self.answered = True
+        if self._timeout_id is not None:
+            self.root.after_cancel(self._timeout_id)
+        self.window.destroy()
+        self.on_answer(still_there)
@@ -0,0 +1,110 @@
+import datetime
+import time
+
+DEFAULT_THRESHOLD_MINUTES = 60
+DEFAULT_QUIET_HOURS = [[7, 16]]  # [start, end) local hours in which nobody is asked
+
+
+def in_quiet_hours(hour, quiet_hours):
+    """True if `hour` falls in any [start, end) window; windows may wrap midnight, e.g. [22, 6]."""
+    for start, end in quiet_hours:
+        if start <= end:
+            if start <= hour < end:
+                return True
+        elif hour >= start or hour < end:
+            return True
+    return False
+
+
+def next_prompt_time(last_interaction, threshold, quiet_hours):
+    """Unix time at which to ask, `threshold` seconds after the last interaction but outside
+    quiet hours. None if every hour is quiet."""
+    moment = datetime.datetime.fromtimestamp(last_interaction + threshold)
+    for _ in range(len(quiet_hours) + 1):
+        if not in_quiet_hours(moment.hour, quiet_hours):
+            return moment.timestamp()
+        # Jump to the end of the window we are in; chained windows take another pass
+        for start, end in quiet_hours:
+            if in_quiet_hours(moment.hour, [(start, end)]):
+                window_end = moment.replace(hour=end % 24, minute=0, second=0, microsecond=0)
+                if window_end <= moment:
+                    window_end += datetime.timedelta(days=1)
+                moment = window_end
+                break
+    return None
+
+
+def validate_quiet_hours(quiet_hours):
+    """Returns quiet_hours as a list of [start, end] hour pairs, or raises ValueError."""
+    windows = []
+    for window in quiet_hours:
+        start, end = window
+        if not all(isinstance(hour, int) and 0 <= hour <= 24 for hour in (start, end)):
+            raise ValueError(f"quiet hours must be whole hours from 0 to 24, got {window}")
+        windows.append([start, end])
+    return windows
+
+
+class InactivityWatchdog:
+    """Asks "are you still there?" from a single root.after deadline instead of checking every tick.
+
+    touch() only records the time of an interaction, so <Key>/<Button> handlers stay cheap; the
+    pending deadline is not moved. When it fires, check() re-arms for the later deadline if
+    there was an interaction in the meantime (or the deadline is in quiet hours), and only calls
+    `on_due` when nobody has interacted for `threshold` seconds outside quiet hours.
+    """
+
+    def __init__(self, root, on_due, threshold=DEFAULT_THRESHOLD_MINUTES * 60, quiet_hours=DEFAULT_QUIET_HOURS,
+                 clock=time.time):
+        self.root = root
+        self.on_due = on_due
+        self.threshold = threshold
+        self.quiet_hours = quiet_hours
+        self.clock = clock
+        self.last_interaction = clock()
+        self.active = False
+        self._after_id = None
+
+    def touch(self):
+        self.last_interaction = self.clock()
+
+    def configure(self, threshold, quiet_hours):
+        self.threshold = threshold
+        self.quiet_hours = quiet_hours
+        if self.active:
+            self._cancel()
+            self._arm()
+
+    def set_active(self, active):
+        """Arms the deadline when watching starts and cancels it when watching stops."""
+        self.active = active
+        if not active:
+            self._cancel()
+        elif self._after_id is None:
+            self._arm()
+
+    def check(self):
+        self._after_id = None
+        if not self.active:
+            return
+        due = next_prompt_time(self.last_interaction, self.threshold, self.quiet_hours)
+        if due is None:
+            return
+        if self.clock() < due:
+            self._schedule(due)
+        else:
+            self.on_due()  # The caller re-arms with set_active() once the prompt is answered
+
+    def _arm(self):
+        due = next_prompt_time(self.last_interaction, self.threshold, self.quiet_hours)
+        if due is not None:
+            self._schedule(due)
+
+    def _schedule(self, due):
+        delay_ms = max(0, int((due - self.clock()) * 1000) + 1)
+        self._after_id = self.root.after(delay_ms, self.check)
+
+    def _cancel(self):
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
@@ -0,0 +1,88 @@
+"""Log sinks for the app: stderr at the chosen level, plus an optional rotating JSON-lines file.
+
+Both sinks are enqueued, so the Tk thread only formats a record and hands it to a queue; a
+loguru worker thread does the writing. Every record carries the timer's state, rests and
+time_remaining (from the provider passed to set_context) in its `extra` fields, which the
+file sink writes as JSON keys. Log calls should pass their values as arguments,
+`logger.debug('Playing {}', name)`, so that nothing is formatted for a disabled level.
+"""
+import json
+import sys
+
+from loguru import logger
+
+LOG_LEVELS = ('TRACE', 'DEBUG', 'INFO', 'SUCCESS', 'WARNING', 'ERROR', 'CRITICAL')
+DEFAULT_LOG_LEVEL = 'INFO'
+LOG_ROTATION = '5 MB'
+LOG_RETENTION = 5  # Rotated files kept
+
+_context = None  # Callable returning the fields to attach to every record
+_level = None  # Level passed to configure_logger; None means loguru's default stderr sink (DEBUG)
+
+
+def validate_log_level(level):
+    """Returns `level` as a loguru level name, case-insensitively. Raises ValueError for anything else."""
+    if not isinstance(level, str) or level.upper() not in LOG_LEVELS:
+        raise ValueError(f"log level must be one of {', '.join(LOG_LEVELS)}, got {level!r}")
+    return level.upper()
+
+
+def log_level_from_options(path):
+    """The "log_level" in the options file, or DEFAULT_LOG_LEVEL if it is missing or invalid.
+
+    Read before the app starts so that startup itself is logged at the configured level.
+    """
+    try:
+        with open(path) as f:
+            return validate_log_level(json.load(f).get('log_level', DEFAULT_LOG_LEVEL))
+    except (OSError, ValueError, AttributeError):
+        return DEFAULT_LOG_LEVEL
+
+
+def set_context(provider):
+    """Attaches `provider()`'s fields to every record logged from now on (None to stop)."""
+    global _context
+    _context = provider
+
+
+def _add_context(record):
+    # Runs in the calling thread, only for records that pass the level check, before they are enqueued
+    if _context is not None:
+        try:
+            record['extra'].update(_context())
+        except Exception:
+            pass  # A half-built app must not stop logging
+
+
+def _json_line(record):
+    fields = {'time': record['time'].isoformat(), 'level': record['level'].name, 'message': record['message'],
+              'module': record['name'], 'function': record['function'], 'line': record['line']}
+    fields.update(record['extra'])
+    if record['exception'] is not None:
+        fields['exception'] = repr(record['exception'].value)
+    record['extra']['_json'] = json.dumps(fields, default=str)
+    return '{extra[_json]}\n'
+
+
+def configure_logger(log_level=DEFAULT_LOG_LEVEL, log_file=None):
+    """Replaces loguru's sinks with an enqueued stderr sink and, if `log_file` is set, a rotating JSON-lines file."""
+    global _level
+    level = validate_log_level(log_level)
+    logger.remove()
+    logger.configure(patcher=_add_context)
+    logger.add(sys.stderr, level=level, enqueue=True)
+    if log_file:
+        logger.add(log_file, level=level, format=_json_line, enqueue=True, rotation=LOG_ROTATION,
+                   retention=LOG_RETENTION, encoding='utf-8')
+    _level = level
+    return level
+
+
+def level_enabled(level):
+    """True if records at `level` reach a sink. Meant to be checked once, not on every tick."""
+    return logger.level(level).no >= logger.level(_level or 'DEBUG').no
+
+
+def flush_logs():
+    """Waits until every enqueued record has been written."""
+    logger.complete()
@@ -1,38 +1,51 @@
+import sys
+if __name__ == '__main__' and sys.argv[1:2] == ['ctl']:
+    # `main.py ctl <command>` talks to the running instance without importing tkinter, pygame or PIL
+    from control import run_client
+    sys.exit(run_client(sys.argv[2:]))
+
+from startup_profile import PROCESS_START, StartupProfiler  # First, so the import phase is timed
 import tkinter as tk
-from tkinter import messagebox
 import time
-import pyautogui
 from loguru import logger
-import math
-from enum import Enum
-import PIL.Image
-import PIL.ImageTk
-import sys
 import os
-from datetime import datetime
-import pygame # Added for pygame mixer
+import argparse
+import threading
 import json # Added for options persistence
+import math
+from engine import PomodoroEngine, State, timer_dict
+from phase_timer import PhaseTimer, SuspendDetector
+from progress_ring import ProgressRing
+from state_graphics import StateGraphicCache, graphic_key
+from sound_bank import SoundBank
+from media_keys import MediaKeyWorker
+from inactivity_prompt import InactivityPrompt
+from inactivity_watchdog import (DEFAULT_QUIET_HOURS, DEFAULT_THRESHOLD_MINUTES, InactivityWatchdog,
+                                 validate_quiet_hours)
+from history import EventKind, HistoryStore
+from options_store import OptionsStore
+from resume_journal import ResumeJournal
+from control import TIMEOUT as CONTROL_TIMEOUT, AlreadyRunning, ControlServer, send_command
+from metrics import TICK_LATENESS, METRICS, MetricsServer, timed
+from status_server import StatusServer
+from status_file import StatusFileWriter, default_path as default_status_file
+from tracing import TRACER, traced
+from logging_config import (DEFAULT_LOG_LEVEL, LOG_LEVELS, configure_logger, flush_logs, level_enabled,
+                            log_level_from_options, set_context as set_log_context, validate_log_level)
+# pygame, pyautogui and PIL are imported lazily: together they take longer to import than the
+# window takes to build, so they are brought up in the background after the window exists.
+
+imports_done = time.perf_counter()
 
 script_dir = os.path.dirname(os.path.abspath(__file__))
 OPTIONS_FILE = os.path.join(script_dir, 'options.json')
+HISTORY_FILE = os.path.join(script_dir, 'history.sqlite3')
+RESUME_FILE = os.path.join(script_dir, 'resume.journal')
 
 # Get the directory containing the script
 
 # logger.debug(f'Current working directory: {script_dir}')
 
-class State(Enum):
-    Ready = 0
-    Working = 1
-    Rest = 2
-    LongRest = 3
-
-
-timer_dict = {'Ready': 25*60,
-            'Working': 25*60,
-             'Rest': 5*60,
-             'LongRest': 15*60}
-
-
 image_dict = {'Ready': os.path.join(script_dir, 'res/ReadyState.png'),
              'Working1': os.path.join(script_dir, 'res/Working1State.png'),
              'Rest1': os.path.join(script_dir, 'res/Rest1State.png'),
@@ -52,135 +65,355 @@ button_bg = '#abdbe3'  # Light Blue
 # tkFont.Font(family="Helvetica",size=36,weight="bold")
 button_font = ("Arial", 15, 'bold')
 
+# 'MM:SS' for every whole second a phase can show, so ticks never format strings
+TIMER_LABELS = tuple(f'{seconds // 60:0>2}:{seconds % 60:0>2}' for seconds in range(max(timer_dict.values()) + 1))
 
-def configure_logger(log_level='Debug'):
+# Window layout, in pixels. Everything packed besides the timer (state label, state image, control
+# row and their padding) is about CONTENT_HEIGHT_WITHOUT_TIMER tall; the rest of the default height
+# is the timer's. The default was 325 when the timer was a 58 px label.
+CONTENT_HEIGHT_WITHOUT_TIMER = 262
+DEFAULT_WINDOW_HEIGHT = 390
+TIMER_AREA_HEIGHT = DEFAULT_WINDOW_HEIGHT - CONTENT_HEIGHT_WITHOUT_TIMER
+TIMER_RING_SIZE = 110
+TIMER_RING_PADY = 5
 
-    logger.remove()
-    if log_level.lower == 'debug':
-        logger.add(sys.stderr, level="DEBUG")
-    if log_level.lower == 'trace':
-        logger.add(sys.stderr, level="TRACE")
-    if log_level.lower == 'info':
-        logger.add(sys.stderr, level="INFO")
+INACTIVITY_PROMPT_TIMEOUT_MINUTES = 5  # Unanswered "still listening?" prompts reset the timer after this long
+CATCH_UP_THRESHOLD = 5  # Seconds of suspend, or of lateness past a deadline, handled by catch_up()
 
 
 class Pymodoro:
-    def __init__(self):
-        # configure_logger(log_level='INFO')
-        logger.debug('Initializing pygame')
-        pygame.mixer.init() # Initialize pygame mixer
-        logger.debug('Pygame initialized')
-        self.root = tk.Tk()
+    def __init__(self, profile_startup=False, metrics_port=None, metrics_file=None, control=None, status_port=None,
+                 status_file=None):
+        self.profiler = StartupProfiler(profile_startup, tracer=TRACER)
+        self.metrics_file = metrics_file
+        self.metrics_server = None
+        if metrics_port is not None:
+            try:
+                self.metrics_server = MetricsServer(metrics_port).start()
+            except OSError as e:
+                logger.error("Could not serve metrics on port {}: {}", metrics_port, e)
+        self.trace_enabled = level_enabled('TRACE')
+        self.profiler.record('imports', PROCESS_START, imports_done)
+        self.audio_ready = threading.Event()  # Set once the mixer is up
+        self.subsystems_ready = threading.Event()  # Set once init_subsystems has finished
+        self.media_keys = MediaKeyWorker(report=self.report_media_key_problem).start()
+        self.sound_bank = SoundBank(os.path.join(script_dir, 'res'))
+        self.state_graphics = StateGraphicCache(image_dict)
+        self.state_graphics.preload_in_background()
+        with self.profiler.phase('tk init'):
+            self.root = tk.Tk()
         self.voice_active_var = tk.BooleanVar(value=True) # For the voice active checkbutton
+        self.inactivity_threshold_minutes = DEFAULT_THRESHOLD_MINUTES
+        self.log_level = DEFAULT_LOG_LEVEL  # As saved in options.json; --log-level overrides it for one run
+        self.inactivity_watchdog = InactivityWatchdog(self.root, self.check_inactivity)  # Configured by load_options
         # Default window geometry
-        self.window_geometry = {"width": 700, "height": 325, "x": None, "y": None}
-        self.load_options() # Load options before building window
-        
-        # Set the Windows taskbar icon if running on Windows
-        if sys.platform == 'win32':
-            try:
-                import ctypes
-                my_app_id = 'pymodoro.timer.1.0' # arbitrary string
-                ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(my_app_id)
-                
-                # Set window icon using the tomato image
-                tomato_icon = os.path.join(script_dir, 'res/tomato.png')
-                if os.path.exists(tomato_icon):
-                    # Set the window icon directly using the image
-                    icon = PIL.Image.open(tomato_icon)
-                    photo = PIL.ImageTk.PhotoImage(icon)
-                    if hasattr(photo, 'width') and hasattr(photo, 'height'):
-                        self.root.iconphoto(True, photo)
-            except Exception as e:
-                logger.error(f"Failed to set Windows taskbar icon: {e}")
-        
+        self.window_geometry = {"width": 700, "height": DEFAULT_WINDOW_HEIGHT, "x": None, "y": None}
+        self.options = OptionsStore(OPTIONS_FILE)
+        with self.profiler.phase('options load'):
+            self.load_options() # Load options before building window
+
+        self.history = HistoryStore(HISTORY_FILE)
+        self.resume_journal = ResumeJournal(RESUME_FILE)
+        self.pending_checkpoint = self.resume_journal.load()  # Kept on disk until the user has answered
+        self.engine = PomodoroEngine()
+        set_log_context(self.log_context)
+        self.phase_timer = PhaseTimer()
+        self.suspend_detector = SuspendDetector(threshold=CATCH_UP_THRESHOLD)
+        self.tick_id = None  # Pending continuous_increment; None while the timer is stopped
+        self.next_tick_due = None  # Monotonic time the pending tick was scheduled for
+        self.window_visible = True
+        self.status_server = None
+        self.status_file = None
         self.timer_active = False
-        self.state = State.Ready
-        self.sec_remaining = timer_dict[self.state.name]
-        self.build_window()
-        self.rests = 0
-        self.last_interaction = time.time()
+        self.time_remaining = timer_dict[self.state.name]
+        with self.profiler.phase('window build'):
+            self.build_window()
+
+        # Audio and media keys come up off the Tk thread; images are filled in once the window has painted
+        threading.Thread(target=self.init_subsystems, name='subsystem-init', daemon=True).start()
+        self.root.after_idle(self.update_state_graphic)
+        if sys.platform == 'win32':
+            self.root.after_idle(self.set_taskbar_icon)
+        self.root.bind('<Map>', self.on_map, add='+')
+        self.root.bind('<Unmap>', self.on_unmap, add='+')
+        if self.profiler.enabled:
+            self.startup_mapped = False
+            self.root.bind('<Map>', self.on_startup_map, add='+')
+
+        self.inactivity_prompt = None
+        self.inactivity_prompt_asked = None  # (state, rests, last interaction) when the open prompt was raised
         self.root.bind('<Key>', self.update_interaction)
         self.root.bind('<Button>', self.update_interaction)
         self.root.protocol("WM_DELETE_WINDOW", self.on_close) # Handle window close event
+        self.control = control
+        if control is not None:
+            control.start(self.handle_control_command)
+        if status_port is not None:
+            try:
+                # A new subscriber wants a frame every second, even while the window is minimized
+                self.status_server = StatusServer(status_port, on_subscribe=lambda: self.root.after(0, self.schedule_tick))
+                self.status_server.start()
+                self.publish_status('state')
+            except OSError as e:
+                logger.error("Could not serve status on port {}: {}", status_port, e)
+                self.status_server = None
+        if status_file is not None:
+            try:
+                self.status_file = StatusFileWriter(status_file)
+                self.publish_status('state')
+            except OSError as e:
+                logger.error("Could not create status file {}: {}", status_file, e)
+        if self.pending_checkpoint is not None:
+            self.root.after_idle(self.offer_resume)
         self.start()
 
+    def init_subsystems(self):
+        """Initializes pygame's mixer, the sound bank and pyautogui on a background thread."""
+        try:
+            with self.profiler.phase('mixer init'):
+                logger.debug('Initializing pygame')
+                import pygame
+                pygame.mixer.init() # Initialize pygame mixer
+                logger.debug('Pygame initialized')
+        except Exception as e:
+            logger.error("Failed to initialize audio: {}", e)
+        finally:
+            self.audio_ready.set()  # Prompts can play now; the sound bank streams any not yet preloaded
+        try:
+            with self.profiler.phase('sound preload'):
+                self.sound_bank.preload()
+        except Exception as e:
+            logger.error("Failed to preload sounds: {}", e)
+        try:
+            with self.profiler.phase('media keys import'):
+                import pyautogui  # noqa: F401 -- Only warms the import for play_pause_media
+        except Exception as e:
+            logger.error("Failed to import pyautogui: {}", e)
+        finally:
+            self.subsystems_ready.set()
+
+    def on_startup_map(self, event):
+        if event.widget is self.root and not self.startup_mapped:
+            self.startup_mapped = True  # Not unbind(): that would also drop on_map
+            self.profiler.mark('window mapped')
+            self.report_startup_profile()
+
+    def report_startup_profile(self):
+        # Background subsystems may still be coming up; report once they are done
+        if self.subsystems_ready.is_set():
+            self.profiler.report()
+        else:
+            self.root.after(50, self.report_startup_profile)
+
+    def set_taskbar_icon(self):
+        """Sets the Windows taskbar icon."""
+        try:
+            import ctypes
+            import PIL.Image
+            import PIL.ImageTk
+            my_app_id = 'pymodoro.timer.1.0' # arbitrary string
+            ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(my_app_id)
+
+            # Set window icon using the tomato image
+            tomato_icon = os.path.join(script_dir, 'res/tomato.png')
+            if os.path.exists(tomato_icon):
+                # Set the window icon directly using the image
+                icon = PIL.Image.open(tomato_icon)
+                photo = PIL.ImageTk.PhotoImage(icon)
+                if hasattr(photo, 'width') and hasattr(photo, 'height'):
+                    self.root.iconphoto(True, photo)
+        except Exception as e:
+            logger.error("Failed to set Windows taskbar icon: {}", e)
+
     def update_interaction(self, event=None):
-        self.last_interaction = time.time()
+        self.inactivity_watchdog.touch()
+
+    def sync_inactivity_watchdog(self):
+        """Only a running Working phase is watched for inactivity."""
+        self.inactivity_watchdog.set_active(self.state == State.Working and self.timer_active)
 
     def check_inactivity(self):
-        current_hour = datetime.now().hour
-        if (self.state == State.Working and
-            self.timer_active and
-            time.time() - self.last_interaction > 3600 and
-            (current_hour < 7 or current_hour >= 16)):  # 60 minutes
-
-            self.play_sound("are_you_still_listening") # Added voice prompt
-            response = messagebox.askyesno("Still there?",
-                                         "Are you still listening?")
-            if response:
-                self.update_interaction()
-            else:
-                self.reset()
-                self.play_pause_media()  # Stop media playback
+        """Called by the inactivity watchdog once nobody has interacted for the threshold, outside quiet hours."""
+        if self.inactivity_prompt is not None:
+            return  # Already asking
+        self.play_sound("are_you_still_listening") # Added voice prompt
+        # Non-modal, so the countdown keeps ticking while the question is up
+        self.inactivity_prompt = InactivityPrompt(self.root, self.on_inactivity_answer,
+                                                  timeout_ms=INACTIVITY_PROMPT_TIMEOUT_MINUTES * 60 * 1000,
+                                                  bg=global_bg, button_bg=button_bg, button_font=button_font)
+        self.inactivity_prompt_asked = (self.state, self.rests, self.inactivity_watchdog.last_interaction)
+
+    def on_inactivity_answer(self, still_there):
+        asked = self.inactivity_prompt_asked
+        self.inactivity_prompt = self.inactivity_prompt_asked = None
+        if still_there:
+            self.update_interaction()
+            self.sync_inactivity_watchdog()
+        elif not self.timer_active or (self.state, self.rests, self.inactivity_watchdog.last_interaction) != asked:
+            # Someone paused, reset, skipped or clicked while the question was up, so they are there after all
+            logger.info("Timer changed since asking whether anyone is listening, leaving it alone.")
+            self.update_interaction()
+            self.sync_inactivity_watchdog()
+        else:
+            logger.info("No one is listening, resetting.")
+            self.reset()
+            self.play_pause_media()  # Stop media playback
 
     def start(self):
         self.continuous_increment()
         self.root.mainloop()
 
     def continuous_increment(self):
+        if self.next_tick_due is not None:
+            TICK_LATENESS.observe(max(0.0, time.monotonic() - self.next_tick_due))
+        suspended = self.suspend_detector.check()
         if self.timer_active:
-            self.decrease()
-            if self.time_remaining <= 0:
+            if suspended or self.phase_timer.remaining() < -CATCH_UP_THRESHOLD:
+                self.catch_up(suspended)
+            seconds = self.phase_timer.seconds_remaining()
+            if self.trace_enabled:
+                logger.trace('Timer tick, {}s remaining', seconds)
+            self.engine.time_remaining = seconds
+            self.update_timer_label(seconds)
+            if seconds == 0:
                 self.transition_state()
-            self.check_inactivity()
-
-        self.root.after(1000, self.continuous_increment)
-
-    def transition_state(self):
-        if self.state == State.Ready:
-            logger.debug('Transitioning to Working...')
-            # For Ready -> Working, no specific sound in requirements, but play_pause_media might make a sound.
-            # If a "start work" sound is desired, it would go here.
-            self.play_pause_media()
-            self.state = State.Working
-            self.set_time_remaining()
-            self.set_state_label()
-            self.update_state_graphic()
-            self.timer_active = True
-        elif self.state == State.Working:
-            logger.debug(f'Current Rest -> {self.rests}')
-            if self.rests < 3:
-                logger.debug('Transitioning to Rest...')
-                self.play_sound("lets_take_a_quick_break") # Changed voice prompt
-                self.play_pause_media()
-                self.state = State.Rest
-                self.set_time_remaining()
-                self.set_state_label()
-                self.update_state_graphic()
-                self.rests += 1
             else:
-                logger.debug('Transitioning to Long Rest...')
-                self.play_sound("lets_take_a_longer_break") # Changed voice prompt
-                self.play_pause_media()
-                self.rests = 0
-                self.state = State.LongRest
-                self.set_time_remaining()
-                self.set_state_label()
-                self.update_state_graphic()
-        elif self.state == State.Rest or self.state == State.LongRest:
-            logger.debug('Transitioning to Working...')
-            self.play_sound("lets_get_back_to_work") # Changed voice prompt
+                self.publish_status()
+        self.schedule_tick()
+
+    def schedule_tick(self):
+        """(Re)schedules continuous_increment, or cancels it while the timer is stopped.
+
+        Paused and Ready cost no wake-ups at all. While the window is minimized (and nobody is
+        streaming /events) nothing is on screen, so the only wake-up is at the phase deadline.
+        """
+        if self.tick_id is not None:
+            self.root.after_cancel(self.tick_id)  # A no-op if it is the tick that is running now
+            self.tick_id = None
+        if not self.timer_active:
+            self.next_tick_due = None
+            return
+        if self.next_tick_due is None:
+            # The loop was stopped: a suspend while paused or Ready skipped nothing, so don't catch up on it
+            self.suspend_detector.reset()
+        if self.window_visible or (self.status_server is not None and self.status_server.subscribers):
+            # Wake just after the next whole second of the phase deadline so lateness never accumulates
+            delay_ms = self.phase_timer.next_tick_delay_ms()
+        else:
+            delay_ms = int(max(0.0, self.phase_timer.remaining()) * 1000) + 1
+        self.next_tick_due = time.monotonic() + delay_ms / 1000
+        self.tick_id = self.root.after(delay_ms, self.continuous_increment)
+
+    def on_map(self, event):
+        if event.widget is self.root and not self.window_visible:
+            self.window_visible = True
+            self.update_timer_label(self.time_remaining)  # The label wasn't updated while minimized
+            self.schedule_tick()
+
+    def on_unmap(self, event):
+        if event.widget is self.root and self.window_visible:
+            self.window_visible = False
+            self.schedule_tick()
+
+    # The state machine lives in self.engine; the countdown is kept against the wall clock by
+    # self.phase_timer and mirrored into the engine when it changes.
+    @property
+    def state(self):
+        return self.engine.state
+
+    @state.setter
+    def state(self, state):
+        self.engine.state = state
+
+    @property
+    def rests(self):
+        return self.engine.rests
+
+    @rests.setter
+    def rests(self, rests):
+        self.engine.rests = rests
+
+    @property
+    def time_remaining(self):
+        return self.phase_timer.seconds_remaining()
+
+    @time_remaining.setter
+    def time_remaining(self, seconds):
+        self.phase_timer.set_remaining(seconds)
+        self.engine.time_remaining = seconds
+
+    @property
+    def timer_active(self):
+        return self.phase_timer.running
+
+    @timer_active.setter
+    def timer_active(self, active):
+        if active:
+            self.phase_timer.resume()
+        else:
+            self.phase_timer.pause()
+        self.engine.timer_active = active
+        self.schedule_tick()  # Starts or stops the tick loop
+        self.sync_inactivity_watchdog()
+
+    def phase_elapsed(self):
+        """Seconds spent in the current phase so far, excluding pauses."""
+        return max(0.0, self.engine.durations[self.state.name] - self.phase_timer.remaining())
+
+    @traced('transition_state')
+    @timed('transition_state')
+    def transition_state(self, kind=EventKind.Transition):
+        if self.state == State.Working:
+            logger.debug('Current Rest -> {}', self.rests)
+        elapsed = self.phase_elapsed()
+        event = self.engine.transition()
+        self.history.record(kind, event.previous, event.state, event.rests, elapsed)
+        logger.debug('Transitioning to {}...', event.state.name)
+        if event.prompt:
+            self.play_sound(event.prompt)
+        self.play_pause_media()
+        self.set_time_remaining()
+        self.set_state_label()
+        self.update_state_graphic()
+        self.timer_active = self.engine.timer_active
+        self.publish_status('transition')
+
+    @traced('catch_up')
+    def catch_up(self, suspended_seconds=0.0):
+        """Fast-forwards the schedule after a suspend (or a long stall) without replaying ticks.
+
+        Every phase boundary crossed is applied in one engine.advance() call. Only the last
+        transition's prompt is played, and media is toggled once if an odd number of transitions
+        were skipped over, leaving it where the individual toggles would have.
+        """
+        awake = min(self.phase_elapsed(), self.engine.durations[self.state.name])
+        if suspended_seconds:
+            self.phase_timer.deadline -= suspended_seconds  # Time the monotonic clock didn't see
+        overdue = -self.phase_timer.remaining()
+        if overdue < 0:
+            return  # Still in the same phase
+        self.engine.time_remaining = 0
+        events = self.engine.advance(overdue)
+        logger.info('Caught up {} transitions {:.0f}s past the phase deadline, now {} with {} rests',
+                    len(events), overdue, self.state.name, self.rests)
+        for i, event in enumerate(events):
+            self.history.record(EventKind.CatchUp, event.previous, event.state, event.rests, awake if i == 0 else 0.0)
+        self.phase_timer.set_remaining(self.engine.time_remaining)
+        if events[-1].prompt:
+            self.play_sound(events[-1].prompt)
+        if len(events) % 2:
             self.play_pause_media()
-            self.state = State.Working
-            self.set_time_remaining()
-            self.set_state_label()
-            self.update_state_graphic()
+        self.set_state_label()
+        self.update_state_graphic()
+        self.sync_inactivity_watchdog()
+        self.publish_status('transition')
 
+    @traced('set_time_remaining')
     def set_time_remaining(self):
-        self.time_remaining = timer_dict[self.state.name]
+        self.phase_timer.start(self.engine.durations[self.state.name])
         self.update_timer_label()
 
+    @traced('set_state_label')
     def set_state_label(self):
         self.state_lbl['text'] = self.state.name
 
@@ -217,26 +450,25 @@ class Pymodoro:
         self.add_control_widget(self.main_frame)
         # self.add_options_widget(self.main_frame) # Old call, no longer needed here
 
-    def rebuild_window(self):
-        # Destroy frames. Since options_button is a child of state_frame,
-        # destroying state_frame will handle the options_button.
-        if hasattr(self, 'control_frame') and self.control_frame.winfo_exists():
-            self.control_frame.destroy()
-        if hasattr(self, 'pomodoro_frame') and self.pomodoro_frame.winfo_exists():
-            self.pomodoro_frame.destroy()
-        if hasattr(self, 'timer_frame') and self.timer_frame.winfo_exists():
-            self.timer_frame.destroy()
-        if hasattr(self, 'state_frame') and self.state_frame.winfo_exists():
-            self.state_frame.destroy()
-            # self.options_button is child of state_frame, so it's gone too.
-
-        # Re-create UI elements in correct order
-        self.add_state_widget(self.main_frame)      # Recreates self.state_frame
-        self.add_options_widget(self.state_frame)   # Re-places options_button in new self.state_frame
-        self.add_timer_widget(self.main_frame)
-        self.add_pomodoro_widget(self.main_frame)
-        self.add_control_widget(self.main_frame)
-        # self.add_options_widget(self.main_frame) # Old call
+    @traced('refresh_window')
+    @timed('refresh_window')
+    def refresh_window(self):
+        """Brings the widgets in line with the current state, touching only what actually changed."""
+        layout = 'ready' if self.state == State.Ready else 'running'
+        if layout != self.control_layout:
+            if layout == 'ready':
+                self.running_controls.pack_forget()
+                self.ready_controls.pack(anchor='center')
+            else:
+                self.ready_controls.pack_forget()
+                self.start_stop_button['text'] = 'Pause'
+                self.running_controls.pack(anchor='center')
+            self.control_layout = layout
+
+        if self.state_lbl['text'] != self.state.name:
+            self.set_state_label()
+        if graphic_key(self.state.name, self.rests) != self.state_graphic_key:
+            self.update_state_graphic()
 
     def add_state_widget(self, parent):
         self.state_frame = tk.Frame(master=parent, height=100, bg=global_bg, relief=tk.RAISED, borderwidth=1)
@@ -247,49 +479,45 @@ class Pymodoro:
     def add_timer_widget(self, parent):
         self.timer_frame = tk.Frame(master=parent, height=100, bg=global_bg)
         self.timer_frame.pack(fill='x')
-        self.timer_lbl = tk.Label(master=self.timer_frame, text="00:00", padx='10', font=("Arial", 25), bg=global_bg)
-        self.timer_lbl.pack(anchor='center', pady='10')
+        self.timer_ring = ProgressRing(self.timer_frame, size=TIMER_RING_SIZE, font=("Arial", 25), track_color=button_bg)
+        self.timer_ring.pack(anchor='center', pady=TIMER_RING_PADY)
 
     def add_pomodoro_widget(self, parent):
         self.pomodoro_frame = tk.Frame(master=parent, height=100, bg=global_bg)
         self.pomodoro_frame.pack(fill='x')
 
-        if self.state == State.Ready:
-            im = PIL.Image.open(image_dict['Ready'])
-        else:
-            dict_key = f'{self.state.name}{str(self.rests + 1)}'
-            im = PIL.Image.open(image_dict[dict_key])
-        photo = PIL.ImageTk.PhotoImage(im)
+        # The image itself is set by update_state_graphic once the window is up (see __init__)
+        self.state_graphic_key = graphic_key(self.state.name, self.rests)
 
         # canvas = tk.Canvas(master=self.pomodoro_frame, width=im.size[0], height=im.size[1])
         # canvas.pack()
         # canvas.create_image(im.size[0], im.size[1], image=photo)
 
-        self.state_image_lbl = tk.Label(master=self.pomodoro_frame, image=photo, bg=global_bg)
-        self.state_image_lbl.image = photo  # keep a reference!
+        self.state_image_lbl = tk.Label(master=self.pomodoro_frame, bg=global_bg)
         self.state_image_lbl.pack(anchor='center')
 
     def add_control_widget(self, parent):
-        if self.state == State.Ready:
-            self.control_frame = tk.Frame(master=parent, height=125, bg=global_bg)
-            self.control_frame.pack(anchor='center', pady='25')
+        # Both control layouts are built once; refresh_window swaps which one is packed.
+        self.control_frame = tk.Frame(master=parent, height=125, bg=global_bg)
+        self.control_frame.pack(anchor='center', pady='25')
 
-            self.go_button = tk.Button(master=self.control_frame, text='Go!', width='15', pady='5', command=self.go, bg=button_bg, font=button_font)
-            self.go_button.pack(side='left', padx='5')
+        self.ready_controls = tk.Frame(master=self.control_frame, bg=global_bg)
+        self.go_button = tk.Button(master=self.ready_controls, text='Go!', width='15', pady='5', command=self.go, bg=button_bg, font=button_font)
+        self.go_button.pack(side='left', padx='5')
 
-        else:
-            self.control_frame = tk.Frame(master=parent, height=125, bg=global_bg)
-            self.control_frame.pack(anchor='center', pady='25')
+        self.running_controls = tk.Frame(master=self.control_frame, bg=global_bg)
+        self.start_stop_button = tk.Button(master=self.running_controls, text='Pause', width='15', pady='5',
+                                         command=self.start_stop, bg=button_bg, font=button_font)
+        self.start_stop_button.pack(side='left', padx='5')
 
-            self.start_stop_button = tk.Button(master=self.control_frame, text='Pause', width='15', pady='5',
-                                             command=self.start_stop, bg=button_bg, font=button_font)
-            self.start_stop_button.pack(side='left', padx='5')
+        skip_button = tk.Button(master=self.running_controls, text='Skip', width='15', pady='5', command=self.skip, bg=button_bg, font=button_font)
+        skip_button.pack(side='left', padx='5')
 
-            skip_button = tk.Button(master=self.control_frame, text='Skip', width='15', pady='5', command=self.skip, bg=button_bg, font=button_font)
-            skip_button.pack(side='left', padx='5')
+        reset_button = tk.Button(master=self.running_controls, text='Restart', width='15', pady='5', command=self.reset, bg=button_bg, font=button_font)
+        reset_button.pack(side='left', padx='5')
 
-            reset_button = tk.Button(master=self.control_frame, text='Restart', width='15', pady='5', command=self.reset, bg=button_bg, font=button_font)
-            reset_button.pack(side='left', padx='5')
+        self.control_layout = None
+        self.refresh_window()
 
     def add_options_widget(self, state_frame_as_master):
         # The options_frame is no longer needed.
@@ -395,42 +623,73 @@ class Pymodoro:
     def load_options(self):
         should_save_defaults = False
         try:
-            with open(OPTIONS_FILE, 'r') as f:
-                options = json.load(f)
-
-                # Load voice_active option
-                if "voice_active" in options:
-                    self.voice_active_var.set(options["voice_active"])
-                    logger.info(f"Loaded 'voice_active': {options['voice_active']} from {OPTIONS_FILE}")
-                else:
-                    logger.info(f"'voice_active' key missing in {OPTIONS_FILE}. Using default True.")
-                    self.voice_active_var.set(True) # Default value
-                    should_save_defaults = True
-
-                # Load window geometry
-                self.window_geometry["width"] = options.get("window_width", self.window_geometry["width"])
-                self.window_geometry["height"] = options.get("window_height", self.window_geometry["height"])
-                self.window_geometry["x"] = options.get("window_x", self.window_geometry["x"])
-                self.window_geometry["y"] = options.get("window_y", self.window_geometry["y"])
-                if any(key not in options for key in ["window_width", "window_height", "window_x", "window_y"]):
-                    logger.info("One or more window geometry keys missing. Will use defaults and save them.")
-                    should_save_defaults = True
-                else:
-                    logger.info(f"Loaded window geometry: {self.window_geometry} from {OPTIONS_FILE}")
+            options = self.options.load()
+            # Load voice_active option
+            if "voice_active" in options:
+                self.voice_active_var.set(options["voice_active"])
+                logger.info("Loaded 'voice_active': {} from {}", options['voice_active'], OPTIONS_FILE)
+            else:
+                logger.info("'voice_active' key missing in {}. Using default True.", OPTIONS_FILE)
+                self.voice_active_var.set(True) # Default value
+                should_save_defaults = True
+
+            # Load window geometry
+            self.window_geometry["width"] = options.get("window_width", self.window_geometry["width"])
+            self.window_geometry["height"] = options.get("window_height", self.window_geometry["height"])
+            self.window_geometry["x"] = options.get("window_x", self.window_geometry["x"])
+            self.window_geometry["y"] = options.get("window_y", self.window_geometry["y"])
+            if any(key not in options for key in ["window_width", "window_height", "window_x", "window_y"]):
+                logger.info("One or more window geometry keys missing. Will use defaults and save them.")
+                should_save_defaults = True
+            elif self.window_geometry["height"] < CONTENT_HEIGHT_WITHOUT_TIMER + TIMER_RING_SIZE + 2 * TIMER_RING_PADY:
+                # Saved before the timer became a ring, or otherwise too short to show the controls
+                logger.info("Saved window height {} clips the controls, using {}.", self.window_geometry['height'],
+                            DEFAULT_WINDOW_HEIGHT)
+                self.window_geometry["height"] = DEFAULT_WINDOW_HEIGHT
+                should_save_defaults = True
+            else:
+                logger.info("Loaded window geometry: {} from {}", self.window_geometry, OPTIONS_FILE)
+
+            # Load the inactivity prompt threshold and the hours in which it stays quiet
+            threshold_minutes = options.get("inactivity_threshold_minutes", DEFAULT_THRESHOLD_MINUTES)
+            quiet_hours = options.get("inactivity_quiet_hours", DEFAULT_QUIET_HOURS)
+            try:
+                if not isinstance(threshold_minutes, (int, float)) or threshold_minutes <= 0:
+                    raise ValueError(f"inactivity threshold must be a positive number of minutes, got {threshold_minutes}")
+                quiet_hours = validate_quiet_hours(quiet_hours)
+            except (TypeError, ValueError) as e:
+                logger.warning("Invalid inactivity settings in {} ({}). Using defaults.", OPTIONS_FILE, e)
+                threshold_minutes, quiet_hours = DEFAULT_THRESHOLD_MINUTES, validate_quiet_hours(DEFAULT_QUIET_HOURS)
+                should_save_defaults = True
+            self.inactivity_threshold_minutes = threshold_minutes
+            self.inactivity_watchdog.configure(threshold_minutes * 60, quiet_hours)
+            if any(key not in options for key in ["inactivity_threshold_minutes", "inactivity_quiet_hours"]):
+                should_save_defaults = True
+
+            # The level itself was applied at startup by log_level_from_options; kept here so saving preserves it
+            try:
+                self.log_level = validate_log_level(options.get("log_level", DEFAULT_LOG_LEVEL))
+            except ValueError as e:
+                logger.warning("Invalid log level in {} ({}). Using {}.", OPTIONS_FILE, e, DEFAULT_LOG_LEVEL)
+                self.log_level = DEFAULT_LOG_LEVEL
+                should_save_defaults = True
+            if "log_level" not in options:
+                should_save_defaults = True
 
         except FileNotFoundError:
-            logger.info(f"{OPTIONS_FILE} not found. Creating with default settings for all options.")
+            logger.info("{} not found. Creating with default settings for all options.", OPTIONS_FILE)
             # Set defaults for all options explicitly here
             self.voice_active_var.set(True)
             # self.window_geometry remains as its initialized defaults
             should_save_defaults = True
         except json.JSONDecodeError:
-            logger.warning(f"Error decoding JSON from {OPTIONS_FILE}. Using default settings for all options and overwriting.")
+            logger.warning("Error decoding JSON from {}. Using default settings for all options.", OPTIONS_FILE)
+            self.options.set_aside_corrupt_file()
             self.voice_active_var.set(True)
             # self.window_geometry remains as its initialized defaults
             should_save_defaults = True
         except Exception as e: # Catch any other unexpected error during loading
-            logger.error(f"Unexpected error loading options: {e}. Using default settings for all options.")
+            logger.error("Unexpected error loading options: {}. Using default settings for all options.", e)
             self.voice_active_var.set(True)
             # self.window_geometry remains as its initialized defaults
             should_save_defaults = True
@@ -441,71 +700,73 @@ class Pymodoro:
 
 
     def save_options(self):
-        # Ensure current geometry is captured if not already set by on_close
-        # This is more of a fallback; ideally, on_close updates self.window_geometry before calling save_options.
-        try:
-            # This might fail if root window is not fully initialized or already destroyed
-            current_width = self.root.winfo_width()
-            current_height = self.root.winfo_height()
-            current_x = self.root.winfo_x()
-            current_y = self.root.winfo_y()
-            # Update self.window_geometry only if these values are sensible (e.g. >0 for width/height)
-            # However, this check is tricky as winfo_x/y can be 0.
-            # For now, let's assume on_close is the primary source for geometry before saving.
-        except tk.TclError: # Window might not exist when save_options is called (e.g. during initial load_options)
-             pass # Keep existing self.window_geometry values
-
+        # Only updates the in-memory options; OptionsStore writes them out in the background, batching
+        # rapid changes (e.g. toggling the voice switch) into one atomic write. on_close flushes.
         options_to_save = {
             "voice_active": self.voice_active_var.get(),
             "window_width": self.window_geometry["width"],
             "window_height": self.window_geometry["height"],
             "window_x": self.window_geometry["x"],
             "window_y": self.window_geometry["y"],
+            "inactivity_threshold_minutes": self.inactivity_threshold_minutes,
+            "inactivity_quiet_hours": self.inactivity_watchdog.quiet_hours,
+            "log_level": self.log_level,
         }
-        try:
-            with open(OPTIONS_FILE, 'w') as f:
-                json.dump(options_to_save, f, indent=4)
-            logger.info(f"Saved options to {OPTIONS_FILE}")
-        except IOError as e:
-            logger.error(f"Error saving options to {OPTIONS_FILE}: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error saving options: {e}")
+        self.options.update(**options_to_save)
 
 
+    @traced('play_pause_media')
     def play_pause_media(self):
-        pyautogui.press("playpause")
+        # Key injection can take hundreds of ms on X11, so it happens on the media-key thread
+        self.media_keys.toggle("playpause")
+
+    def report_media_key_problem(self, message):
+        # Called on the media-key thread; hand the message over to the Tk thread
+        self.root.after(0, self.on_media_key_problem, message)
 
+    def on_media_key_problem(self, message):
+        logger.warning(message)
+
+    @traced('go')
     def go(self):
         self.transition_state()
-        self.rebuild_window()
+        self.refresh_window()
         self.set_time_remaining()
 
+    @traced('skip')
     def skip(self):
-        self.transition_state()
+        self.transition_state(EventKind.Skip)
 
+    @traced('reset')
     def reset(self):
-        self.state = State.Ready
-        self.rests = 0
-        self.rebuild_window()
+        self.history.record(EventKind.Reset, self.state, State.Ready, 0, self.phase_elapsed())
+        self.engine.reset()
+        self.refresh_window()
         self.set_time_remaining()
         self.set_state_label()
         self.timer_active = False
+        self.publish_status('state')
 
-    def update_timer_label(self):
-        self.timer_lbl['text'] = f'{self.format_time_value()}'
+    def update_timer_label(self, seconds=None):
+        """Shows `seconds` (default: the time remaining) as digits and as the fraction of the phase left."""
+        if seconds is None:
+            seconds = self.time_remaining
+        self.timer_ring.show(seconds / self.engine.durations[self.state.name], self.format_time_value(seconds))
 
+    @traced('update_state_graphic')
     def update_state_graphic(self):
 
-        dict_key = f'{self.state.name}{str(self.rests+1)}'
-        im = PIL.Image.open(image_dict[dict_key])
-
-        logger.debug(f'Updating state graphic to {image_dict[dict_key]}')
-        photo = PIL.ImageTk.PhotoImage(im)
+        dict_key = graphic_key(self.state.name, self.rests)
+        logger.debug('Updating state graphic to {}', image_dict[dict_key])
+        photo = self.state_graphics.get(dict_key)
         self.state_image_lbl.configure(image=photo)
         self.state_image_lbl.image = photo  # keep a reference!
+        self.state_graphic_key = dict_key
         # self.state_image_lbl.pack(anchor='center')
 
     def start_stop(self):
+        kind = EventKind.Pause if self.timer_active else EventKind.Resume
+        self.history.record(kind, self.state, self.state, self.rests)
         if self.timer_active:
             self.timer_active = False
             self.start_stop_button['text'] = 'Start'
@@ -514,42 +775,173 @@ class Pymodoro:
             self.timer_active = True
             self.start_stop_button['text'] = 'Pause'
             self.set_state_label()
+        self.publish_status('state')
 
     def increase(self):
         self.time_remaining += 1
         self.update_timer_label()
 
     def decrease(self):
-        logger.trace('Decrementing timer...')
+        if self.trace_enabled:
+            logger.trace('Decrementing timer...')
         self.time_remaining -= 1
         self.update_timer_label()
 
-    def format_time_value(self):
-        secconds = self.time_remaining % 60
-        mininutes = math.floor(self.time_remaining / 60)
-        logger.trace(f'Timer value: {mininutes:0>2}:{secconds:0>2}')
-        return f'{mininutes:0>2}:{secconds:0>2}'
+    def format_time_value(self, seconds=None):
+        if seconds is None:
+            seconds = self.time_remaining
+        if 0 <= seconds < len(TIMER_LABELS):
+            return TIMER_LABELS[seconds]
+        return f'{seconds // 60:0>2}:{seconds % 60:0>2}'
 
+    @traced('play_sound')
+    @timed('play_sound')
     def play_sound(self, sound_name):
-        """Plays a sound from the res directory using pygame.mixer."""
+        """Plays a sound from the res directory, from the in-memory sound bank once it is preloaded."""
         if not self.voice_active_var.get():
             logger.debug("Voice Active is False, skipping sound.")
             return
+        if not self.audio_ready.is_set():
+            logger.warning("Audio is still initializing, skipping sound {}.", sound_name)
+            return
+        import pygame
         try:
-            path = os.path.join(script_dir, 'res', f"{sound_name}.mp3")
-            if not os.path.exists(path):
-                logger.warning(f"Audio file not found: {path}")
-                return
-            pygame.mixer.music.load(path)
-            pygame.mixer.music.play()
-            logger.debug(f"Playing sound: {path}")
+            self.sound_bank.play(sound_name)
         except pygame.error as e:
-            logger.error(f"Could not play sound {sound_name}. Pygame error: {e}")
+            logger.error("Could not play sound {}. Pygame error: {}", sound_name, e)
         except Exception as e:
-            logger.error(f"An unexpected error occurred while trying to play sound {sound_name}: {e}")
+            logger.error("An unexpected error occurred while trying to play sound {}: {}", sound_name, e)
+
+    def handle_control_command(self, command):
+        """Runs a control-socket command. Called on the control thread; the work happens on the Tk thread."""
+        done = threading.Event()
+        reply = {}
+
+        def run():
+            try:
+                reply.update(self.run_control_command(command))
+            except Exception as e:
+                reply.update(ok=False, error=str(e))
+            finally:
+                done.set()
+
+        self.root.after(0, run)
+        if not done.wait(CONTROL_TIMEOUT):
+            return {'ok': False, 'error': 'the window did not respond in time'}
+        return reply
+
+    def run_control_command(self, command):
+        """The control-socket commands, mirroring the buttons: go/skip/reset/pause, plus status and show."""
+        error = None
+        if command == 'go':
+            if self.state == State.Ready:
+                self.go()
+            else:
+                error = 'already running'
+        elif command in ('skip', 'pause'):
+            if self.state == State.Ready:
+                error = 'not running'
+            elif command == 'skip':
+                self.skip()
+            else:
+                self.start_stop()
+        elif command == 'reset':
+            self.reset()
+        elif command == 'show':
+            self.root.deiconify()
+            self.root.lift()
+        reply = {'ok': error is None, 'status': self.status_snapshot()}
+        if error:
+            reply['error'] = error
+        return reply
+
+    def log_context(self):
+        """Fields attached to every log record; called only for records that will be written."""
+        return {'state': self.state.name, 'rests': self.rests, 'time_remaining': self.engine.time_remaining}
+
+    def status_snapshot(self):
+        running = self.timer_active
+        return {'state': self.state.name, 'rests': self.rests, 'time_remaining': self.time_remaining,
+                'timer_active': running,
+                # Lets clients count down on their own between frames
+                'phase_ends_at': round(time.time() + self.phase_timer.remaining(), 3) if running else None}
+
+    def publish_status(self, event='tick'):
+        """Pushes the current snapshot to the status server and the status file, whichever are on.
+
+        Schedule changes (anything but a plain tick) are also checkpointed to the resume journal.
+        """
+        if event != 'tick':
+            self.save_checkpoint()
+        if self.status_server is None and self.status_file is None:
+            return
+        snapshot = self.status_snapshot()
+        if self.status_server is not None:
+            self.status_server.publish(snapshot, event)
+        if self.status_file is not None:
+            self.status_file.write(self.state.value, snapshot['rests'], snapshot['time_remaining'],
+                                   snapshot['timer_active'], snapshot['phase_ends_at'])
+
+    def save_checkpoint(self):
+        if self.pending_checkpoint is not None:
+            return  # Don't overwrite the previous run's checkpoint before the user has chosen
+        running = self.timer_active
+        remaining = self.phase_timer.remaining()
+        self.resume_journal.save(self.state, self.rests, running, remaining,
+                                 round(time.time() + remaining, 3) if running else None)
+
+    def offer_resume(self):
+        """Asks whether to pick up the previous run's checkpoint, if it was left mid-session."""
+        checkpoint, self.pending_checkpoint = self.pending_checkpoint, None
+        if checkpoint is None or self.state != State.Ready or self.timer_active:
+            self.save_checkpoint()  # Started from a control command meanwhile; the new session wins
+            return
+        remaining = checkpoint.remaining()
+        if remaining < 0:
+            # resume_from will move on through whatever phases would have run since
+            question = (f'Pymodoro was closed during {checkpoint.state.name}, which ended '
+                        f'{max(1, round(-remaining / 60))} min ago. Resume at the phase it would be in now?')
+        else:
+            paused = '' if checkpoint.timer_active else ' (paused)'
+            question = (f'Pymodoro was closed during {checkpoint.state.name}{paused} with '
+                        f'{self.format_time_value(math.ceil(remaining))} left. Pick up where you left off?')
+        from tkinter import messagebox
+        resume = messagebox.askyesno('Resume?', question, parent=self.root)
+        if self.state != State.Ready or self.timer_active:
+            # The dialog runs a nested event loop, so a control command may have started a session under it
+            self.save_checkpoint()
+        elif resume:
+            self.resume_from(checkpoint)
+        else:
+            self.resume_journal.clear()
+
+    @traced('resume_from')
+    def resume_from(self, checkpoint, now=None):
+        """Restores a checkpoint, advancing past every phase that ended while Pymodoro wasn't running."""
+        self.engine.state = checkpoint.state
+        self.engine.rests = checkpoint.rests
+        remaining = checkpoint.remaining(now)
+        if checkpoint.timer_active and remaining < 0:
+            self.engine.timer_active = True
+            self.engine.time_remaining = 0
+            events = self.engine.advance(-remaining)
+            for event in events:
+                self.history.record(EventKind.CatchUp, event.previous, event.state, event.rests, 0.0)
+            remaining = self.engine.time_remaining
+            logger.info('Resumed {} transitions past the checkpoint, now {}', len(events), self.state.name)
+        self.time_remaining = remaining
+        self.timer_active = checkpoint.timer_active
+        self.refresh_window()
+        if not checkpoint.timer_active:
+            self.start_stop_button['text'] = 'Start'
+            self.state_lbl['text'] = f'{self.state.name} - Paused'
+        self.update_timer_label()
+        self.publish_status('state')
 
     def on_close(self):
         """Handles actions to be performed when the window is closed."""
+        for sound_name, (plays, mean_ms, max_ms) in self.sound_bank.latency_stats().items():
+            logger.info("Sound {}: {} plays, mean latency {:.2f} ms, max {:.2f} ms", sound_name, plays, mean_ms, max_ms)
         logger.info("Window closing, saving options...")
         try:
             # Update window_geometry with the current size and position
@@ -560,12 +952,67 @@ class Pymodoro:
             self.save_options()
         except tk.TclError as e:
             # This might happen if the window is already destroyed
-            logger.error(f"Error getting window geometry on close: {e}")
+            logger.error("Error getting window geometry on close: {}", e)
         except Exception as e:
-            logger.error(f"Unexpected error during on_close: {e}")
+            logger.error("Unexpected error during on_close: {}", e)
         finally:
+            self.save_checkpoint()  # Picks up +/- adjustments, which don't checkpoint on their own
+            if self.control is not None:
+                self.control.close()
+            self.options.close()
+            self.history.close()
+            if self.metrics_server is not None:
+                self.metrics_server.stop()
+            if self.status_server is not None:
+                self.status_server.stop()
+            if self.status_file is not None:
+                self.status_file.close()
+            self.media_keys.stop()
+            if self.metrics_file:
+                METRICS.dump(self.metrics_file)
+            if TRACER.enabled:
+                TRACER.write()
             self.root.destroy()
+            flush_logs()
 
 
 if __name__ == '__main__':
-    pymo = Pymodoro()
+    parser = argparse.ArgumentParser(description='Pomodoro timer')
+    parser.add_argument('--profile-startup', action='store_true',
+                        help='print a per-phase startup timeline once the window is up')
+    parser.add_argument('--metrics-port', type=int, metavar='PORT',
+                        help='serve Prometheus metrics at http://127.0.0.1:PORT/metrics')
+    parser.add_argument('--metrics-file', metavar='PATH',
+                        help='write Prometheus metrics to PATH on exit')
+    parser.add_argument('--status-port', type=int, metavar='PORT',
+                        help='serve the current phase at http://127.0.0.1:PORT/status and stream changes from /events')
+    parser.add_argument('--status-file', nargs='?', const=default_status_file(), metavar='PATH',
+                        help=f'keep the current phase in a memory-mapped file for status bars '
+                             f'(default path {default_status_file()}); read it with status_file.py')
+    parser.add_argument('--trace', metavar='FILE',
+                        help='write Chrome Trace Event spans for startup and state changes to FILE on exit '
+                             '(or set PYMODORO_TRACE=FILE)')
+    parser.add_argument('--log-level', type=str.upper, choices=LOG_LEVELS,
+                        help='log level for this run (default: "log_level" in options.json, else INFO)')
+    parser.add_argument('--log-file', nargs='?', const=os.path.join(script_dir, 'logs', 'pymodoro.jsonl'), metavar='PATH',
+                        help='also log to a rotating JSON-lines file (default path logs/pymodoro.jsonl)')
+    args = parser.parse_args()
+    configure_logger(args.log_level or log_level_from_options(OPTIONS_FILE), log_file=args.log_file)
+    if args.trace:
+        TRACER.enable(args.trace)
+    try:
+        control = ControlServer.bind()
+    except AlreadyRunning:
+        # A second launch just brings the running instance's window forward
+        logger.info("Pymodoro is already running, showing its window instead")
+        try:
+            send_command('show')
+        except (OSError, ValueError) as e:
+            logger.error("Could not reach the running instance: {}", e)
+        sys.exit(0)
+    except OSError as e:
+        logger.warning("Control socket unavailable ({}), running without the single-instance guard", e)
+        control = None
+    pymo = Pymodoro(profile_startup=args.profile_startup, metrics_port=args.metrics_port,
+                    metrics_file=args.metrics_file, control=control, status_port=args.status_port,
+                    status_file=args.status_file)
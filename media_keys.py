@@ -0,0 +1,90 @@
+import queue
+import threading
+
+from loguru import logger
+
+
+def press_media_key(key):
+    import pyautogui
+    pyautogui.press(key)
+
+
+class MediaKeyWorker:
+    """Sends media keys from a dedicated thread so slow key injection never blocks the Tk thread.
+
+    Requests go through a bounded queue. Toggles that pile up while a press is in flight are
+    coalesced: an even number of pending play/pause toggles cancels out and sends nothing.
+    Problems (a full queue, a press that fails or takes longer than `timeout`) are passed to
+    `report`, which the app routes back to the Tk thread with root.after. A press that times out
+    is left running; presses that come in while it is still stuck are skipped, so stuck presses
+    never pile up.
+    """
+
+    def __init__(self, report=None, timeout=2.0, maxsize=16, press=press_media_key):
+        self.report = report or logger.warning
+        self.timeout = timeout
+        self.press = press
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._thread = None
+        self._presser = None  # Thread running the last press, which may still be stuck
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='media-keys', daemon=True)
+            self._thread.start()
+        return self
+
+    def toggle(self, key="playpause"):
+        """Queues a key press and returns immediately."""
+        try:
+            self._queue.put_nowait(key)
+        except queue.Full:
+            self.report(f"Media key queue full, dropped {key}")
+
+    def stop(self):
+        if self._thread is not None:
+            try:
+                self._queue.put(None, timeout=self.timeout)
+            except queue.Full:
+                pass  # The worker is stuck behind a press; it is a daemon thread, so leave it
+            self._thread.join(self.timeout + 1)
+            self._thread = None
+
+    def _run(self):
+        while True:
+            pending = [self._queue.get()]
+            while True:  # Coalesce everything that queued up while we were busy
+                try:
+                    pending.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = None in pending
+            counts = {}
+            for key in pending:
+                if key is not None:
+                    counts[key] = counts.get(key, 0) + 1
+            for key, count in counts.items():
+                if count % 2:
+                    self._press_with_timeout(key)
+            if stop:
+                return
+
+    def _press_with_timeout(self, key):
+        if self._presser is not None and self._presser.is_alive():
+            self.report(f"Media key {key} skipped, the previous press is still stuck")
+            return
+        errors = []
+
+        def press():
+            try:
+                self.press(key)
+            except Exception as e:
+                errors.append(e)
+
+        presser = self._presser = threading.Thread(target=press, name=f'media-key-{key}', daemon=True)
+        presser.start()
+        presser.join(self.timeout)
+        if presser.is_alive():
+            self.report(f"Media key {key} timed out after {self.timeout:.1f}s")
+        elif errors:
+            self.report(f"Media key {key} failed: {errors[0]}")
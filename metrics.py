@@ -0,0 +1,135 @@
+"""In-process histograms exposed in Prometheus text format, over local-only HTTP or as a file."""
+import bisect
+import functools
+import threading
+import time
+
+from loguru import logger
+
+# Tick lateness is normally a few ms; seconds mean the Tk thread was blocked
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # Last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def snapshot(self):
+        with self._lock:
+            return list(self.counts), self.sum, self.count
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._families = {}  # name -> (help, {labels tuple: Histogram})
+        self._lock = threading.Lock()
+
+    def histogram(self, name, help_text, buckets=LATENCY_BUCKETS, **labels):
+        """Returns the histogram for `name` and `labels`, creating it on first use."""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            _, series = self._families.setdefault(name, (help_text, {}))
+            if key not in series:
+                series[key] = Histogram(buckets)
+            return series[key]
+
+    def render(self):
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+        with self._lock:
+            families = [(name, help_text, list(series.items())) for name, (help_text, series) in self._families.items()]
+        for name, help_text, series in sorted(families):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} histogram')
+            for labels, histogram in sorted(series, key=lambda item: item[0]):
+                counts, total, count = histogram.snapshot()
+                label_text = ','.join(f'{key}="{value}"' for key, value in labels)
+                prefix = label_text + ',' if label_text else ''
+                cumulative = 0
+                for bound, bucket_count in zip(histogram.buckets + (float('inf'),), counts):
+                    cumulative += bucket_count
+                    le = '+Inf' if bound == float('inf') else repr(bound)
+                    lines.append(f'{name}_bucket{{{prefix}le="{le}"}} {cumulative}')
+                suffix = f'{{{label_text}}}' if label_text else ''
+                lines.append(f'{name}_sum{suffix} {total}')
+                lines.append(f'{name}_count{suffix} {count}')
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, path):
+        try:
+            with open(path, 'w') as f:
+                f.write(self.render())
+            logger.info("Wrote metrics to {}", path)
+        except OSError as e:
+            logger.error("Error writing metrics to {}: {}", path, e)
+
+
+METRICS = MetricsRegistry()
+
+TICK_LATENESS = METRICS.histogram('pymodoro_tick_lateness_seconds',
+                                  'How late each timer tick callback ran relative to when it was scheduled')
+
+
+def timed(operation):
+    """Decorator recording the call duration in pymodoro_operation_duration_seconds{operation=...}."""
+    histogram = METRICS.histogram('pymodoro_operation_duration_seconds',
+                                  'Duration of UI-thread operations', operation=operation)
+
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+class MetricsServer:
+    """Serves GET /metrics on 127.0.0.1 from a daemon thread."""
+
+    def __init__(self, port, registry=METRICS):
+        import http.server  # Here rather than at the top: it is slow to import and the server is opt-in
+        registry_ref = registry
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path != '/metrics':
+                    self.send_error(404)
+                    return
+                body = registry_ref.render().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Scrapes every few seconds would flood stderr
+
+        self.httpd = http.server.ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        self.httpd.daemon_threads = True
+        self.port = self.httpd.server_address[1]
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='metrics-server', daemon=True)
+
+    def start(self):
+        self._thread.start()
+        logger.info("Serving metrics on http://127.0.0.1:{}/metrics", self.port)
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,138 @@
+import json
+import os
+import tempfile
+import threading
+import time
+
+from loguru import logger
+
+RETRY_DELAY = 30  # Seconds before retrying a failed write
+
+
+def _replacement_mode(path):
+    """The permission bits `path` has, or the ones a plain open() would give a new file."""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def write_json_atomically(path, data):
+    """Writes `data` to a temp file next to `path` and renames it over `path`.
+
+    A crash at any point leaves either the old file or the new one, never a partial write.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + '.', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, _replacement_mode(path))  # mkstemp creates 0600
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class OptionsStore:
+    """Options kept in memory and written behind by a background thread.
+
+    update() only changes the in-memory values; the writer waits until no change has arrived
+    for `delay` seconds and then writes everything in one atomic write. flush() writes
+    synchronously, for shutdown.
+    """
+
+    def __init__(self, path, delay=0.5):
+        self.path = path
+        self.delay = delay
+        self.values = {}
+        self.writes = 0
+        self._dirty = False
+        self._write_due = 0.0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()  # Serializes the writer thread and flush()
+        self._thread = threading.Thread(target=self._run, name='options-writer', daemon=True)
+        self._thread.start()
+
+    def load(self):
+        """Reads the file into memory. Raises FileNotFoundError or json.JSONDecodeError like json.load."""
+        with open(self.path, 'r') as f:
+            options = json.load(f)
+        with self._condition:
+            self.values = dict(options)
+        return options
+
+    def set_aside_corrupt_file(self):
+        """Keeps an unreadable options file as <name>.corrupt instead of silently overwriting it."""
+        try:
+            os.replace(self.path, self.path + '.corrupt')
+            logger.warning("Moved unreadable options file to {}.corrupt", self.path)
+        except OSError as e:
+            logger.error("Could not move unreadable options file aside: {}", e)
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+    def update(self, **changes):
+        """Applies changes in memory and schedules a write if anything actually changed."""
+        with self._condition:
+            if all(key in self.values and self.values[key] == value for key, value in changes.items()):
+                return
+            self.values.update(changes)
+            self._dirty = True
+            self._write_due = time.monotonic() + self.delay
+            self._condition.notify()
+
+    def flush(self):
+        """Writes pending changes now and waits for the write to finish."""
+        with self._write_lock:
+            with self._condition:
+                if not self._dirty:
+                    return
+                snapshot = dict(self.values)
+                self._dirty = False
+            self._write(snapshot)
+
+    def close(self):
+        self.flush()
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+    def _write(self, snapshot):
+        try:
+            write_json_atomically(self.path, snapshot)
+            self.writes += 1
+            logger.info("Saved options to {}", self.path)
+        except OSError as e:
+            logger.error("Error saving options to {}: {}", self.path, e)
+            with self._condition:
+                # Keep the changes and try again later (or on flush), without spinning on a persistent error
+                self._dirty = True
+                self._write_due = time.monotonic() + RETRY_DELAY
+        except Exception as e:
+            logger.error("Unexpected error saving options: {}", e)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._dirty and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                # Debounce: wait until changes stop arriving for `delay` seconds
+                while self._dirty and not self._closed:
+                    remaining = self._write_due - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+            self.flush()
@@ -0,0 +1,107 @@
+import math
+import time
+
+if hasattr(time, 'CLOCK_BOOTTIME'):
+    def suspend_clock():
+        """Like time.monotonic() but keeps counting while the machine is suspended (Linux)."""
+        return time.clock_gettime(time.CLOCK_BOOTTIME)
+else:
+    # Windows' monotonic clock already counts suspended time; elsewhere the wall clock is the
+    # best available reference
+    suspend_clock = time.time
+
+
+class PhaseTimer:
+    """Countdown for a single phase, anchored to an absolute time.monotonic() deadline.
+
+    time_remaining is derived from the deadline rather than decremented per tick, so late
+    callbacks never accumulate drift: the error at any point is bounded by one tick.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.deadline = None        # Absolute clock value at which the phase ends (while running)
+        self.paused_remaining = 0.0  # Seconds left while not running
+
+    @property
+    def running(self):
+        return self.deadline is not None
+
+    def start(self, duration):
+        """Starts a phase of `duration` seconds.
+
+        If the previous deadline has already passed (the phase ended naturally) the new phase is
+        anchored to it rather than to now, so a late transition does not push the schedule back.
+        """
+        if self.running:
+            self.deadline = min(self.deadline, self.clock()) + duration
+        else:
+            self.paused_remaining = float(duration)
+
+    def set_remaining(self, seconds):
+        """Sets the remaining time, keeping the running/paused status."""
+        if self.running:
+            self.deadline = self.clock() + seconds
+        else:
+            self.paused_remaining = float(seconds)
+
+    def pause(self):
+        if self.running:
+            self.paused_remaining = max(0.0, self.deadline - self.clock())
+            self.deadline = None
+
+    def resume(self):
+        if not self.running:
+            self.deadline = self.clock() + self.paused_remaining
+
+    def remaining(self):
+        """Exact seconds left in the phase (negative once the deadline has passed)."""
+        if self.running:
+            return self.deadline - self.clock()
+        return self.paused_remaining
+
+    def seconds_remaining(self):
+        """Whole seconds left, rounded up so a fresh 25:00 phase reads 25:00 until a full second passes."""
+        return max(0, math.ceil(self.remaining() - 1e-9))
+
+    def next_tick_delay_ms(self, slack_ms=2):
+        """Milliseconds until the next whole-second boundary of the deadline.
+
+        Waking just past each boundary keeps the displayed value in step with the deadline no
+        matter how late the previous callback ran. `slack_ms` keeps wake-ups on the far side of
+        the boundary despite timer granularity.
+        """
+        if not self.running:
+            return 1000
+        remaining = self.deadline - self.clock()
+        if remaining <= 0:
+            return 0
+        until_boundary = remaining % 1.0
+        if until_boundary < 1e-6:
+            until_boundary = 1.0
+        return int(until_boundary * 1000) + slack_ms
+
+
+class SuspendDetector:
+    """Notices time that passed without `clock` seeing it, e.g. a laptop sleeping.
+
+    check() is called once per tick and returns the seconds `suspend_clock` advanced beyond
+    `clock` since the previous check, or 0 when that gap is under `threshold`. Call reset()
+    when ticking starts again after a stop, so time spent stopped is not reported.
+    """
+
+    def __init__(self, clock=time.monotonic, suspend_clock=suspend_clock, threshold=5.0):
+        self.clock = clock
+        self.suspend_clock = suspend_clock
+        self.threshold = threshold
+        self.reset()
+
+    def reset(self):
+        """Makes now the baseline for the next check."""
+        self.last = (self.clock(), self.suspend_clock())
+
+    def check(self):
+        now = (self.clock(), self.suspend_clock())
+        hidden = (now[1] - self.last[1]) - (now[0] - self.last[0])
+        self.last = now
+        return hidden if hidden > self.threshold else 0.0
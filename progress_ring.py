@@ -0,0 +1,39 @@
+import math
+import tkinter as tk
+
+
+class ProgressRing(tk.Canvas):
+    """Countdown digits inside a ring that drains as the phase runs out.
+
+    The track, arc and text items are created once. show() changes only the arc's extent and
+    the text, and only when they would look different: the extent is rounded to the angle
+    that moves the arc's end by about a pixel. Calling show() more often than that (e.g. for a
+    smoother animation) therefore costs a comparison, not a redraw.
+    """
+
+    def __init__(self, parent, size=110, thickness=8, font=("Arial", 25), ring_color='#ffffff',
+                 track_color='#abdbe3', text_color='black', **kwargs):
+        super().__init__(parent, width=size, height=size, borderwidth=0, highlightthickness=0, **kwargs)
+        self.configure(bg=self.master.cget('bg'))  # Match parent background
+        inset = thickness / 2 + 1
+        box = (inset, inset, size - inset, size - inset)
+        self.degrees_per_pixel = 360 / (math.pi * (size - 2 * inset))
+        self._track = self.create_oval(*box, outline=track_color, width=thickness)
+        self._arc = self.create_arc(*box, start=90, extent=-359.9, style='arc', outline=ring_color, width=thickness)
+        self._text = self.create_text(size / 2, size / 2, text='00:00', font=font, fill=text_color)
+        self.extent = -359.9  # What the items currently show, so unchanged frames skip Tk
+        self.text = '00:00'
+
+    def show(self, fraction, text):
+        """Shows `fraction` (0 to 1) of the ring and `text` in the middle."""
+        fraction = min(max(fraction, 0.0), 1.0)
+        # Clockwise from 12 o'clock, stopping just short of 360 degrees, which Tk can fold to an empty arc
+        extent = -min(round(fraction * 360 / self.degrees_per_pixel) * self.degrees_per_pixel, 359.9)
+        if fraction == 1.0:
+            extent = -359.9
+        if extent != self.extent:
+            self.extent = extent
+            self.itemconfig(self._arc, extent=extent)
+        if text != self.text:
+            self.text = text
+            self.itemconfig(self._text, text=text)
@@ -0,0 +1,97 @@
+"""Crash-safe checkpoint of the running timer, so a restart can pick up where the last run left off.
+
+The checkpoint is one fixed-size record. It is rewritten only when the schedule changes
+(a transition, pause, resume or reset), never per tick: a running phase is stored as its
+wall-clock deadline, and the time left is worked out from that when the checkpoint is loaded.
+Each save writes the record to a temp file, fsyncs it and renames it over the journal, so a crash
+or power cut leaves either the old record or the new one.
+"""
+import math
+import os
+import struct
+import time
+from typing import NamedTuple, Optional
+
+from loguru import logger
+
+from engine import State
+
+MAGIC = b'PYMJ'
+VERSION = 1
+# magic, version, state, timer_active, rests, paused_remaining, phase_ends_at (NaN while paused), saved_at
+RECORD = struct.Struct('<4sHBBIddd')
+
+
+class Checkpoint(NamedTuple):
+    state: State
+    rests: int
+    timer_active: bool
+    paused_remaining: float  # Seconds left, if paused
+    phase_ends_at: Optional[float]  # Unix time the phase ends, if running
+    saved_at: float
+
+    def remaining(self, now=None):
+        """Seconds left in the phase now; negative once a running phase's deadline has passed."""
+        if self.phase_ends_at is None:
+            return self.paused_remaining
+        now = time.time() if now is None else now
+        return self.phase_ends_at - now
+
+
+class ResumeJournal:
+    def __init__(self, path):
+        self.path = path
+        self._last = None  # Record last written, minus saved_at, to skip rewriting an unchanged schedule
+
+    def save(self, state, rests, timer_active, remaining, phase_ends_at=None):
+        """Checkpoints the schedule. Ready has nothing to resume, so it clears the journal instead."""
+        if state == State.Ready:
+            self.clear()
+            return
+        # A running phase is fully described by its deadline; `remaining` only matters while paused
+        key = (state.value, timer_active, rests, None if phase_ends_at is not None else float(remaining), phase_ends_at)
+        if key == self._last:
+            return
+        record = RECORD.pack(MAGIC, VERSION, state.value, timer_active, rests, remaining,
+                             math.nan if phase_ends_at is None else phase_ends_at, time.time())
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(record)
+                f.flush()
+                os.fsync(f.fileno())  # Otherwise a power cut after the rename can leave an empty journal
+            os.replace(tmp_path, self.path)
+            self._last = key
+        except OSError as e:
+            logger.error("Could not write resume journal {}: {}", self.path, e)
+
+    def load(self):
+        """The last checkpoint, or None if there is none or it can't be read."""
+        try:
+            with open(self.path, 'rb') as f:
+                data = f.read(RECORD.size + 1)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.error("Could not read resume journal {}: {}", self.path, e)
+            return None
+        if len(data) != RECORD.size:
+            logger.warning("Ignoring malformed resume journal {}", self.path)
+            return None
+        magic, version, state, active, rests, paused_remaining, ends_at, saved_at = RECORD.unpack(data)
+        if magic != MAGIC or version != VERSION or state not in State._value2member_map_:
+            logger.warning("Ignoring unrecognized resume journal {}", self.path)
+            return None
+        return Checkpoint(State(state), rests, bool(active), paused_remaining,
+                          None if math.isnan(ends_at) else ends_at, saved_at)
+
+    def clear(self):
+        if self._last is None and not os.path.exists(self.path):
+            return
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error("Could not remove resume journal {}: {}", self.path, e)
+        self._last = None
@@ -0,0 +1,58 @@
+import glob
+import os
+import time
+
+from loguru import logger
+
+
+class SoundBank:
+    """Voice prompts decoded into memory so play() doesn't touch the disk when a transition fires.
+
+    preload() decodes prompts into pygame.mixer.Sound objects; the app runs it on its subsystem
+    thread once the mixer is up. Until a prompt is decoded (or if decoding it fails) play()
+    streams the file with pygame.mixer.music as before.
+    """
+
+    def __init__(self, sound_dir):
+        self.sound_dir = sound_dir
+        self.latencies = {}  # sound name -> list of play latencies in seconds
+        self._sounds = {}  # sound name -> pygame.mixer.Sound
+
+    def preload(self):
+        import pygame
+        for path in sorted(glob.glob(os.path.join(self.sound_dir, '*.mp3'))):
+            sound_name = os.path.splitext(os.path.basename(path))[0]
+            try:
+                self._sounds[sound_name] = pygame.mixer.Sound(path)
+            except pygame.error as e:
+                logger.warning("Could not preload sound {}, it will be streamed from disk. Pygame error: {}", sound_name, e)
+        logger.debug('Preloaded {} sounds from {}', len(self._sounds), self.sound_dir)
+
+    def is_loaded(self, sound_name):
+        return sound_name in self._sounds
+
+    def play(self, sound_name):
+        """Plays a prompt, from memory if it has been decoded. Returns False if the file is missing."""
+        import pygame
+        start = time.perf_counter()
+        sound = self._sounds.get(sound_name)
+        if sound is not None:
+            sound.play()
+            source = 'memory'
+        else:
+            path = os.path.join(self.sound_dir, f"{sound_name}.mp3")
+            if not os.path.exists(path):
+                logger.warning("Audio file not found: {}", path)
+                return False
+            pygame.mixer.music.load(path)
+            pygame.mixer.music.play()
+            source = 'disk'
+        latency = time.perf_counter() - start
+        self.latencies.setdefault(sound_name, []).append(latency)
+        logger.debug("Playing sound {} from {} ({:.2f} ms)", sound_name, source, latency * 1000)
+        return True
+
+    def latency_stats(self):
+        """Returns {sound name: (plays, mean ms, max ms)} for every prompt played so far."""
+        return {sound_name: (len(samples), 1000 * sum(samples) / len(samples), 1000 * max(samples))
+                for sound_name, samples in self.latencies.items()}
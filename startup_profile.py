@@ -0,0 +1,51 @@
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# Taken when main.py first imports this module, i.e. before any of its heavy imports
+PROCESS_START = time.perf_counter()
+
+
+class StartupProfiler:
+    """Collects a per-phase startup timeline for --profile-startup. Does nothing when disabled.
+
+    Phases are also forwarded to `tracer` as startup spans when it is enabled.
+    """
+
+    def __init__(self, enabled=False, tracer=None):
+        self.enabled = enabled
+        self.tracer = tracer if tracer is not None and tracer.enabled else None
+        self.active = enabled or self.tracer is not None
+        self.phases = []  # (name, start, end, thread name), times relative to PROCESS_START
+
+    def record(self, name, start, end=None):
+        if self.active:
+            end = time.perf_counter() if end is None else end
+            if self.enabled:
+                self.phases.append((name, start - PROCESS_START, end - PROCESS_START, threading.current_thread().name))
+            if self.tracer is not None:
+                self.tracer.complete(name, start, end, category='startup')
+
+    @contextmanager
+    def phase(self, name):
+        if not self.active:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start)
+
+    def mark(self, name):
+        """Records an instantaneous milestone, e.g. the window first being mapped."""
+        now = time.perf_counter()
+        self.record(name, now, now)
+
+    def report(self, file=None):
+        file = file or sys.stderr
+        print('Startup timeline (ms since process start):', file=file)
+        for name, start, end, thread_name in sorted(self.phases, key=lambda phase: phase[1]):
+            duration = f'{(end - start) * 1000:8.1f} ms' if end > start else '           '
+            print(f'  {start * 1000:8.1f} -> {end * 1000:8.1f}  {duration}  {name} [{thread_name}]', file=file)
@@ -0,0 +1,64 @@
+import threading
+
+from loguru import logger
+
+
+class StateGraphicCache:
+    """Decodes the state graphics once and serves PhotoImages keyed by state.
+
+    PNG decoding can run on a background thread; PhotoImages are Tk objects, so they are only
+    created on the Tk thread, the first time each key is shown. PIL is imported on first use.
+    """
+
+    def __init__(self, paths, photo_factory=None):
+        self.paths = paths
+        self.photo_factory = photo_factory
+        self._images = {}  # key -> decoded PIL image
+        self._photos = {}  # key -> PhotoImage
+        self._lock = threading.Lock()
+        self._preload_thread = None
+
+    def preload_in_background(self):
+        """Starts decoding every graphic on a daemon thread."""
+        if self._preload_thread is None:
+            self._preload_thread = threading.Thread(target=self.preload, name='state-graphics-preload', daemon=True)
+            self._preload_thread.start()
+        return self._preload_thread
+
+    def preload(self):
+        for key in self.paths:
+            try:
+                self._decoded(key)
+            except OSError as e:
+                logger.error('Failed to preload state graphic {}: {}', key, e)
+        logger.debug('Preloaded {} state graphics', len(self._images))
+
+    def _decoded(self, key):
+        with self._lock:
+            image = self._images.get(key)
+            if image is None:
+                import PIL.Image
+                image = PIL.Image.open(self.paths[key])
+                image.load()  # Force the decode now rather than on first use
+                self._images[key] = image
+            return image
+
+    def get(self, key):
+        """Returns the PhotoImage for `key`, decoding synchronously only if preloading hasn't reached it yet."""
+        photo = self._photos.get(key)
+        if photo is None:
+            if self.photo_factory is None:
+                import PIL.ImageTk
+                self.photo_factory = PIL.ImageTk.PhotoImage
+            photo = self.photo_factory(self._decoded(key))
+            self._photos[key] = photo
+        return photo
+
+
+def graphic_key(state_name, rests):
+    """Maps a state and completed-rest count to its image_dict key, e.g. ('Working', 1) -> 'Working2'."""
+    if state_name == 'Ready':
+        return 'Ready'
+    if state_name == 'Rest':
+        return f'Rest{rests}'  # rests already counts the rest in progress
+    return f'{state_name}{rests + 1}'
@@ -0,0 +1,154 @@
+"""Fixed-layout, memory-mapped status file for status bars (polybar, tmux, ...).
+
+The app rewrites the record in place on every tick and state change. Readers map the file
+once and copy the record out, so a read costs a memory copy: no subprocess, socket or GUI
+import. A sequence counter (a seqlock) keeps reads consistent. The writer makes it odd before
+changing the record and even afterwards, and a reader retries if the counter was odd or moved
+while it copied.
+
+    python status_file.py                       # Working 12:34
+    python status_file.py --format '{state} {minutes:02}:{seconds:02} ({rests} rests)'
+"""
+import argparse
+import math
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+from typing import NamedTuple, Optional
+
+MAGIC = b'PYMO'
+VERSION = 1
+# magic, version, seq | pid, state, timer_active, rests, time_remaining, phase_ends_at, updated_at
+HEADER = struct.Struct('<4sHxxQ')
+RECORD = struct.Struct('<IBBxxIidd')
+SIZE = 64
+STATE_NAMES = ('Ready', 'Working', 'Rest', 'LongRest')  # engine.State values
+NOT_RUNNING = math.nan  # phase_ends_at while paused or Ready
+
+
+def default_path():
+    path = os.environ.get('PYMODORO_STATUS_FILE')
+    if path:
+        return path
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+    uid = os.getuid() if hasattr(os, 'getuid') else 0
+    return os.path.join(runtime_dir, f'pymodoro-{uid}.status')
+
+
+class Status(NamedTuple):
+    state: str
+    rests: int
+    time_remaining: int  # As of the last write; see remaining()
+    timer_active: bool
+    phase_ends_at: Optional[float]  # Unix time, None unless running
+    updated_at: float
+    pid: int
+
+    def remaining(self, now=None):
+        """Whole seconds left right now, counting down between writes while the timer runs."""
+        if self.phase_ends_at is None:
+            return self.time_remaining
+        now = time.time() if now is None else now
+        return max(0, math.ceil(self.phase_ends_at - now))
+
+
+class StatusFileWriter:
+    def __init__(self, path):
+        self.path = path
+        self.seq = 0
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            os.ftruncate(fd, SIZE)
+            self.map = mmap.mmap(fd, SIZE)
+        finally:
+            os.close(fd)
+        self.map[:HEADER.size] = HEADER.pack(MAGIC, VERSION, self.seq)
+
+    def write(self, state, rests, time_remaining, timer_active, phase_ends_at=None, pid=None):
+        record = RECORD.pack(os.getpid() if pid is None else pid, state, timer_active, rests, time_remaining,
+                             NOT_RUNNING if phase_ends_at is None else phase_ends_at, time.time())
+        self.seq += 1  # Odd: write in progress
+        self.map[8:16] = struct.pack('<Q', self.seq)
+        self.map[HEADER.size:HEADER.size + RECORD.size] = record
+        self.seq += 1  # Even: consistent
+        self.map[8:16] = struct.pack('<Q', self.seq)
+
+    def close(self):
+        """Marks the record as no longer live (pid 0) for readers that still have it mapped, then removes it."""
+        self.write(0, 0, 0, False, pid=0)
+        self.map.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+class StatusFileReader:
+    def __init__(self, path=None, retries=100):
+        self.path = path or default_path()
+        self.retries = retries
+        self.map = None
+
+    def _open(self):
+        try:
+            with open(self.path, 'rb') as f:
+                self.map = mmap.mmap(f.fileno(), SIZE, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            self.map = None  # Not running, or the file is still being created
+        return self.map
+
+    def read(self):
+        """The latest consistent Status, or None if Pymodoro isn't running."""
+        for reopen in (False, True):
+            if (self.map is None or reopen) and self._open() is None:
+                return None
+            status = self._read_record()
+            if status is not None and status.pid:
+                return status
+            # A closed (pid 0) record: the instance exited, maybe a new one has written a new file
+            if self.map is not None:
+                self.map.close()
+                self.map = None
+        return None
+
+    def _read_record(self):
+        data = self.map
+        for _ in range(self.retries):
+            magic, version, seq = HEADER.unpack_from(data, 0)
+            if magic != MAGIC or version != VERSION:
+                return None
+            if seq % 2:
+                continue  # Writer is mid-update
+            pid, state, active, rests, remaining, ends_at, updated_at = RECORD.unpack_from(data, HEADER.size)
+            if HEADER.unpack_from(data, 0)[2] == seq:
+                return Status(STATE_NAMES[state] if state < len(STATE_NAMES) else str(state), rests, remaining,
+                              bool(active), None if math.isnan(ends_at) else ends_at, updated_at, pid)
+        return None
+
+    def close(self):
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Print the running Pymodoro phase from its status file')
+    parser.add_argument('--path', default=None, help=f'status file (default: {default_path()})')
+    parser.add_argument('--format', default='{state}{paused} {minutes:02}:{seconds:02}',
+                        help='str.format template; fields: state, paused, minutes, seconds, rests')
+    args = parser.parse_args(argv)
+    status = StatusFileReader(args.path).read()
+    if status is None:
+        return 1
+    minutes, seconds = divmod(status.remaining(), 60)
+    paused = ' (paused)' if not status.timer_active and status.state != 'Ready' else ''
+    print(args.format.format(state=status.state, paused=paused, minutes=minutes, seconds=seconds,
+                             rests=status.rests))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""Local-only HTTP status API: GET /status for a snapshot, GET /events for a Server-Sent Events stream.
+
+The app calls publish() from the Tk thread. Each snapshot is serialized once, both as the
+/status body and as an SSE frame, and the same bytes are written to every client. A client
+that falls behind skips straight to the latest frame rather than queueing old ones.
+"""
+import json
+import threading
+
+from loguru import logger
+
+KEEPALIVE_SECONDS = 15  # Comment lines on idle streams, so dead clients are noticed and proxies don't time out
+
+
+class StatusServer:
+    def __init__(self, port, on_subscribe=None):
+        import http.server  # Here rather than at the top: it is slow to import and the server is opt-in
+        self.on_subscribe = on_subscribe  # Called from a server thread when a stream opens
+        self.subscribers = 0
+        self._body = b'{}'
+        self._frame = b''
+        self._version = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                if self.path == '/status':
+                    server._send_snapshot(self)
+                elif self.path == '/events':
+                    server._stream(self)
+                else:
+                    self.send_error(404)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = http.server.ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        self.httpd.daemon_threads = True
+        self.port = self.httpd.server_address[1]
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='status-server', daemon=True)
+
+    def start(self):
+        self._thread.start()
+        logger.info("Serving status on http://127.0.0.1:{}/status and /events", self.port)
+        return self
+
+    def stop(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def publish(self, snapshot, event='tick'):
+        """Serializes `snapshot` once and wakes every stream."""
+        data = json.dumps(snapshot, separators=(',', ':'))
+        frame = f'event: {event}\ndata: {data}\n\n'.encode()
+        with self._condition:
+            self._body = data.encode()
+            self._frame = frame
+            self._version += 1
+            self._condition.notify_all()
+
+    def _send_snapshot(self, request):
+        body = self._body  # One reference read; publish() swaps in a new bytes object
+        request.send_response(200)
+        request.send_header('Content-Type', 'application/json')
+        request.send_header('Content-Length', str(len(body)))
+        request.send_header('Cache-Control', 'no-store')
+        request.end_headers()
+        request.wfile.write(body)
+
+    def _stream(self, request):
+        request.send_response(200)
+        request.send_header('Content-Type', 'text/event-stream')
+        request.send_header('Cache-Control', 'no-store')
+        request.send_header('Connection', 'close')
+        request.end_headers()
+        request.close_connection = True
+        with self._condition:
+            self.subscribers += 1
+            version, frame = self._version, self._frame
+        try:
+            if self.on_subscribe is not None:
+                self.on_subscribe()
+            while True:
+                request.wfile.write(frame or b': no status yet\n\n')
+                request.wfile.flush()
+                with self._condition:
+                    if not self._condition.wait_for(lambda: self._version != version or self._closed,
+                                                    KEEPALIVE_SECONDS):
+                        frame = b': keepalive\n\n'
+                        continue
+                    if self._closed:
+                        return
+                    version, frame = self._version, self._frame
+        except OSError:
+            pass  # Client disconnected
+        finally:
+            with self._condition:
+                self.subscribers -= 1
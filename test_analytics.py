@@ -0,0 +1,115 @@
+import datetime
+import os
+import tempfile
+import unittest
+
+from analytics import Analytics
+from engine import State
+from history import EventKind, HistoryStore
+
+
+class TestAnalytics(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, 'history.sqlite3')
+        self.history = HistoryStore(self.path)
+        self.addCleanup(self.history.close)
+        self.analytics = Analytics(self.path)
+
+    def ts(self, month, day, hour=12):
+        return datetime.datetime(2026, month, day, hour).timestamp()
+
+    def record_work(self, ts, elapsed=1500, kind=EventKind.Transition):
+        self.history.record(kind, State.Working, State.Rest, 1, elapsed, ts=ts)
+
+    def refresh(self):
+        self.history.flush()
+        return self.analytics.refresh()
+
+    def test_empty_history(self):
+        self.assertEqual(self.analytics.refresh(), 0)  # No database file yet
+        summary = self.analytics.summary(today=datetime.date(2026, 3, 8))
+        self.assertEqual(summary['focus_minutes_this_week'], 0.0)
+        self.assertIsNone(summary['completion_rate_last_30_days'])
+        self.assertEqual((summary['longest_streak'], summary['current_streak']), (0, 0))
+
+    def test_matches_the_sql_queries(self):
+        for day in (1, 2, 3, 5, 6):
+            self.record_work(self.ts(3, day))
+        self.record_work(self.ts(3, 4), elapsed=600, kind=EventKind.Skip)
+        self.history.record(EventKind.Transition, State.Rest, State.Working, 1, 300, ts=self.ts(3, 3))
+        self.record_work(self.ts(3, 4), elapsed=400, kind=EventKind.CatchUp)  # Joins the two runs
+        self.record_work(self.ts(3, 7), elapsed=0.0, kind=EventKind.CatchUp)  # Passed whole while asleep
+        self.refresh()
+        start, end = datetime.date(2026, 3, 2).toordinal(), datetime.date(2026, 3, 8).toordinal()
+        self.assertEqual(self.analytics.focus_minutes(start, end), self.history.focus_minutes(start, end))
+        self.assertEqual(self.analytics.streaks(datetime.date(2026, 3, 6))[0], self.history.longest_streak())
+        self.assertEqual(self.history.longest_streak(), 6)
+
+    def test_completion_rate_and_pauses(self):
+        self.record_work(self.ts(3, 2))
+        self.record_work(self.ts(3, 2), kind=EventKind.CatchUp)
+        self.record_work(self.ts(3, 3), elapsed=100, kind=EventKind.Skip)
+        self.history.record(EventKind.Reset, State.Working, State.Ready, 0, 50, ts=self.ts(3, 3))
+        self.history.record(EventKind.Reset, State.Rest, State.Ready, 0, 50, ts=self.ts(3, 3))  # Not a Working phase
+        self.history.record(EventKind.Pause, State.Working, State.Working, 0, ts=self.ts(3, 3))
+        self.history.record(EventKind.Pause, State.Rest, State.Rest, 1, ts=self.ts(3, 10))
+        self.refresh()
+        day = datetime.date(2026, 3, 3).toordinal()
+        self.assertEqual(self.analytics.completion_rate(day - 1, day), 0.5)
+        self.assertEqual(self.analytics.pauses(day - 1, day), 1)
+        self.assertEqual(self.analytics.pauses(0, 10**6), 2)
+
+    def test_only_the_awake_part_of_a_catch_up_counts_as_completed(self):
+        # Asleep through two Working phases: the first was partly run, the second skipped outright
+        ts = self.ts(3, 2)
+        self.history.record(EventKind.CatchUp, State.Working, State.Rest, 1, 600, ts=ts)
+        self.history.record(EventKind.CatchUp, State.Rest, State.Working, 1, 0.0, ts=ts)
+        self.history.record(EventKind.CatchUp, State.Working, State.Rest, 2, 0.0, ts=ts)
+        self.history.record(EventKind.CatchUp, State.Rest, State.Working, 2, 0.0, ts=ts)
+        self.record_work(ts, elapsed=100, kind=EventKind.Skip)
+        self.refresh()
+        day = datetime.date(2026, 3, 2).toordinal()
+        self.assertEqual(self.analytics.rollup.total('completed', day, day), 1)
+        self.assertEqual(self.analytics.completion_rate(day, day), 0.5)
+        self.assertEqual(self.analytics.focus_minutes(day, day), 700 / 60)
+
+    def test_daily_and_weekly_focus(self):
+        self.record_work(self.ts(3, 1))   # Sunday
+        self.record_work(self.ts(3, 2))   # Monday
+        self.record_work(self.ts(3, 2), elapsed=600, kind=EventKind.Skip)
+        self.record_work(self.ts(3, 16))  # Two weeks on, with an empty week between
+        self.refresh()
+        days, minutes = self.analytics.daily_focus_minutes(datetime.date(2026, 2, 28).toordinal(),
+                                                           datetime.date(2026, 3, 3).toordinal())
+        self.assertEqual(minutes.tolist(), [0, 25, 35, 0])
+        mondays, minutes = self.analytics.weekly_focus_minutes()
+        self.assertEqual([datetime.date.fromordinal(int(day)) for day in mondays],
+                         [datetime.date(2026, 2, 23), datetime.date(2026, 3, 2), datetime.date(2026, 3, 9),
+                          datetime.date(2026, 3, 16)])
+        self.assertEqual(minutes.tolist(), [25, 35, 0, 25])
+
+    def test_current_streak_survives_until_the_day_is_over(self):
+        for day in (2, 3, 4):
+            self.record_work(self.ts(3, day))
+        self.refresh()
+        self.assertEqual(self.analytics.streaks(datetime.date(2026, 3, 4)), (3, 3))
+        self.assertEqual(self.analytics.streaks(datetime.date(2026, 3, 5)), (3, 3))
+        self.assertEqual(self.analytics.streaks(datetime.date(2026, 3, 6)), (3, 0))
+
+    def test_refresh_loads_only_new_rows(self):
+        self.record_work(self.ts(3, 2))
+        self.assertEqual(self.refresh(), 1)
+        rollup = self.analytics.rollup
+        self.assertEqual(self.refresh(), 0)
+        self.assertIs(self.analytics.rollup, rollup)  # Cached while nothing changed
+        self.record_work(self.ts(3, 3))
+        self.assertEqual(self.refresh(), 1)
+        self.assertEqual(len(self.analytics.events), 2)
+        self.assertEqual(self.analytics.focus_minutes(0, 10**6), 50.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
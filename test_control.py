@@ -0,0 +1,82 @@
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from control import AlreadyRunning, ControlServer, format_status, run_client, send_command
+
+STATUS = {'state': 'Working', 'rests': 1, 'time_remaining': 754, 'timer_active': True}
+
+
+@unittest.skipUnless(hasattr(socket, 'AF_UNIX'), 'needs Unix-domain sockets')
+class TestControlSocket(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.address = (socket.AF_UNIX, os.path.join(directory.name, 'pymodoro.sock'))
+        self.handler = MagicMock(return_value={'ok': True, 'status': STATUS})
+
+    def start_server(self):
+        server = ControlServer.bind(self.address).start(self.handler)
+        self.addCleanup(server.close)
+        return server
+
+    def test_command_round_trip(self):
+        self.start_server()
+        self.assertEqual(send_command('skip', self.address), {'ok': True, 'status': STATUS})
+        self.handler.assert_called_once_with('skip')
+
+    def test_unknown_command_is_rejected_without_calling_the_app(self):
+        self.start_server()
+        reply = send_command('quit', self.address)
+        self.assertFalse(reply['ok'])
+        self.handler.assert_not_called()
+
+    def test_handler_errors_are_reported(self):
+        self.handler.side_effect = RuntimeError('boom')
+        self.start_server()
+        self.assertEqual(send_command('go', self.address), {'ok': False, 'error': 'boom'})
+
+    def test_second_instance_is_refused(self):
+        self.start_server()
+        with self.assertRaises(AlreadyRunning):
+            ControlServer.bind(self.address)
+
+    def test_stale_socket_from_a_crash_is_replaced(self):
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(self.address[1])
+        stale.close()  # The file stays behind, but nobody is listening
+        self.start_server()
+        self.assertTrue(send_command('status', self.address)['ok'])
+
+    def test_socket_is_private_and_removed_on_close(self):
+        server = ControlServer.bind(self.address).start(self.handler)
+        self.assertEqual(os.stat(self.address[1]).st_mode & 0o777, 0o600)
+        server.close()
+        self.assertFalse(os.path.exists(self.address[1]))
+
+    def test_client_reports_when_nothing_is_running(self):
+        with patch('control.control_address', return_value=self.address), patch('sys.stderr'):
+            self.assertEqual(run_client(['status']), 1)
+
+
+class TestControlClient(unittest.TestCase):
+
+    def test_format_status(self):
+        self.assertEqual(format_status(STATUS), 'Working 12:34, 1 rests')
+        self.assertEqual(format_status(dict(STATUS, timer_active=False)), 'Working (paused) 12:34, 1 rests')
+
+    def test_client_does_not_import_gui_modules(self):
+        code = ("import sys, control; "
+                "print(sorted(m for m in ('tkinter', 'pygame', 'PIL', 'loguru') if m in sys.modules))")
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout
+        self.assertEqual(output.strip(), '[]')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import random
+import unittest
+
+from engine import EngineFleet, PomodoroEngine, State, Transition, cycle_length, timer_dict
+
+
+class TestPomodoroEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = PomodoroEngine()
+
+    def test_full_cycle(self):
+        expected = [(State.Working, 0, None),
+                    (State.Rest, 1, "lets_take_a_quick_break"),
+                    (State.Working, 1, "lets_get_back_to_work"),
+                    (State.Rest, 2, "lets_take_a_quick_break"),
+                    (State.Working, 2, "lets_get_back_to_work"),
+                    (State.Rest, 3, "lets_take_a_quick_break"),
+                    (State.Working, 3, "lets_get_back_to_work"),
+                    (State.LongRest, 0, "lets_take_a_longer_break"),
+                    (State.Working, 0, "lets_get_back_to_work")]
+        for state, rests, prompt in expected:
+            event = self.engine.transition()
+            self.assertEqual((event.state, event.rests, event.prompt), (state, rests, prompt))
+            self.assertEqual(self.engine.time_remaining, timer_dict[state.name])
+
+    def test_ready_engine_does_not_tick(self):
+        self.assertEqual(self.engine.advance(10_000), [])
+        self.assertEqual(self.engine.state, State.Ready)
+
+    def test_tick_fires_transition_at_zero(self):
+        self.engine.transition()
+        self.engine.time_remaining = 2
+        self.assertEqual(self.engine.tick(), [])
+        events = self.engine.tick()
+        self.assertEqual(events, [Transition(State.Working, State.Rest, 1, "lets_take_a_quick_break")])
+        self.assertEqual(self.engine.time_remaining, timer_dict['Rest'])
+
+    def test_advance_carries_overflow_across_phases(self):
+        self.engine.transition()
+        events = self.engine.advance(timer_dict['Working'] + timer_dict['Rest'] + 10)
+        self.assertEqual([e.state for e in events], [State.Rest, State.Working])
+        self.assertEqual(self.engine.time_remaining, timer_dict['Working'] - 10)
+
+    def test_paused_engine_does_not_advance(self):
+        self.engine.transition()
+        self.engine.pause()
+        self.engine.advance(60)
+        self.assertEqual(self.engine.time_remaining, timer_dict['Working'])
+
+    def test_listeners_receive_transitions(self):
+        received = []
+        self.engine.listeners.append(received.append)
+        self.engine.transition()
+        self.engine.skip()
+        self.assertEqual([e.state for e in received], [State.Working, State.Rest])
+
+
+class TestEngineFleet(unittest.TestCase):
+
+    def test_fleet_matches_ticking_engines(self):
+        rng = random.Random(7)
+        engines = []
+        for _ in range(20):
+            engine = PomodoroEngine()
+            engine.transition()
+            engine.advance(rng.randrange(cycle_length()))
+            engines.append(engine)
+        fleet = EngineFleet.from_engines(engines)
+        for seconds in (1, 299, 1500, 3 * cycle_length() + 17):
+            transitions = fleet.advance(seconds)
+            for i, engine in enumerate(engines):
+                self.assertEqual(transitions[i], len(engine.advance(seconds)))
+                copy = fleet.engine(i)
+                self.assertEqual((copy.state, copy.rests, copy.time_remaining),
+                                 (engine.state, engine.rests, engine.time_remaining))
+
+    def test_start_all_and_skip_whole_cycles(self):
+        fleet = EngineFleet(1000)
+        self.assertEqual(fleet.advance(3600), [0] * 1000)
+        fleet.start_all()
+        transitions = fleet.advance(10 * cycle_length())
+        self.assertEqual(set(transitions), {80})
+        self.assertEqual(fleet.engine(0).state, State.Working)
+        self.assertEqual(fleet.engine(0).time_remaining, timer_dict['Working'])
+
+
+if __name__ == '__main__':
+    unittest.main()
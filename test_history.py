@@ -0,0 +1,68 @@
+import datetime
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from engine import State
+from history import EventKind, HistoryStore, day_of
+
+
+class TestHistoryStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, 'history.sqlite3')
+        self.history = HistoryStore(self.path)
+        self.addCleanup(self.history.close)
+
+    def ts(self, year, month, day, hour=12):
+        return datetime.datetime(year, month, day, hour).timestamp()
+
+    def record_work(self, ts, elapsed=1500, kind=EventKind.Transition):
+        self.history.record(kind, State.Working, State.Rest, 1, elapsed, ts=ts)
+
+    def test_queries_on_empty_history(self):
+        self.assertEqual(self.history.focus_minutes(0, 10**6), 0.0)
+        self.assertEqual(self.history.longest_streak(), 0)
+
+    def test_events_are_written_in_wal_mode(self):
+        self.record_work(self.ts(2026, 3, 2))
+        self.history.record(EventKind.Pause, State.Rest, State.Rest, 1, ts=self.ts(2026, 3, 2, 13))
+        self.history.flush()
+        connection = sqlite3.connect(self.path)
+        self.addCleanup(connection.close)
+        self.assertEqual(connection.execute('PRAGMA journal_mode').fetchone()[0], 'wal')
+        rows = connection.execute('SELECT kind, from_state, to_state, day FROM events ORDER BY id').fetchall()
+        self.assertEqual(rows, [(EventKind.Transition, State.Working.value, State.Rest.value, day_of(self.ts(2026, 3, 2))),
+                                (EventKind.Pause, State.Rest.value, State.Rest.value, day_of(self.ts(2026, 3, 2)))])
+        plan = ' '.join(row[-1] for row in connection.execute(
+            'EXPLAIN QUERY PLAN SELECT TOTAL(elapsed) FROM events WHERE from_state = 1 AND day BETWEEN 1 AND 2'))
+        self.assertIn('events_state_day', plan)
+
+    def test_focus_minutes_counts_skipped_work_but_not_rest(self):
+        self.record_work(self.ts(2026, 3, 2))
+        self.record_work(self.ts(2026, 3, 3), elapsed=600, kind=EventKind.Skip)
+        self.history.record(EventKind.Transition, State.Rest, State.Working, 1, 300, ts=self.ts(2026, 3, 3))
+        self.record_work(self.ts(2026, 3, 9))  # Following week
+        self.history.flush()
+        self.assertEqual(self.history.focus_minutes_this_week(today=datetime.date(2026, 3, 8)), 35.0)
+
+    def test_longest_streak_uses_completed_work_only(self):
+        for day in (1, 2, 3, 5, 6):
+            self.record_work(self.ts(2026, 3, day))
+        self.record_work(self.ts(2026, 3, 4), kind=EventKind.Skip)
+        self.history.flush()
+        self.assertEqual(self.history.longest_streak(), 3)
+
+    def test_catch_up_counts_as_completed_only_if_some_of_it_ran(self):
+        self.record_work(self.ts(2026, 3, 1), elapsed=600, kind=EventKind.CatchUp)  # Partly run, then asleep
+        self.record_work(self.ts(2026, 3, 2), elapsed=0.0, kind=EventKind.CatchUp)  # Passed whole while asleep
+        self.record_work(self.ts(2026, 3, 3))
+        self.history.flush()
+        self.assertEqual(self.history.completed_work_days(), [datetime.date(2026, 3, d).toordinal() for d in (1, 3)])
+
+
+if __name__ == '__main__':
+    unittest.main()
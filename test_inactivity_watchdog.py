@@ -0,0 +1,94 @@
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from inactivity_watchdog import InactivityWatchdog, in_quiet_hours, next_prompt_time, validate_quiet_hours
+
+
+def at(day, hour, minute=0):
+    return datetime(2026, 1, day, hour, minute).timestamp()
+
+
+class TestQuietHours(unittest.TestCase):
+
+    def test_window_is_half_open(self):
+        self.assertFalse(in_quiet_hours(6, [[7, 16]]))
+        self.assertTrue(in_quiet_hours(7, [[7, 16]]))
+        self.assertTrue(in_quiet_hours(15, [[7, 16]]))
+        self.assertFalse(in_quiet_hours(16, [[7, 16]]))
+
+    def test_window_can_wrap_midnight(self):
+        self.assertTrue(in_quiet_hours(23, [[22, 6]]))
+        self.assertTrue(in_quiet_hours(0, [[22, 6]]))
+        self.assertFalse(in_quiet_hours(6, [[22, 6]]))
+
+    def test_prompt_outside_quiet_hours_is_threshold_after_interaction(self):
+        self.assertEqual(next_prompt_time(at(5, 4), 3600, [[7, 16]]), at(5, 5))
+
+    def test_prompt_in_quiet_hours_moves_to_window_end(self):
+        self.assertEqual(next_prompt_time(at(5, 6, 30), 3600, [[7, 16]]), at(5, 16))
+        self.assertEqual(next_prompt_time(at(5, 22), 3600, [[22, 6]]), at(6, 6))
+
+    def test_chained_windows_are_skipped_together(self):
+        self.assertEqual(next_prompt_time(at(5, 6, 30), 3600, [[7, 12], [12, 18]]), at(5, 18))
+
+    def test_always_quiet_never_prompts(self):
+        self.assertIsNone(next_prompt_time(at(5, 6), 3600, [[0, 24]]))
+
+    def test_validation(self):
+        self.assertEqual(validate_quiet_hours([(7, 16)]), [[7, 16]])
+        for invalid in ([[7, 25]], [[7]], [["7", 16]], 7):
+            with self.assertRaises((TypeError, ValueError)):
+                validate_quiet_hours(invalid)
+
+
+class TestInactivityWatchdog(unittest.TestCase):
+
+    def setUp(self):
+        self.now = at(5, 4)
+        self.root = MagicMock()
+        self.on_due = MagicMock()
+        self.watchdog = InactivityWatchdog(self.root, self.on_due, threshold=3600, quiet_hours=[[7, 16]],
+                                           clock=lambda: self.now)
+
+    def test_arms_one_deadline_when_activated(self):
+        self.watchdog.set_active(True)
+        self.watchdog.set_active(True)
+        self.root.after.assert_called_once_with(3600 * 1000 + 1, self.watchdog.check)
+
+    def test_deactivating_cancels_the_deadline(self):
+        self.watchdog.set_active(True)
+        self.watchdog.set_active(False)
+        self.root.after_cancel.assert_called_once_with(self.root.after.return_value)
+
+    def test_interaction_is_picked_up_lazily(self):
+        self.watchdog.set_active(True)
+        self.now += 1800
+        self.watchdog.touch()
+        self.root.after.assert_called_once()  # Not rescheduled on touch
+        self.now += 1800
+        self.watchdog.check()
+        self.on_due.assert_not_called()
+        self.root.after.assert_called_with(1800 * 1000 + 1, self.watchdog.check)
+
+    def test_due_when_inactive_for_threshold(self):
+        self.watchdog.set_active(True)
+        self.now += 3600
+        self.watchdog.check()
+        self.on_due.assert_called_once()
+
+    def test_inactive_watchdog_ignores_stale_callbacks(self):
+        self.watchdog.set_active(True)
+        self.watchdog.set_active(False)
+        self.now += 3600
+        self.watchdog.check()
+        self.on_due.assert_not_called()
+
+    def test_reconfigure_rearms(self):
+        self.watchdog.set_active(True)
+        self.watchdog.configure(600, [])
+        self.root.after.assert_called_with(600 * 1000 + 1, self.watchdog.check)
+
+
+if __name__ == '__main__':
+    unittest.main()
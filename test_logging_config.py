@@ -0,0 +1,78 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+from loguru import logger
+
+import logging_config
+from logging_config import configure_logger, flush_logs, level_enabled, set_context, validate_log_level
+
+
+class TestLoggingConfig(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'pymodoro.jsonl')
+        self.context = {'state': 'Working', 'rests': 2, 'time_remaining': 754}
+        set_context(lambda: self.context)
+        self.addCleanup(set_context, None)
+        self.addCleanup(logger.add, sys.stderr)  # Back to loguru's default sink for the other tests
+        self.addCleanup(logger.remove)
+        level = patch.object(logging_config, '_level', None)
+        level.start()
+        self.addCleanup(level.stop)
+
+    def lines(self):
+        flush_logs()
+        with open(self.path) as f:
+            return [json.loads(line) for line in f]
+
+    def test_file_sink_writes_json_lines_with_timer_fields(self):
+        configure_logger('info', log_file=self.path)
+        logger.info('Loaded {} from {}', {'a': 1}, 'options.json')
+        self.context = dict(self.context, time_remaining=753)
+        logger.warning('literal {braces} without arguments')
+        first, second = self.lines()
+        self.assertEqual(first['message'], "Loaded {'a': 1} from options.json")
+        self.assertEqual((first['level'], first['state'], first['rests'], first['time_remaining']),
+                         ('INFO', 'Working', 2, 754))
+        self.assertEqual(second['message'], 'literal {braces} without arguments')
+        self.assertEqual(second['time_remaining'], 753)  # Captured when logged, not when written
+
+    def test_disabled_levels_are_neither_formatted_nor_given_context(self):
+        configure_logger('INFO', log_file=self.path)
+        calls = []
+        set_context(lambda: calls.append('context') or self.context)
+
+        class Expensive:
+            def __format__(self, spec):
+                calls.append('format')
+                return ''
+
+        logger.debug('Value {}', Expensive())
+        self.assertEqual(self.lines(), [])
+        self.assertEqual(calls, [])
+
+    def test_level_enabled_follows_the_configured_level(self):
+        self.assertFalse(level_enabled('TRACE'))  # loguru's default sink starts at DEBUG
+        self.assertTrue(level_enabled('DEBUG'))
+        configure_logger('trace', log_file=self.path)
+        self.assertTrue(level_enabled('TRACE'))
+        configure_logger('WARNING')
+        self.assertFalse(level_enabled('INFO'))
+        self.assertTrue(level_enabled('ERROR'))
+
+    def test_level_names_are_validated(self):
+        self.assertEqual(validate_log_level('trace'), 'TRACE')
+        for invalid in ('chatty', None, 10):
+            with self.assertRaises(ValueError):
+                validate_log_level(invalid)
+
+
+if __name__ == '__main__':
+    unittest.main()
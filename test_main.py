@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import patch, MagicMock, PropertyMock
+from unittest.mock import patch, MagicMock, PropertyMock, call, ANY
 import sys
 import os
 import json # Added for options testing
@@ -57,8 +57,17 @@ sys.modules['pygame'] = mock_pygame_global
 # Import main AFTER all crucial sys.modules mocks are in place
 import main # Needed to access main.script_dir
 from main import Pymodoro, State, timer_dict, OPTIONS_FILE # Added OPTIONS_FILE
+from sound_bank import SoundBank
+from status_file import StatusFileReader
+from resume_journal import ResumeJournal
 from datetime import datetime
 import time
+import tempfile
+import threading
+
+# Keep test sessions out of the real history database
+main.HISTORY_FILE = os.path.join(tempfile.mkdtemp(), 'history.sqlite3')
+main.RESUME_FILE = os.path.join(tempfile.mkdtemp(), 'resume.journal')
 
 class TestCheckInactivity(unittest.TestCase):
 
@@ -80,11 +89,16 @@ class TestCheckInactivity(unittest.TestCase):
         # Replace the 'music' attribute on the globally mocked pygame.mixer for this test's scope
         mock_pygame_global.mixer.music = self.mock_pygame_mixer_music
 
-        self.pymodoro = Pymodoro() # This will call mock_pygame_global.mixer.init()
+        self.pymodoro = Pymodoro() # This will call mock_pygame_global.mixer.init() on a background thread
 
+        self.assertTrue(self.pymodoro.subsystems_ready.wait(1))
         mock_pygame_global.mixer.init.assert_called_once()
 
-        self.pymodoro.last_interaction = time.time()
+        # Swap in a bank that hasn't preloaded anything so prompts take the streaming fallback path
+        self.pymodoro.sound_bank = SoundBank(os.path.join(main.script_dir, 'res'))
+
+        self.now = time.time()
+        self.pymodoro.inactivity_watchdog.clock = lambda: self.now
         self.pymodoro.timer_active = False
         self.pymodoro.state = State.Ready
         self.pymodoro.time_remaining = timer_dict[self.pymodoro.state.name]
@@ -104,122 +118,186 @@ class TestCheckInactivity(unittest.TestCase):
         self.pymodoro.voice_active_var.set(True)
 
 
-    @patch('main.messagebox.askyesno')
-    @patch('main.time.time')
-    @patch('main.datetime')
-    def test_inactivity_check_not_triggered_within_window(self, mock_datetime, mock_time, mock_askyesno):
-        mock_dt_instance = MagicMock()
-        mock_dt_instance.hour = 10
-        mock_datetime.now.return_value = mock_dt_instance
+    def at(self, hour, minute=0, second=0):
+        """A local time on an ordinary weekday, as the watchdog's clock sees it."""
+        return datetime(2026, 1, 5, hour, minute, second).timestamp()
+
+    def start_working(self, last_interaction):
+        self.now = last_interaction
+        self.pymodoro.update_interaction()
         self.pymodoro.state = State.Working
-        self.pymodoro.timer_active = True
-        self.pymodoro.last_interaction = 0
-        mock_time.return_value = 3601
+        self.pymodoro.timer_active = True  # Arms the watchdog
+
+    def fire_watchdog(self, now):
+        self.now = now
+        with patch('main.os.path.exists', return_value=True):
+            self.pymodoro.inactivity_watchdog.check()
 
-        self.pymodoro.check_inactivity()
+    @patch('main.InactivityPrompt')
+    def test_inactivity_check_not_triggered_within_window(self, mock_prompt):
+        self.start_working(self.at(9))
+        self.pymodoro.root.after.reset_mock()
+        self.fire_watchdog(self.at(10, 0, 1))
 
-        mock_askyesno.assert_not_called()
+        mock_prompt.assert_not_called()
         self.mock_pygame_mixer_music.load.assert_not_called()
         self.mock_pygame_mixer_music.play.assert_not_called()
+        # Quiet until 16:00, so the next look is then rather than every second
+        self.pymodoro.root.after.assert_any_call((self.at(16) - self.at(10, 0, 1)) * 1000 + 1,
+                                                 self.pymodoro.inactivity_watchdog.check)
 
-    @patch('main.messagebox.askyesno')
-    @patch('main.time.time')
-    @patch('main.datetime')
-    def test_inactivity_check_triggered_outside_window_user_yes(self, mock_datetime, mock_time, mock_askyesno):
+    @patch('main.InactivityPrompt')
+    def test_inactivity_check_triggered_outside_window_user_yes(self, mock_prompt):
         sound_name = "are_you_still_listening"
         expected_path = os.path.join(main.script_dir, 'res', f"{sound_name}.mp3")
-
-        mock_dt_instance = MagicMock()
-        mock_dt_instance.hour = 6
-        mock_datetime.now.return_value = mock_dt_instance
-        self.pymodoro.state = State.Working
-        self.pymodoro.timer_active = True
-        self.pymodoro.last_interaction = 0
-        current_simulated_time = 3601
-        mock_time.return_value = current_simulated_time
-        mock_askyesno.return_value = True
-
-        with patch('main.os.path.exists', return_value=True) as mock_exists:
-            self.pymodoro.check_inactivity()
-            mock_exists.assert_called_once_with(expected_path)
+        self.start_working(self.at(5))
+        self.fire_watchdog(self.at(6, 0, 1))
 
         self.mock_pygame_mixer_music.load.assert_called_once_with(expected_path)
         self.mock_pygame_mixer_music.play.assert_called_once()
-        mock_askyesno.assert_called_once_with("Still there?", "Are you still listening?")
-        self.assertEqual(self.pymodoro.last_interaction, current_simulated_time)
+        mock_prompt.assert_called_once_with(self.pymodoro.root, self.pymodoro.on_inactivity_answer,
+                                            timeout_ms=main.INACTIVITY_PROMPT_TIMEOUT_MINUTES * 60 * 1000,
+                                            bg=main.global_bg, button_bg=main.button_bg, button_font=main.button_font)
+        self.assertTrue(self.pymodoro.timer_active)  # The prompt doesn't stop the countdown
+        self.pymodoro.root.after.reset_mock()
+        self.pymodoro.on_inactivity_answer(True)
+        self.assertIsNone(self.pymodoro.inactivity_prompt)
+        self.assertEqual(self.pymodoro.inactivity_watchdog.last_interaction, self.at(6, 0, 1))
+        # An hour from now is 07:00:01, in quiet hours, so the next look is at 16:00
+        self.pymodoro.root.after.assert_called_once_with((self.at(16) - self.at(6, 0, 1)) * 1000 + 1,
+                                                         self.pymodoro.inactivity_watchdog.check)
         self.pymodoro.reset.assert_not_called()
         self.pymodoro.play_pause_media.assert_not_called()
 
-    @patch('main.messagebox.askyesno')
-    @patch('main.time.time')
-    @patch('main.datetime')
-    def test_inactivity_check_triggered_outside_window_user_no(self, mock_datetime, mock_time, mock_askyesno):
-        sound_name = "are_you_still_listening"
-        expected_path = os.path.join(main.script_dir, 'res', f"{sound_name}.mp3")
+    @patch('main.InactivityPrompt')
+    def test_inactivity_check_triggered_outside_window_user_no(self, mock_prompt):
+        self.start_working(self.at(16))
+        self.fire_watchdog(self.at(17, 0, 1))
 
-        mock_dt_instance = MagicMock()
-        mock_dt_instance.hour = 17
-        mock_datetime.now.return_value = mock_dt_instance
-        self.pymodoro.state = State.Working
-        self.pymodoro.timer_active = True
-        self.pymodoro.last_interaction = 0
-        mock_time.return_value = 3601
-        mock_askyesno.return_value = False
-
-        with patch('main.os.path.exists', return_value=True) as mock_exists:
-            self.pymodoro.check_inactivity()
-            mock_exists.assert_called_once_with(expected_path)
-
-        self.mock_pygame_mixer_music.load.assert_called_once_with(expected_path)
         self.mock_pygame_mixer_music.play.assert_called_once()
-        mock_askyesno.assert_called_once_with("Still there?", "Are you still listening?")
+        mock_prompt.assert_called_once()
+        self.pymodoro.reset.assert_not_called()
+        self.pymodoro.on_inactivity_answer(False)  # "No", or the prompt timing out
         self.pymodoro.reset.assert_called_once()
         self.pymodoro.play_pause_media.assert_called_once()
 
-    @patch('main.messagebox.askyesno')
-    @patch('main.time.time')
-    @patch('main.datetime')
-    def test_inactivity_check_not_triggered_if_not_working_state(self, mock_datetime, mock_time, mock_askyesno):
-        mock_dt_instance = MagicMock() # Added full setup for clarity
-        mock_dt_instance.hour = 6
-        mock_datetime.now.return_value = mock_dt_instance
+    @patch('main.InactivityPrompt')
+    def test_prompt_expiring_after_a_manual_reset_does_nothing(self, mock_prompt):
+        self.start_working(self.at(16))
+        self.fire_watchdog(self.at(17, 0, 1))
+        self.pymodoro.engine.reset()  # The user pressed reset while the prompt was up
+        self.pymodoro.timer_active = False
+        self.pymodoro.on_inactivity_answer(False)  # Then the prompt timed out
+        self.assertIsNone(self.pymodoro.inactivity_prompt)
+        self.pymodoro.reset.assert_not_called()
+        self.pymodoro.play_pause_media.assert_not_called()
+
+    @patch('main.InactivityPrompt')
+    def test_prompt_expiring_in_a_later_phase_does_nothing(self, mock_prompt):
+        self.start_working(self.at(16))
+        self.fire_watchdog(self.at(17, 0, 1))
+        self.pymodoro.engine.transition()  # Skipped on to a Rest while the prompt was up
+        self.pymodoro.on_inactivity_answer(False)
+        self.pymodoro.reset.assert_not_called()
+        self.pymodoro.play_pause_media.assert_not_called()
+
+    @patch('main.InactivityPrompt')
+    def test_watchdog_rearms_after_a_skip_during_the_prompt(self, mock_prompt):
+        self.start_working(self.at(16))
+        self.fire_watchdog(self.at(17, 0, 1))
+        self.pymodoro.skip()  # On to a Rest...
+        self.pymodoro.skip()  # ...and back to Working, whose overdue check finds the prompt still open
+        self.fire_watchdog(self.at(17, 0, 2))
+        self.assertIsNone(self.pymodoro.inactivity_watchdog._after_id)
+        self.pymodoro.root.after.reset_mock()
+        self.pymodoro.play_pause_media.reset_mock()  # Toggled by the skips themselves
+        self.pymodoro.on_inactivity_answer(False)
+        self.pymodoro.reset.assert_not_called()
+        self.pymodoro.play_pause_media.assert_not_called()
+        self.pymodoro.root.after.assert_called_once_with(60 * 60 * 1000 + 1, self.pymodoro.inactivity_watchdog.check)
+
+    @patch('main.InactivityPrompt')
+    def test_click_during_the_prompt_counts_as_an_answer(self, mock_prompt):
+        self.start_working(self.at(16))
+        self.fire_watchdog(self.at(17, 0, 1))
+        self.now = self.at(17, 0, 30)
+        self.pymodoro.update_interaction()  # e.g. Pause then Start in the main window
+        self.pymodoro.on_inactivity_answer(False)
+        self.pymodoro.reset.assert_not_called()
+        self.pymodoro.play_pause_media.assert_not_called()
+
+    @patch('main.InactivityPrompt')
+    def test_inactivity_check_not_triggered_if_not_working_state(self, mock_prompt):
+        self.start_working(self.at(5))
         self.pymodoro.state = State.Rest
         self.pymodoro.timer_active = True
-        self.pymodoro.last_interaction = 0
-        mock_time.return_value = 3601
-        self.pymodoro.check_inactivity()
-        mock_askyesno.assert_not_called()
+        self.fire_watchdog(self.at(6, 0, 1))
+        mock_prompt.assert_not_called()
         self.mock_pygame_mixer_music.load.assert_not_called()
 
-    @patch('main.messagebox.askyesno')
-    @patch('main.time.time')
-    @patch('main.datetime')
-    def test_inactivity_check_not_triggered_if_timer_not_active(self, mock_datetime, mock_time, mock_askyesno):
-        mock_dt_instance = MagicMock() # Added full setup for clarity
-        mock_dt_instance.hour = 6
-        mock_datetime.now.return_value = mock_dt_instance
-        self.pymodoro.state = State.Working
+    @patch('main.InactivityPrompt')
+    def test_inactivity_check_not_triggered_if_timer_not_active(self, mock_prompt):
+        self.start_working(self.at(5))
+        self.pymodoro.root.after_cancel.reset_mock()
         self.pymodoro.timer_active = False
-        self.pymodoro.last_interaction = 0
-        mock_time.return_value = 3601
-        self.pymodoro.check_inactivity()
-        mock_askyesno.assert_not_called()
+        self.assertFalse(self.pymodoro.inactivity_watchdog.active)
+        self.pymodoro.root.after_cancel.assert_called()
+        self.fire_watchdog(self.at(6, 0, 1))
+        mock_prompt.assert_not_called()
         self.mock_pygame_mixer_music.load.assert_not_called()
 
-    @patch('main.messagebox.askyesno')
-    @patch('main.time.time')
-    @patch('main.datetime')
-    def test_inactivity_check_not_triggered_if_not_inactive_long_enough(self, mock_datetime, mock_time, mock_askyesno):
-        mock_dt_instance = MagicMock() # Added full setup for clarity
-        mock_dt_instance.hour = 6
-        mock_datetime.now.return_value = mock_dt_instance
-        self.pymodoro.state = State.Working
-        self.pymodoro.timer_active = True
-        self.pymodoro.last_interaction = 100
-        mock_time.return_value = 3601
-        self.pymodoro.check_inactivity()
-        mock_askyesno.assert_not_called()
+    @patch('main.InactivityPrompt')
+    def test_inactivity_check_not_triggered_if_not_inactive_long_enough(self, mock_prompt):
+        self.start_working(self.at(5))
+        self.now = self.at(5, 10)
+        self.pymodoro.update_interaction()  # Only recorded; the pending deadline stays put
+        self.pymodoro.root.after.reset_mock()
+        self.fire_watchdog(self.at(6, 0, 1))
+        mock_prompt.assert_not_called()
         self.mock_pygame_mixer_music.load.assert_not_called()
+        self.pymodoro.root.after.assert_called_once_with((self.at(6, 10) - self.at(6, 0, 1)) * 1000 + 1,
+                                                         self.pymodoro.inactivity_watchdog.check)
+
+    @patch('main.InactivityPrompt')
+    def test_inactivity_prompt_is_not_stacked(self, mock_prompt):
+        self.start_working(self.at(5))
+        self.fire_watchdog(self.at(6, 0, 1))
+        self.fire_watchdog(self.at(6, 0, 2))
+        mock_prompt.assert_called_once()
+
+    def test_interactions_do_not_touch_tk(self):
+        self.start_working(self.at(5))
+        self.pymodoro.root.reset_mock()
+        for _ in range(100):
+            self.pymodoro.update_interaction()
+        self.assertEqual(self.pymodoro.root.mock_calls, [])
+
+    def test_ticks_do_no_inactivity_work(self):
+        self.start_working(self.at(5))
+        with patch.object(self.pymodoro.inactivity_watchdog, 'check') as mock_check:
+            for _ in range(10):
+                self.pymodoro.continuous_increment()
+        mock_check.assert_not_called()
+
+    def test_unanswered_prompt_times_out_as_no(self):
+        root = MagicMock()
+        on_answer = MagicMock()
+        prompt = main.InactivityPrompt(root, on_answer, timeout_ms=300000, bg=main.global_bg,
+                                       button_bg=main.button_bg, button_font=main.button_font)
+        root.after.assert_called_once_with(300000, prompt.expire)
+        prompt.expire()
+        on_answer.assert_called_once_with(False)
+        prompt.answer(True)  # A late click after the timeout is ignored
+        on_answer.assert_called_once_with(False)
+
+    def test_answering_prompt_cancels_timeout(self):
+        root = MagicMock()
+        on_answer = MagicMock()
+        prompt = main.InactivityPrompt(root, on_answer, timeout_ms=300000, bg=main.global_bg,
+                                       button_bg=main.button_bg, button_font=main.button_font)
+        prompt.answer(True)
+        root.after_cancel.assert_called_once_with(root.after.return_value)
+        on_answer.assert_called_once_with(True)
 
 
 class TestStateTransitions(unittest.TestCase):
@@ -239,7 +317,9 @@ class TestStateTransitions(unittest.TestCase):
         mock_pygame_global.mixer.music = self.mock_pygame_mixer_music
 
         self.pymodoro = Pymodoro()
+        self.assertTrue(self.pymodoro.subsystems_ready.wait(1))
         mock_pygame_global.mixer.init.assert_called_once()
+        self.pymodoro.sound_bank = SoundBank(os.path.join(main.script_dir, 'res'))
 
         self.pymodoro.state = State.Ready
         self.pymodoro.rests = 0
@@ -294,6 +374,18 @@ class TestStateTransitions(unittest.TestCase):
         if expected_final_rests is not None:
             self.assertEqual(self.pymodoro.rests, expected_final_rests)
 
+    def test_transitions_are_recorded_in_history(self):
+        self.pymodoro.history = MagicMock()
+        self.pymodoro.start_stop_button = {}
+        self.pymodoro.state_lbl = {}
+        self.pymodoro.state = State.Working
+        self.pymodoro.skip()
+        self.pymodoro.start_stop()
+        self.pymodoro.history.record.assert_has_calls([
+            call(main.EventKind.Skip, State.Working, State.Rest, 1, ANY),
+            call(main.EventKind.Resume, State.Rest, State.Rest, 1),
+        ])
+
     # --- Tests for voice ON ---
     def test_transition_working_to_short_rest_voice_on(self):
         self.helper_test_sound_on_transition(State.Working, 0, "lets_take_a_quick_break", State.Rest, True, 1)
@@ -321,6 +413,550 @@ class TestStateTransitions(unittest.TestCase):
         self.helper_test_sound_on_transition(State.LongRest, None, "lets_get_back_to_work", State.Working, False)
 
 
+class TestCatchUp(unittest.TestCase):
+
+    @patch('main.tk.Tk')
+    @patch('main.Pymodoro.build_window')
+    @patch('main.Pymodoro.start')
+    def setUp(self, mock_start_pymodoro, mock_build_window_pymodoro, mock_tk_pymodoro):
+        mock_tk_pymodoro.return_value = MagicMock()
+        self.pymodoro = Pymodoro()
+        self.pymodoro.play_pause_media = MagicMock()
+        self.pymodoro.play_sound = MagicMock()
+        self.pymodoro.update_timer_label = MagicMock()
+        self.pymodoro.set_state_label = MagicMock()
+        self.pymodoro.update_state_graphic = MagicMock()
+        self.pymodoro.check_inactivity = MagicMock()
+        self.pymodoro.history = MagicMock()
+        self.clock = [1000.0]
+        self.pymodoro.phase_timer.clock = lambda: self.clock[0]
+        self.pymodoro.state = State.Working
+        self.pymodoro.rests = 0
+        self.pymodoro.time_remaining = 600
+        self.pymodoro.timer_active = True
+
+    def test_suspend_fast_forwards_without_replaying_transitions(self):
+        # 600s left of Working, then two hours asleep: 6600s past the deadline is
+        # Rest, Working, Rest, Working, Rest, Working, LongRest and 300s into Working
+        self.pymodoro.suspend_detector.check = MagicMock(return_value=7200.0)
+        self.pymodoro.continuous_increment()
+        self.assertEqual(self.pymodoro.state, State.Working)
+        self.assertEqual(self.pymodoro.rests, 0)
+        self.assertEqual(self.pymodoro.time_remaining, 1200)
+        self.pymodoro.play_sound.assert_called_once_with("lets_get_back_to_work")
+        self.pymodoro.play_pause_media.assert_not_called()  # Eight toggles cancel out
+        self.assertEqual(self.pymodoro.history.record.call_count, 8)
+        self.assertEqual(self.pymodoro.history.record.call_args_list[0].args[0], main.EventKind.CatchUp)
+
+    def test_odd_number_of_transitions_toggles_media_once(self):
+        self.pymodoro.suspend_detector.check = MagicMock(return_value=700.0)
+        self.pymodoro.continuous_increment()
+        self.assertEqual((self.pymodoro.state, self.pymodoro.rests), (State.Rest, 1))
+        self.assertEqual(self.pymodoro.time_remaining, 200)
+        self.pymodoro.play_sound.assert_called_once_with("lets_take_a_quick_break")
+        self.pymodoro.play_pause_media.assert_called_once()
+
+    def test_suspend_within_a_phase_only_moves_the_deadline(self):
+        self.pymodoro.suspend_detector.check = MagicMock(return_value=300.0)
+        self.pymodoro.continuous_increment()
+        self.assertEqual(self.pymodoro.state, State.Working)
+        self.assertEqual(self.pymodoro.time_remaining, 300)
+        self.pymodoro.play_sound.assert_not_called()
+        self.pymodoro.play_pause_media.assert_not_called()
+
+    def test_monotonic_jump_is_caught_up_too(self):
+        # Where the monotonic clock counts suspended time the deadline is simply long gone
+        self.clock[0] += 600 + 300 + 100
+        self.pymodoro.continuous_increment()
+        self.assertEqual((self.pymodoro.state, self.pymodoro.rests), (State.Working, 1))
+        self.assertEqual(self.pymodoro.time_remaining, 1400)
+        self.pymodoro.play_sound.assert_called_once_with("lets_get_back_to_work")
+        self.pymodoro.play_pause_media.assert_not_called()
+
+    def test_suspend_while_paused_is_not_caught_up_on_resume(self):
+        suspend_clock = [5000.0]
+        self.pymodoro.suspend_detector = main.SuspendDetector(clock=lambda: self.clock[0],
+                                                              suspend_clock=lambda: suspend_clock[0], threshold=5)
+        self.clock[0] += 10
+        suspend_clock[0] += 10
+        self.pymodoro.timer_active = False  # Paused at 09:50
+        suspend_clock[0] += 3600  # An hour asleep while paused
+        self.pymodoro.timer_active = True
+        self.clock[0] += 1
+        suspend_clock[0] += 1
+        self.pymodoro.continuous_increment()
+        self.assertEqual((self.pymodoro.state, self.pymodoro.rests), (State.Working, 0))
+        self.assertEqual(self.pymodoro.time_remaining, 589)
+        self.pymodoro.history.record.assert_not_called()
+        self.pymodoro.play_sound.assert_not_called()
+
+
+class FakeScheduler:
+    """Stands in for root.after/after_cancel on a simulated clock, counting wake-ups."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.pending = {}  # id -> (due, callback)
+        self.next_id = 0
+        self.wakeups = 0
+
+    def after(self, ms, callback):
+        self.next_id += 1
+        self.pending[self.next_id] = (self.now + ms / 1000, callback)
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def run_for(self, seconds):
+        end = self.now + seconds
+        while self.pending:
+            after_id, (due, callback) = min(self.pending.items(), key=lambda item: item[1][0])
+            if due > end:
+                break
+            del self.pending[after_id]
+            self.now = due
+            self.wakeups += 1
+            callback()
+        self.now = end
+
+
+class TestResume(unittest.TestCase):
+
+    @patch('main.tk.Tk')
+    @patch('main.Pymodoro.build_window')
+    @patch('main.Pymodoro.start')
+    def setUp(self, mock_start_pymodoro, mock_build_window_pymodoro, mock_tk_pymodoro):
+        mock_tk_pymodoro.return_value = MagicMock()
+        self.path = os.path.join(tempfile.mkdtemp(), 'resume.journal')
+        patcher = patch('main.RESUME_FILE', self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch('main.tk.Tk')
+    @patch('main.Pymodoro.build_window')
+    @patch('main.Pymodoro.start')
+    def restart(self, mock_start_pymodoro, mock_build_window_pymodoro, mock_tk_pymodoro):
+        mock_tk_pymodoro.return_value = MagicMock()
+        pymodoro = Pymodoro()
+        for name in ('play_pause_media', 'play_sound', 'update_timer_label', 'set_state_label',
+                     'update_state_graphic', 'refresh_window'):
+            setattr(pymodoro, name, MagicMock())
+        pymodoro.start_stop_button = {}
+        pymodoro.state_lbl = {}
+        pymodoro.history = MagicMock()
+        return pymodoro
+
+    def test_transitions_and_pauses_are_checkpointed(self):
+        pymodoro = self.restart()
+        pymodoro.go()
+        pymodoro.skip()
+        pymodoro.start_stop()
+        checkpoint = ResumeJournal(self.path).load()
+        self.assertEqual((checkpoint.state, checkpoint.rests, checkpoint.timer_active), (State.Rest, 1, False))
+        self.assertAlmostEqual(checkpoint.paused_remaining, 300, delta=1)
+        pymodoro.reset()
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_ticks_do_not_write(self):
+        pymodoro = self.restart()
+        pymodoro.go()
+        with patch.object(pymodoro.resume_journal, 'save') as save:
+            pymodoro.continuous_increment()
+        save.assert_not_called()
+
+    def test_restart_offers_to_resume_a_paused_phase(self):
+        ResumeJournal(self.path).save(State.Working, 2, False, 754.0)
+        pymodoro = self.restart()
+        pymodoro.root.after_idle.assert_any_call(pymodoro.offer_resume)
+        with patch('tkinter.messagebox.askyesno', return_value=True) as ask:
+            pymodoro.offer_resume()
+        self.assertIn('12:34', ask.call_args.args[1])
+        self.assertEqual((pymodoro.state, pymodoro.rests, pymodoro.time_remaining), (State.Working, 2, 754))
+        self.assertFalse(pymodoro.timer_active)
+        self.assertEqual(pymodoro.start_stop_button['text'], 'Start')
+
+    def test_restart_advances_past_phases_that_ended_while_closed(self):
+        now = time.time()
+        # Closed with 100s of Working left, reopened 300s later: 200s into the 300s first Rest
+        ResumeJournal(self.path).save(State.Working, 0, True, 100.0, phase_ends_at=now - 200)
+        pymodoro = self.restart()
+        pymodoro.resume_from(pymodoro.pending_checkpoint, now=now)
+        self.assertEqual((pymodoro.state, pymodoro.rests), (State.Rest, 1))
+        self.assertTrue(pymodoro.timer_active)
+        self.assertAlmostEqual(pymodoro.phase_timer.remaining(), 100, delta=1)
+        pymodoro.play_sound.assert_not_called()
+        pymodoro.history.record.assert_called_once_with(main.EventKind.CatchUp, State.Working, State.Rest, 1, 0.0)
+
+    def test_prompt_for_a_phase_that_already_ended_says_so(self):
+        ResumeJournal(self.path).save(State.Working, 0, True, 100.0, phase_ends_at=time.time() - 600)
+        pymodoro = self.restart()
+        with patch('tkinter.messagebox.askyesno', return_value=False) as ask:
+            pymodoro.offer_resume()
+        self.assertIn('ended 10 min ago', ask.call_args.args[1])
+        self.assertNotIn('00:00', ask.call_args.args[1])
+
+    def test_declining_clears_the_journal(self):
+        ResumeJournal(self.path).save(State.Working, 0, True, 100.0, phase_ends_at=time.time() + 100)
+        pymodoro = self.restart()
+        pymodoro.publish_status('state')  # Must not overwrite the checkpoint before the answer
+        self.assertTrue(os.path.exists(self.path))
+        with patch('tkinter.messagebox.askyesno', return_value=False):
+            pymodoro.offer_resume()
+        self.assertEqual(pymodoro.state, State.Ready)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_session_started_while_the_dialog_is_open_wins(self):
+        ResumeJournal(self.path).save(State.Working, 2, False, 754.0)
+        pymodoro = self.restart()
+
+        def go_then_answer_yes(*args, **kwargs):
+            pymodoro.go()  # A control-socket `go`, dispatched by the dialog's event loop
+            return True
+
+        with patch('tkinter.messagebox.askyesno', side_effect=go_then_answer_yes):
+            pymodoro.offer_resume()
+        self.assertEqual((pymodoro.state, pymodoro.rests), (State.Working, 0))
+        self.assertTrue(pymodoro.timer_active)
+        checkpoint = ResumeJournal(self.path).load()
+        self.assertEqual((checkpoint.state, checkpoint.rests, checkpoint.timer_active), (State.Working, 0, True))
+
+
+class TestIdleWakeups(unittest.TestCase):
+
+    @patch('main.tk.Tk')
+    @patch('main.Pymodoro.build_window')
+    @patch('main.Pymodoro.start')
+    def setUp(self, mock_start_pymodoro, mock_build_window_pymodoro, mock_tk_pymodoro):
+        self.scheduler = FakeScheduler()
+        root = MagicMock()
+        root.after.side_effect = self.scheduler.after
+        root.after_cancel.side_effect = self.scheduler.after_cancel
+        mock_tk_pymodoro.return_value = root
+        self.pymodoro = Pymodoro()
+        self.pymodoro.phase_timer.clock = lambda: self.scheduler.now
+        for name in ('play_pause_media', 'play_sound', 'update_timer_label', 'set_state_label',
+                     'update_state_graphic', 'refresh_window', 'check_inactivity'):
+            setattr(self.pymodoro, name, MagicMock())
+        self.pymodoro.start_stop_button = {}
+        self.pymodoro.state_lbl = {}
+        self.pymodoro.continuous_increment()  # What start() does before entering the mainloop
+
+    def wakeups_per_hour(self):
+        before = self.scheduler.wakeups
+        self.scheduler.run_for(3600)
+        return self.scheduler.wakeups - before
+
+    def test_ready_state_never_wakes(self):
+        self.assertEqual(self.wakeups_per_hour(), 0)
+
+    def test_paused_timer_never_wakes(self):
+        self.pymodoro.go()
+        self.scheduler.run_for(10)
+        self.pymodoro.start_stop()
+        self.assertEqual(self.wakeups_per_hour(), 0)
+        self.pymodoro.start_stop()
+        self.assertGreater(self.wakeups_per_hour(), 3000)
+
+    def test_minimized_window_only_wakes_at_phase_ends(self):
+        self.pymodoro.go()
+        self.pymodoro.on_unmap(MagicMock(widget=self.pymodoro.root))
+        # The hour ends exactly on the fourth phase end: Working, Rest, Working, Rest
+        self.assertEqual(self.wakeups_per_hour(), 4)
+        self.assertEqual((self.pymodoro.state, self.pymodoro.rests), (State.Working, 2))
+        self.pymodoro.on_map(MagicMock(widget=self.pymodoro.root))
+        self.assertAlmostEqual(self.wakeups_per_hour(), 3600, delta=1)  # Back to one tick per displayed second
+
+    def test_child_widget_map_events_are_ignored(self):
+        self.pymodoro.go()
+        self.pymodoro.on_unmap(MagicMock(widget=MagicMock()))
+        self.assertTrue(self.pymodoro.window_visible)
+
+
+class TestControlCommands(unittest.TestCase):
+
+    @patch('main.tk.Tk')
+    @patch('main.Pymodoro.build_window')
+    @patch('main.Pymodoro.start')
+    def setUp(self, mock_start_pymodoro, mock_build_window_pymodoro, mock_tk_pymodoro):
+        root = MagicMock()
+        root.after.side_effect = lambda ms, callback=None, *args: callback() if ms == 0 else None
+        mock_tk_pymodoro.return_value = root
+        self.pymodoro = Pymodoro()
+        for name in ('play_pause_media', 'play_sound', 'update_timer_label', 'set_state_label',
+                     'update_state_graphic', 'refresh_window'):
+            setattr(self.pymodoro, name, MagicMock())
+        self.pymodoro.start_stop_button = {}
+        self.pymodoro.state_lbl = {}
+
+    def test_commands_run_on_the_tk_thread_and_return_status(self):
+        reply = self.pymodoro.handle_control_command('go')
+        self.assertTrue(reply['ok'])
+        status = reply['status']
+        self.assertEqual((status['state'], status['rests'], status['time_remaining'], status['timer_active']),
+                         ('Working', 0, 1500, True))
+        self.assertAlmostEqual(status['phase_ends_at'], time.time() + 1500, delta=5)
+        self.pymodoro.root.after.assert_any_call(0, ANY)
+
+    def test_pause_toggles_and_skip_transitions(self):
+        self.pymodoro.handle_control_command('go')
+        self.assertFalse(self.pymodoro.handle_control_command('pause')['status']['timer_active'])
+        self.assertTrue(self.pymodoro.handle_control_command('pause')['status']['timer_active'])
+        self.assertEqual(self.pymodoro.handle_control_command('skip')['status']['state'], 'Rest')
+        self.assertEqual(self.pymodoro.handle_control_command('reset')['status']['state'], 'Ready')
+
+    def test_commands_that_do_not_apply_are_refused(self):
+        self.assertEqual(self.pymodoro.handle_control_command('skip')['error'], 'not running')
+        self.pymodoro.handle_control_command('go')
+        self.assertEqual(self.pymodoro.handle_control_command('go')['error'], 'already running')
+
+    def test_status_is_published_on_ticks_and_state_changes(self):
+        self.pymodoro.status_server = MagicMock(subscribers=0)
+        publish = self.pymodoro.status_server.publish
+        self.pymodoro.go()
+        self.assertEqual(publish.call_args.args[1], 'transition')
+        self.pymodoro.continuous_increment()
+        self.assertEqual(publish.call_args.args[1], 'tick')
+        self.pymodoro.start_stop()
+        self.assertEqual(publish.call_args.args[0]['phase_ends_at'], None)  # Paused
+        self.pymodoro.reset()
+        self.assertEqual(publish.call_args.args[0]['state'], 'Ready')
+
+    def test_status_file_follows_the_timer(self):
+        path = os.path.join(tempfile.mkdtemp(), 'pymodoro.status')
+        self.pymodoro.status_file = main.StatusFileWriter(path)
+        reader = StatusFileReader(path)
+        self.addCleanup(reader.close)
+        self.pymodoro.go()
+        status = reader.read()
+        self.assertEqual((status.state, status.time_remaining, status.timer_active), ('Working', 1500, True))
+        self.assertAlmostEqual(status.phase_ends_at, time.time() + 1500, delta=5)
+        self.pymodoro.start_stop()
+        self.assertFalse(reader.read().timer_active)
+        self.pymodoro.status_file.close()
+        self.assertIsNone(reader.read())
+
+    def test_unresponsive_window_times_out(self):
+        self.pymodoro.root.after.side_effect = None  # The Tk thread never gets to it
+        with patch('main.CONTROL_TIMEOUT', 0.01):
+            self.assertFalse(self.pymodoro.handle_control_command('status')['ok'])
+
+
+class TestRefreshWindow(unittest.TestCase):
+
+    @patch('main.tk.Tk')
+    @patch('main.Pymodoro.build_window')
+    @patch('main.Pymodoro.start')
+    def setUp(self, mock_start_pymodoro, mock_build_window_pymodoro, mock_tk_pymodoro):
+        mock_tk_pymodoro.return_value = MagicMock()
+        self.pymodoro = Pymodoro()
+        self.pymodoro.play_pause_media = MagicMock()
+        self.pymodoro.play_sound = MagicMock()
+        self.pymodoro.update_timer_label = MagicMock()
+        self.pymodoro.update_state_graphic = MagicMock()
+        self.pymodoro.state_lbl = {'text': 'Ready'}
+        self.pymodoro.start_stop_button = {'text': 'Start'}
+        self.pymodoro.ready_controls = MagicMock(name='ready_controls')
+        self.pymodoro.running_controls = MagicMock(name='running_controls')
+        self.pymodoro.state_graphic_key = 'Ready'
+        self.pymodoro.control_layout = 'ready'
+
+    def test_go_swaps_control_layout_without_creating_widgets(self):
+        mock_tkinter.Button.reset_mock()
+        mock_tkinter.Frame.reset_mock()
+        self.pymodoro.go()
+        self.pymodoro.ready_controls.pack_forget.assert_called_once()
+        self.pymodoro.running_controls.pack.assert_called_once()
+        self.assertEqual(self.pymodoro.start_stop_button['text'], 'Pause')
+        self.assertEqual(self.pymodoro.state_lbl['text'], 'Working')
+        mock_tkinter.Button.assert_not_called()
+        mock_tkinter.Frame.assert_not_called()
+
+    def test_reset_restores_ready_layout_and_graphic(self):
+        self.pymodoro.go()
+        self.pymodoro.state_graphic_key = 'Working1'  # As update_state_graphic would have left it
+        self.pymodoro.update_state_graphic.reset_mock()
+        self.pymodoro.reset()
+        self.pymodoro.running_controls.pack_forget.assert_called_once()
+        self.assertEqual(self.pymodoro.ready_controls.pack.call_count, 1)
+        self.pymodoro.update_state_graphic.assert_called_once()
+        self.assertEqual(self.pymodoro.state_lbl['text'], 'Ready')
+        self.assertFalse(self.pymodoro.timer_active)
+
+    def test_refresh_is_a_no_op_when_nothing_changed(self):
+        self.pymodoro.refresh_window()
+        self.pymodoro.ready_controls.pack.assert_not_called()
+        self.pymodoro.running_controls.pack_forget.assert_not_called()
+        self.pymodoro.update_state_graphic.assert_not_called()
+
+
+class TestTimerLabel(unittest.TestCase):
+
+    @patch('main.tk.Tk')
+    @patch('main.Pymodoro.build_window')
+    @patch('main.Pymodoro.start')
+    def setUp(self, mock_start_pymodoro, mock_build_window_pymodoro, mock_tk_pymodoro):
+        mock_tk_pymodoro.return_value = MagicMock()
+        self.pymodoro = Pymodoro()
+        self.pymodoro.timer_ring = MagicMock()
+
+    def test_format_time_value(self):
+        self.assertEqual(self.pymodoro.format_time_value(1500), "25:00")
+        self.assertEqual(self.pymodoro.format_time_value(61), "01:01")
+        self.assertEqual(self.pymodoro.format_time_value(0), "00:00")
+        self.assertEqual(self.pymodoro.format_time_value(6001), "100:01")  # Beyond the precomputed table
+        self.pymodoro.time_remaining = 299
+        self.assertEqual(self.pymodoro.format_time_value(), "04:59")
+
+    def test_ring_shows_the_fraction_of_the_phase_left(self):
+        self.pymodoro.update_timer_label(1500)
+        self.pymodoro.state = State.Rest
+        self.pymodoro.update_timer_label(75)
+        self.assertEqual(self.pymodoro.timer_ring.show.call_args_list,
+                         [call(1.0, "25:00"), call(0.25, "01:15")])
+
+    def test_disabled_trace_is_not_formatted(self):
+        self.pymodoro.trace_enabled = False
+        self.pymodoro.timer_active = True
+        with patch('main.logger.trace') as mock_trace:
+            self.pymodoro.continuous_increment()
+        mock_trace.assert_not_called()
+
+    def test_tick_lateness_and_operation_durations_are_recorded(self):
+        lateness_count = main.TICK_LATENESS.count
+        play_sound = main.METRICS.histogram('pymodoro_operation_duration_seconds', '', operation='play_sound')
+        play_sound_count = play_sound.count
+        self.pymodoro.next_tick_due = main.time.monotonic() - 0.05  # Tick ran 50 ms late
+        self.pymodoro.continuous_increment()
+        self.assertEqual(main.TICK_LATENESS.count, lateness_count + 1)
+        self.assertGreaterEqual(main.TICK_LATENESS.sum, 0.05)
+        self.pymodoro.play_sound('Working')
+        self.assertEqual(play_sound.count, play_sound_count + 1)
+
+
+class TestWindowLayout(unittest.TestCase):
+
+    @patch('main.tk.Tk')
+    @patch('main.Pymodoro.build_window')
+    @patch('main.Pymodoro.start')
+    def test_timer_ring_fits_the_default_window(self, mock_start, mock_build, mock_tk_root_constructor):
+        pymodoro = Pymodoro()
+        with patch('main.ProgressRing') as mock_ring:
+            pymodoro.add_timer_widget(MagicMock())
+        requested_height = mock_ring.call_args.kwargs['size']  # The canvas is size x size, with no border
+        pady = mock_ring.return_value.pack.call_args.kwargs['pady']
+        self.assertLessEqual(requested_height + 2 * pady, main.TIMER_AREA_HEIGHT)
+
+
+class TestStartupProfile(unittest.TestCase):
+
+    @patch('main.tk.Tk')
+    @patch('main.Pymodoro.build_window')
+    @patch('main.Pymodoro.start')
+    def test_profile_records_startup_phases(self, mock_start, mock_build, mock_tk_root_constructor):
+        pymodoro = Pymodoro(profile_startup=True)
+        self.assertTrue(pymodoro.subsystems_ready.wait(1))
+        phase_names = [phase[0] for phase in pymodoro.profiler.phases]
+        for expected in ('imports', 'tk init', 'options load', 'window build', 'mixer init', 'sound preload'):
+            self.assertIn(expected, phase_names)
+        pymodoro.root.bind.assert_any_call('<Map>', pymodoro.on_startup_map, add='+')
+
+    @patch('main.tk.Tk')
+    @patch('main.Pymodoro.build_window')
+    @patch('main.Pymodoro.start')
+    def test_profile_disabled_by_default(self, mock_start, mock_build, mock_tk_root_constructor):
+        pymodoro = Pymodoro()
+        self.assertTrue(pymodoro.subsystems_ready.wait(1))
+        self.assertEqual(pymodoro.profiler.phases, [])
+
+
+class TestAudioStartup(unittest.TestCase):
+
+    @patch('main.tk.Tk')
+    @patch('main.Pymodoro.build_window')
+    @patch('main.Pymodoro.start')
+    def test_prompts_stream_while_sounds_are_preloading(self, mock_start, mock_build, mock_tk_root_constructor):
+        mock_pygame_global.mixer.music = MagicMock(name='fresh_mixer_music_for_audio_startup')
+        preloading = threading.Event()
+        release = threading.Event()
+
+        def slow_preload():
+            preloading.set()
+            release.wait(1)
+
+        with patch.object(SoundBank, 'preload', side_effect=slow_preload):
+            pymodoro = Pymodoro()
+            self.assertTrue(preloading.wait(1))
+            self.assertTrue(pymodoro.audio_ready.is_set())
+            pymodoro.play_sound("lets_get_back_to_work")
+            release.set()
+            self.assertTrue(pymodoro.subsystems_ready.wait(1))
+        mock_pygame_global.mixer.music.load.assert_called_once_with(
+            os.path.join(main.script_dir, 'res', 'lets_get_back_to_work.mp3'))
+
+
+class TestMediaKeyDispatch(unittest.TestCase):
+
+    @patch('main.tk.Tk')
+    @patch('main.Pymodoro.build_window')
+    @patch('main.Pymodoro.start')
+    def setUp(self, mock_start_pymodoro, mock_build_window_pymodoro, mock_tk_pymodoro):
+        mock_tk_pymodoro.return_value = MagicMock()
+        self.pymodoro = Pymodoro()
+
+    def test_play_pause_media_only_queues_the_key(self):
+        self.pymodoro.media_keys = MagicMock()
+        self.pymodoro.play_pause_media()
+        self.pymodoro.media_keys.toggle.assert_called_once_with("playpause")
+
+    def test_problems_are_reported_on_the_tk_thread(self):
+        self.pymodoro.report_media_key_problem("Media key playpause timed out after 2.0s")
+        self.pymodoro.root.after.assert_called_with(0, self.pymodoro.on_media_key_problem,
+                                                    "Media key playpause timed out after 2.0s")
+
+
+class TestSoundBank(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_pygame_mixer_music = MagicMock(name='fresh_mixer_music_for_sound_bank')
+        mock_pygame_global.mixer.music = self.mock_pygame_mixer_music
+        self.mock_sound_class = MagicMock(name='mixer_sound_class')
+        mock_pygame_global.mixer.Sound = self.mock_sound_class
+        self.sound_dir = os.path.join(main.script_dir, 'res')
+        self.bank = SoundBank(self.sound_dir)
+
+    def test_preload_decodes_every_mp3(self):
+        self.bank.preload()
+        expected_names = [f[:-4] for f in os.listdir(self.sound_dir) if f.endswith('.mp3')]
+        self.assertEqual(self.mock_sound_class.call_count, len(expected_names))
+        for sound_name in expected_names:
+            self.assertTrue(self.bank.is_loaded(sound_name))
+
+    def test_preloaded_sound_plays_from_memory(self):
+        self.bank.preload()
+        with patch('main.os.path.exists') as mock_exists:
+            self.assertTrue(self.bank.play("lets_get_back_to_work"))
+            mock_exists.assert_not_called()
+        self.mock_sound_class.return_value.play.assert_called_once()
+        self.mock_pygame_mixer_music.load.assert_not_called()
+        self.assertEqual(self.bank.latency_stats()["lets_get_back_to_work"][0], 1)
+
+    def test_failed_decode_falls_back_to_streaming(self):
+        self.mock_sound_class.side_effect = mock_pygame_global.error("unsupported format")
+        self.bank.preload()
+        self.assertFalse(self.bank.is_loaded("lets_get_back_to_work"))
+        expected_path = os.path.join(self.sound_dir, "lets_get_back_to_work.mp3")
+        self.assertTrue(self.bank.play("lets_get_back_to_work"))
+        self.mock_pygame_mixer_music.load.assert_called_once_with(expected_path)
+        self.mock_pygame_mixer_music.play.assert_called_once()
+
+    def test_missing_sound_is_skipped(self):
+        self.bank.preload()
+        self.assertFalse(self.bank.play("no_such_prompt"))
+        self.mock_pygame_mixer_music.load.assert_not_called()
+        self.assertNotIn("no_such_prompt", self.bank.latency_stats())
+
+
 class TestOptionsPersistence(unittest.TestCase):
 
     @patch('main.tk.Tk')
@@ -370,13 +1006,16 @@ class TestOptionsPersistence(unittest.TestCase):
         # main.tk.Tk() is already globally mocked to return a MagicMock instance by default from @patch
         # The BooleanVar is also globally mocked to be functional.
         pymodoro_instance = Pymodoro()
+        pymodoro_instance.options.flush() # Writes are deferred to a background thread
 
         # Assertions
         self.assertTrue(pymodoro_instance.voice_active_var.get()) # Check mock's state
         self.assertTrue(os.path.exists(OPTIONS_FILE))
         with open(OPTIONS_FILE, 'r') as f:
             options = json.load(f)
-        self.assertEqual(options, {"voice_active": True}) # Check file content
+        self.assertEqual(options, {"voice_active": True, "window_width": 700, "window_height": 390,
+                                   "window_x": None, "window_y": None, "inactivity_threshold_minutes": 60,
+                                   "inactivity_quiet_hours": [[7, 16]], "log_level": "INFO"}) # Check file content
 
     # Patches for Pymodoro's dependencies during instantiation
     @patch('main.tk.Tk')
@@ -400,6 +1039,29 @@ class TestOptionsPersistence(unittest.TestCase):
         pymodoro_instance = Pymodoro()
         self.assertTrue(pymodoro_instance.voice_active_var.get())
 
+    @patch('main.tk.Tk')
+    @patch('main.Pymodoro.build_window')
+    @patch('main.Pymodoro.start')
+    def test_saved_height_too_short_for_the_ring_is_raised(self, mock_start, mock_build, mock_tk_root_constructor):
+        with open(OPTIONS_FILE, 'w') as f:
+            json.dump({"voice_active": True, "window_width": 800, "window_height": 325,
+                       "window_x": 10, "window_y": 20}, f)
+        pymodoro_instance = Pymodoro()
+        self.assertEqual(pymodoro_instance.window_geometry,
+                         {"width": 800, "height": main.DEFAULT_WINDOW_HEIGHT, "x": 10, "y": 20})
+        pymodoro_instance.options.flush()
+        with open(OPTIONS_FILE, 'r') as f:
+            self.assertEqual(json.load(f)["window_height"], main.DEFAULT_WINDOW_HEIGHT)
+
+    @patch('main.tk.Tk')
+    @patch('main.Pymodoro.build_window')
+    @patch('main.Pymodoro.start')
+    def test_taller_saved_height_is_kept(self, mock_start, mock_build, mock_tk_root_constructor):
+        with open(OPTIONS_FILE, 'w') as f:
+            json.dump({"voice_active": True, "window_width": 800, "window_height": 500,
+                       "window_x": 10, "window_y": 20}, f)
+        self.assertEqual(Pymodoro().window_geometry["height"], 500)
+
     @patch('main.tk.Tk')
     @patch('main.Pymodoro.build_window')
     @patch('main.Pymodoro.start')
@@ -410,16 +1072,18 @@ class TestOptionsPersistence(unittest.TestCase):
         # Test saving False
         pymodoro_instance.voice_active_var.set(False) # Uses the mocked BooleanVar's set
         pymodoro_instance.save_options() # Uses the mocked BooleanVar's get
+        pymodoro_instance.options.flush()
         with open(OPTIONS_FILE, 'r') as f:
             options = json.load(f)
-        self.assertEqual(options, {"voice_active": False})
+        self.assertEqual(options["voice_active"], False)
 
         # Test saving True
         pymodoro_instance.voice_active_var.set(True)
         pymodoro_instance.save_options()
+        pymodoro_instance.options.flush()
         with open(OPTIONS_FILE, 'r') as f:
             options = json.load(f)
-        self.assertEqual(options, {"voice_active": True})
+        self.assertEqual(options["voice_active"], True)
 
     @patch('main.tk.Tk')
     @patch('main.Pymodoro.build_window')
@@ -429,12 +1093,17 @@ class TestOptionsPersistence(unittest.TestCase):
             f.write("this is not valid json")
 
         pymodoro_instance = Pymodoro()
+        pymodoro_instance.options.flush()
         # load_options should call .set(True) and save_options
         self.assertTrue(pymodoro_instance.voice_active_var.get())
         self.assertTrue(os.path.exists(OPTIONS_FILE))
         with open(OPTIONS_FILE, 'r') as f:
             options = json.load(f)
-        self.assertEqual(options, {"voice_active": True})
+        self.assertEqual(options["voice_active"], True)
+        # The unreadable file is kept for inspection rather than silently overwritten
+        with open(OPTIONS_FILE + '.corrupt', 'r') as f:
+            self.assertEqual(f.read(), "this is not valid json")
+        os.remove(OPTIONS_FILE + '.corrupt')
 
     @patch('main.tk.Tk')
     @patch('main.Pymodoro.build_window')
@@ -444,11 +1113,58 @@ class TestOptionsPersistence(unittest.TestCase):
             json.dump({"another_option": "some_value"}, f)
 
         pymodoro_instance = Pymodoro()
+        pymodoro_instance.options.flush()
         # load_options should default to True and call save_options
         self.assertTrue(pymodoro_instance.voice_active_var.get())
         with open(OPTIONS_FILE, 'r') as f:
             options = json.load(f)
         self.assertEqual(options.get("voice_active"), True)
+        self.assertEqual(options.get("another_option"), "some_value")
+
+    @patch('main.tk.Tk')
+    @patch('main.Pymodoro.build_window')
+    @patch('main.Pymodoro.start')
+    def test_load_inactivity_settings(self, mock_start, mock_build, mock_tk_root_constructor):
+        with open(OPTIONS_FILE, 'w') as f:
+            json.dump({"inactivity_threshold_minutes": 30, "inactivity_quiet_hours": [[9, 12], [22, 6]]}, f)
+
+        pymodoro_instance = Pymodoro()
+        self.assertEqual(pymodoro_instance.inactivity_watchdog.threshold, 30 * 60)
+        self.assertEqual(pymodoro_instance.inactivity_watchdog.quiet_hours, [[9, 12], [22, 6]])
+
+    @patch('main.tk.Tk')
+    @patch('main.Pymodoro.build_window')
+    @patch('main.Pymodoro.start')
+    def test_invalid_inactivity_settings_fall_back_to_defaults(self, mock_start, mock_build, mock_tk_root_constructor):
+        with open(OPTIONS_FILE, 'w') as f:
+            json.dump({"inactivity_threshold_minutes": -5, "inactivity_quiet_hours": [[7, 25]]}, f)
+
+        pymodoro_instance = Pymodoro()
+        pymodoro_instance.options.flush()
+        self.assertEqual(pymodoro_instance.inactivity_watchdog.threshold, 60 * 60)
+        with open(OPTIONS_FILE, 'r') as f:
+            options = json.load(f)
+        self.assertEqual(options["inactivity_threshold_minutes"], 60)
+        self.assertEqual(options["inactivity_quiet_hours"], [[7, 16]])
+
+    @patch('main.tk.Tk')
+    @patch('main.Pymodoro.build_window')
+    @patch('main.Pymodoro.start')
+    def test_log_level_is_kept_and_validated(self, mock_start, mock_build, mock_tk_root_constructor):
+        with open(OPTIONS_FILE, 'w') as f:
+            json.dump({"log_level": "debug"}, f)
+        self.assertEqual(main.log_level_from_options(OPTIONS_FILE), "DEBUG")
+        pymodoro_instance = Pymodoro()
+        self.assertEqual(pymodoro_instance.log_level, "DEBUG")
+        pymodoro_instance.options.close()
+
+        with open(OPTIONS_FILE, 'w') as f:
+            json.dump({"log_level": "chatty"}, f)
+        self.assertEqual(main.log_level_from_options(OPTIONS_FILE), "INFO")
+        pymodoro_instance = Pymodoro()
+        pymodoro_instance.options.flush()
+        with open(OPTIONS_FILE, 'r') as f:
+            self.assertEqual(json.load(f)["log_level"], "INFO")
 
 
 if __name__ == '__main__':
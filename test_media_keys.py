@@ -0,0 +1,99 @@
+import threading
+import unittest
+
+from media_keys import MediaKeyWorker
+
+
+class TestMediaKeyWorker(unittest.TestCase):
+
+    def setUp(self):
+        self.pressed = []
+        self.reports = []
+        self.reported = threading.Event()
+        self.pressing = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+        self.presses_started = 0
+
+    def press(self, key):
+        self.presses_started += 1
+        self.pressing.set()
+        self.release.wait()
+        self.pressed.append(key)
+
+    def report(self, message):
+        self.reports.append(message)
+        self.reported.set()
+
+    def make_worker(self, **kwargs):
+        worker = MediaKeyWorker(report=self.report, press=self.press, **kwargs)
+        self.addCleanup(self.release.set)
+        return worker
+
+    def test_toggle_is_sent_on_worker_thread(self):
+        worker = self.make_worker().start()
+        worker.toggle()
+        worker.stop()
+        self.assertEqual(self.pressed, ["playpause"])
+        self.assertEqual(self.reports, [])
+
+    def test_pending_toggles_are_coalesced(self):
+        self.release.clear()
+        worker = self.make_worker().start()
+        worker.toggle()  # In flight, blocked in press()
+        self.assertTrue(self.pressing.wait(1))
+        worker.toggle()
+        worker.toggle()  # Cancels the previous toggle
+        worker.toggle()
+        self.release.set()
+        worker.stop()
+        self.assertEqual(self.pressed, ["playpause", "playpause"])
+
+    def test_even_number_of_pending_toggles_sends_nothing(self):
+        worker = self.make_worker()
+        worker.toggle()
+        worker.toggle()
+        worker.start().stop()
+        self.assertEqual(self.pressed, [])
+
+    def test_full_queue_is_reported(self):
+        worker = self.make_worker(maxsize=1)
+        worker.toggle()
+        worker.toggle()
+        self.assertEqual(len(self.reports), 1)
+        self.assertIn("queue full", self.reports[0])
+
+    def test_slow_press_is_reported_and_does_not_block_toggle(self):
+        self.release.clear()
+        worker = self.make_worker(timeout=0.05).start()
+        worker.toggle()
+        worker.stop()
+        self.assertEqual(self.pressed, [])
+        self.assertEqual(len(self.reports), 1)
+        self.assertIn("timed out", self.reports[0])
+
+    def test_presses_are_skipped_while_one_is_stuck(self):
+        self.release.clear()
+        worker = self.make_worker(timeout=0.05).start()
+        worker.toggle()
+        self.assertTrue(self.reported.wait(1))  # Timed out, still stuck in press()
+        self.reported.clear()
+        worker.toggle()
+        self.assertTrue(self.reported.wait(1))
+        self.assertEqual(self.presses_started, 1)
+        self.assertIn("still stuck", self.reports[1])
+        self.release.set()
+        worker.stop()
+
+    def test_failed_press_is_reported(self):
+        def failing_press(key):
+            raise OSError("no display")
+
+        worker = MediaKeyWorker(report=self.reports.append, press=failing_press).start()
+        worker.toggle()
+        worker.stop()
+        self.assertEqual(self.reports, ["Media key playpause failed: no display"])
+
+
+if __name__ == '__main__':
+    unittest.main()
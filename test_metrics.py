@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+import urllib.error
+import urllib.request
+
+from metrics import Histogram, MetricsRegistry, MetricsServer
+
+
+class TestHistogram(unittest.TestCase):
+
+    def test_observations_land_in_the_first_bucket_that_fits(self):
+        histogram = Histogram((0.01, 0.1, 1.0))
+        for value in (0.005, 0.01, 0.05, 3.0):
+            histogram.observe(value)
+        counts, total, count = histogram.snapshot()
+        self.assertEqual(counts, [2, 1, 0, 1])
+        self.assertAlmostEqual(total, 3.065)
+        self.assertEqual(count, 4)
+
+
+class TestMetricsRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_same_name_and_labels_share_a_histogram(self):
+        first = self.registry.histogram('op_seconds', 'Ops', operation='a')
+        self.assertIs(first, self.registry.histogram('op_seconds', 'Ops', operation='a'))
+        self.assertIsNot(first, self.registry.histogram('op_seconds', 'Ops', operation='b'))
+
+    def test_render_is_cumulative_prometheus_text(self):
+        histogram = self.registry.histogram('op_seconds', 'Ops', buckets=(0.1, 1.0), operation='go')
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        text = self.registry.render()
+        self.assertIn('# HELP op_seconds Ops\n# TYPE op_seconds histogram\n', text)
+        self.assertIn('op_seconds_bucket{operation="go",le="0.1"} 1\n', text)
+        self.assertIn('op_seconds_bucket{operation="go",le="1.0"} 2\n', text)
+        self.assertIn('op_seconds_bucket{operation="go",le="+Inf"} 2\n', text)
+        self.assertIn('op_seconds_count{operation="go"} 2\n', text)
+
+    def test_dump_writes_render(self):
+        self.registry.histogram('tick_seconds', 'Ticks').observe(0.002)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'metrics.prom')
+            self.registry.dump(path)
+            with open(path) as f:
+                self.assertEqual(f.read(), self.registry.render())
+
+
+class TestMetricsServer(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = MetricsRegistry()
+        self.registry.histogram('tick_seconds', 'Ticks').observe(0.002)
+        self.server = MetricsServer(0, self.registry).start()
+        self.addCleanup(self.server.stop)
+
+    def test_serves_metrics_on_loopback(self):
+        self.assertEqual(self.server.httpd.server_address[0], '127.0.0.1')
+        with urllib.request.urlopen(f'http://127.0.0.1:{self.server.port}/metrics', timeout=5) as response:
+            self.assertIn('text/plain', response.headers['Content-Type'])
+            self.assertEqual(response.read().decode(), self.registry.render())
+
+    def test_other_paths_are_not_found(self):
+        with self.assertRaises(urllib.error.HTTPError) as raised:
+            urllib.request.urlopen(f'http://127.0.0.1:{self.server.port}/', timeout=5)
+        self.assertEqual(raised.exception.code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
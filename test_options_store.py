@@ -0,0 +1,90 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from options_store import OptionsStore, write_json_atomically
+
+
+class TestOptionsStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, 'options.json')
+        with open(self.path, 'w') as f:
+            json.dump({"voice_active": True, "window_width": 700}, f)
+
+    def make_store(self, delay=0.05):
+        store = OptionsStore(self.path, delay=delay)
+        self.addCleanup(store.close)
+        store.load()
+        return store
+
+    def read_file(self):
+        with open(self.path, 'r') as f:
+            return json.load(f)
+
+    def test_rapid_changes_are_batched_into_one_write(self):
+        store = self.make_store(delay=0.2)
+        for i in range(10):
+            store.update(voice_active=bool(i % 2), window_width=700 + i)
+        self.assertEqual(store.writes, 0)  # Nothing written on the caller's thread
+        deadline = time.monotonic() + 5
+        while store.writes == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.3)
+        self.assertEqual(store.writes, 1)
+        self.assertEqual(self.read_file(), {"voice_active": True, "window_width": 709})
+
+    def test_unchanged_values_are_not_written(self):
+        store = self.make_store()
+        store.update(voice_active=True)
+        store.flush()
+        self.assertEqual(store.writes, 0)
+
+    def test_flush_writes_synchronously(self):
+        store = self.make_store(delay=60)
+        store.update(window_width=800)
+        store.flush()
+        self.assertEqual(self.read_file()["window_width"], 800)
+
+    def test_crash_mid_write_leaves_previous_file_intact(self):
+        def crash_mid_dump(data, f, **kwargs):
+            f.write('{"voice_active": fa')  # Partial write, then the process "dies"
+            raise KeyboardInterrupt
+
+        with patch('options_store.json.dump', side_effect=crash_mid_dump):
+            with self.assertRaises(KeyboardInterrupt):
+                write_json_atomically(self.path, {"voice_active": False, "window_width": 900})
+        self.assertEqual(self.read_file(), {"voice_active": True, "window_width": 700})
+        self.assertEqual(os.listdir(self.tmp.name), ['options.json'])
+
+    @unittest.skipIf(os.name == 'nt', 'POSIX permission bits')
+    def test_write_keeps_the_file_mode(self):
+        os.chmod(self.path, 0o640)
+        write_json_atomically(self.path, {"voice_active": False})
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o640)
+
+    @unittest.skipIf(os.name == 'nt', 'POSIX permission bits')
+    def test_new_file_gets_the_umask_default_mode(self):
+        os.remove(self.path)
+        old_umask = os.umask(0o022)
+        self.addCleanup(os.umask, old_umask)
+        write_json_atomically(self.path, {"voice_active": False})
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o644)
+
+    def test_crash_before_rename_leaves_previous_file_intact(self):
+        store = self.make_store(delay=60)
+        store.update(window_width=900)
+        with patch('options_store.os.replace', side_effect=OSError("disk full")):
+            store.flush()  # Logged, and the change stays pending
+        self.assertEqual(self.read_file()["window_width"], 700)
+        store.flush()
+        self.assertEqual(self.read_file()["window_width"], 900)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+
+from phase_timer import PhaseTimer, SuspendDetector
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestPhaseTimer(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.timer = PhaseTimer(clock=self.clock)
+
+    def test_paused_timer_keeps_remaining(self):
+        self.timer.start(1500)
+        self.clock.now += 30
+        self.assertFalse(self.timer.running)
+        self.assertEqual(self.timer.seconds_remaining(), 1500)
+
+    def test_remaining_is_derived_from_deadline(self):
+        self.timer.start(1500)
+        self.timer.resume()
+        self.clock.now += 0.5
+        self.assertEqual(self.timer.seconds_remaining(), 1500)
+        self.clock.now += 0.5
+        self.assertEqual(self.timer.seconds_remaining(), 1499)
+        # A very late callback sees the true value, not one second less than the last one it saw
+        self.clock.now += 42.7
+        self.assertEqual(self.timer.seconds_remaining(), 1457)
+
+    def test_pause_and_resume_preserve_fraction(self):
+        self.timer.start(60)
+        self.timer.resume()
+        self.clock.now += 10.25
+        self.timer.pause()
+        self.clock.now += 500
+        self.assertAlmostEqual(self.timer.remaining(), 49.75)
+        self.timer.resume()
+        self.clock.now += 49.75
+        self.assertAlmostEqual(self.timer.remaining(), 0.0)
+
+    def test_next_tick_is_aligned_to_deadline_seconds(self):
+        self.timer.start(1500)
+        self.timer.resume()
+        self.clock.now += 0.3
+        self.assertEqual(self.timer.next_tick_delay_ms(slack_ms=0), 700)
+        self.clock.now += 1.65  # Late callback: next wake-up still lands on the boundary
+        self.assertEqual(self.timer.next_tick_delay_ms(slack_ms=0), 50)
+
+    def test_next_phase_is_chained_to_elapsed_deadline(self):
+        self.timer.start(300)
+        self.timer.resume()
+        deadline = self.timer.deadline
+        self.clock.now = deadline + 0.8  # Transition fired 0.8s late
+        self.timer.start(1500)
+        self.assertAlmostEqual(self.timer.deadline, deadline + 1500)
+
+    def test_skip_starts_next_phase_from_now(self):
+        self.timer.start(1500)
+        self.timer.resume()
+        self.clock.now += 100
+        self.timer.start(300)
+        self.assertAlmostEqual(self.timer.remaining(), 300)
+
+
+class TestSuspendDetector(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.suspend_clock = FakeClock(5000.0)
+        self.detector = SuspendDetector(clock=self.clock, suspend_clock=self.suspend_clock, threshold=5.0)
+
+    def advance(self, awake, asleep=0.0):
+        self.clock.now += awake
+        self.suspend_clock.now += awake + asleep
+
+    def test_normal_ticks_report_nothing(self):
+        for _ in range(10):
+            self.advance(1.0)
+            self.assertEqual(self.detector.check(), 0.0)
+
+    def test_small_clock_skew_is_ignored(self):
+        self.advance(1.0, asleep=2.0)
+        self.assertEqual(self.detector.check(), 0.0)
+
+    def test_suspend_is_reported_once(self):
+        self.advance(1.0, asleep=3600.0)
+        self.assertAlmostEqual(self.detector.check(), 3600.0)
+        self.advance(1.0)
+        self.assertEqual(self.detector.check(), 0.0)
+
+    def test_reset_forgets_time_before_it(self):
+        self.advance(1.0, asleep=3600.0)
+        self.detector.reset()
+        self.advance(1.0)
+        self.assertEqual(self.detector.check(), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks'))
+
+import headless  # noqa: E402
+
+progress_ring = headless.load_progress_ring()
+
+
+class TestProgressRing(unittest.TestCase):
+
+    def setUp(self):
+        self.ring = progress_ring.ProgressRing(headless.CanvasStub(), size=110, thickness=8)
+        self.item_calls = self.ring.item_calls
+
+    def extent(self):
+        return self.ring.items[self.ring._arc][2]['extent']
+
+    def test_items_are_created_once(self):
+        self.assertEqual(self.ring.created, 3)
+        for second in range(1500, 0, -1):
+            self.ring.show(second / 1500, f'{second // 60:02}:{second % 60:02}')
+        self.assertEqual(self.ring.created, 3)
+
+    def test_unchanged_frames_touch_no_items(self):
+        self.ring.show(0.5, '12:30')
+        calls = self.ring.item_calls
+        for _ in range(10):
+            self.ring.show(0.5, '12:30')
+            self.ring.show(0.5 - 1e-4, '12:30')  # Less than a pixel of arc
+        self.assertEqual(self.ring.item_calls, calls)
+
+    def test_text_and_arc_update_independently(self):
+        self.ring.show(0.5, '12:30')
+        calls = self.ring.item_calls
+        self.ring.show(0.5, '12:29')
+        self.assertEqual(self.ring.item_calls, calls + 1)
+        self.assertEqual(self.ring.items[self.ring._text][2]['text'], '12:29')
+
+    def test_extent_drains_clockwise_from_the_top(self):
+        self.ring.show(0.25, '')
+        self.assertAlmostEqual(self.extent(), -90, delta=self.ring.degrees_per_pixel)
+        self.ring.show(0.0, '')
+        self.assertEqual(self.extent(), 0)
+        self.ring.show(1.5, '')
+        self.assertEqual(self.extent(), -359.9)  # Clamped; a full 360 would draw nothing
+
+    def test_a_long_phase_redraws_the_arc_far_less_than_once_per_second(self):
+        arc_updates = 0
+        for second in range(1500, -1, -1):
+            before = self.ring.extent
+            self.ring.show(second / 1500, '')
+            arc_updates += self.ring.extent != before
+        self.assertLess(arc_updates, 1500 / 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
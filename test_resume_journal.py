@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from engine import State
+from resume_journal import RECORD, ResumeJournal
+
+
+class TestResumeJournal(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'resume.journal')
+        self.journal = ResumeJournal(self.path)
+
+    def test_running_phase_is_stored_as_a_deadline(self):
+        self.journal.save(State.Working, 2, True, 600.0, phase_ends_at=10_600.0)
+        checkpoint = ResumeJournal(self.path).load()
+        self.assertEqual((checkpoint.state, checkpoint.rests, checkpoint.timer_active), (State.Working, 2, True))
+        self.assertEqual(checkpoint.remaining(now=10_100.0), 500.0)
+        self.assertEqual(checkpoint.remaining(now=10_700.0), -100.0)
+
+    def test_paused_phase_keeps_its_remaining_time(self):
+        self.journal.save(State.Rest, 1, False, 123.5)
+        checkpoint = self.journal.load()
+        self.assertIsNone(checkpoint.phase_ends_at)
+        self.assertEqual(checkpoint.remaining(now=1e12), 123.5)
+
+    def test_record_is_fixed_size_and_replaced_atomically(self):
+        self.journal.save(State.Working, 0, True, 1500.0, phase_ends_at=1500.0)
+        self.journal.save(State.Rest, 1, True, 300.0, phase_ends_at=1800.0)
+        self.assertEqual(os.path.getsize(self.path), RECORD.size)
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ['resume.journal'])  # No temp file left behind
+        self.assertEqual(self.journal.load().state, State.Rest)
+
+    def test_record_is_synced_before_the_rename(self):
+        calls = []
+        with patch('resume_journal.os.fsync', side_effect=lambda fd: calls.append('fsync')), \
+                patch('resume_journal.os.replace', side_effect=lambda src, dst: calls.append('replace')):
+            self.journal.save(State.Working, 0, False, 600.0)
+        self.assertEqual(calls, ['fsync', 'replace'])
+
+    def test_unchanged_schedule_is_not_rewritten(self):
+        self.journal.save(State.Working, 0, False, 900.0)
+        mtime = os.stat(self.path).st_mtime_ns
+        os.utime(self.path, ns=(0, 0))
+        self.journal.save(State.Working, 0, False, 900.0)
+        self.assertEqual(os.stat(self.path).st_mtime_ns, 0)
+        self.assertNotEqual(mtime, 0)
+
+    def test_ready_clears_the_journal(self):
+        self.journal.save(State.Working, 0, True, 1500.0, phase_ends_at=1500.0)
+        self.journal.save(State.Ready, 0, False, 1500.0)
+        self.assertFalse(os.path.exists(self.path))
+        self.assertIsNone(self.journal.load())
+
+    def test_truncated_or_foreign_files_are_ignored(self):
+        for data in (b'', b'PYMJ', b'X' * RECORD.size):
+            with open(self.path, 'wb') as f:
+                f.write(data)
+            self.assertIsNone(self.journal.load())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import os
+import unittest
+from unittest.mock import patch
+
+import PIL.Image
+
+from state_graphics import StateGraphicCache, graphic_key
+
+res_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'res')
+image_dict = {'Ready': os.path.join(res_dir, 'ReadyState.png'),
+              'Working1': os.path.join(res_dir, 'Working1State.png'),
+              'Rest1': os.path.join(res_dir, 'Rest1State.png'),
+              'LongRest1': os.path.join(res_dir, 'Rest4State.png')}
+
+
+class TestStateGraphicCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = StateGraphicCache(image_dict, photo_factory=lambda image: ('photo', image))
+
+    def test_graphic_key(self):
+        self.assertEqual(graphic_key('Ready', 0), 'Ready')
+        self.assertEqual(graphic_key('Working', 2), 'Working3')
+        self.assertEqual(graphic_key('Rest', 1), 'Rest1')
+        self.assertEqual(graphic_key('LongRest', 0), 'LongRest1')
+
+    def test_lazy_get_decodes_once(self):
+        with patch('PIL.Image.open', wraps=PIL.Image.open) as mock_open:
+            first = self.cache.get('Working1')
+            second = self.cache.get('Working1')
+        mock_open.assert_called_once_with(image_dict['Working1'])
+        self.assertIs(first, second)
+
+    def test_preloaded_graphics_need_no_file_io(self):
+        self.cache.preload_in_background().join()
+        with patch('PIL.Image.open') as mock_open:
+            for key in image_dict:
+                self.cache.get(key)
+        mock_open.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import io
+import os
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from status_file import StatusFileReader, StatusFileWriter, main
+
+
+class TestStatusFile(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'pymodoro.status')
+        self.writer = StatusFileWriter(self.path)
+        self.reader = StatusFileReader(self.path)
+        self.addCleanup(self.reader.close)
+
+    def test_round_trip(self):
+        self.writer.write(1, 2, 754, True, phase_ends_at=1_000_754.0)
+        status = self.reader.read()
+        self.assertEqual((status.state, status.rests, status.time_remaining, status.timer_active),
+                         ('Working', 2, 754, True))
+        self.assertEqual(status.phase_ends_at, 1_000_754.0)
+        self.assertEqual(status.pid, os.getpid())
+        self.assertEqual(status.remaining(now=1_000_700.2), 54)  # Counts down between writes
+
+    def test_paused_status_has_no_deadline(self):
+        self.writer.write(2, 1, 120, False)
+        status = self.reader.read()
+        self.assertIsNone(status.phase_ends_at)
+        self.assertEqual(status.remaining(), 120)
+
+    def test_updates_in_place_are_seen_by_an_open_reader(self):
+        self.writer.write(0, 0, 1500, False)
+        self.assertEqual(self.reader.read().state, 'Ready')
+        self.writer.write(1, 0, 1500, True, phase_ends_at=1.0)
+        self.assertEqual(self.reader.read().state, 'Working')
+
+    def test_write_in_progress_is_not_returned(self):
+        self.writer.write(1, 0, 1500, True)
+        self.writer.map[8:16] = struct.pack('<Q', self.writer.seq + 1)  # Writer stalled mid-update
+        self.assertIsNone(StatusFileReader(self.path, retries=3).read())
+
+    def test_reads_are_never_torn(self):
+        stop = threading.Event()
+
+        def write():
+            value = 0
+            while not stop.is_set():
+                value = (value + 1) % 1000
+                self.writer.write(1, value, value, True)  # rests always equals time_remaining
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        try:
+            for _ in range(20000):
+                status = self.reader.read()
+                if status is not None:
+                    self.assertEqual(status.rests, status.time_remaining)
+        finally:
+            stop.set()
+            writer.join()
+
+    def test_closed_instance_reads_as_not_running(self):
+        self.writer.write(1, 0, 1500, True)
+        self.assertIsNotNone(self.reader.read())
+        self.writer.close()
+        self.assertFalse(os.path.exists(self.path))
+        self.assertIsNone(self.reader.read())
+
+    def test_cli(self):
+        self.writer.write(3, 0, 61, False)
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            self.assertEqual(main(['--path', self.path]), 0)
+        self.assertEqual(stdout.getvalue(), 'LongRest (paused) 01:01\n')
+        self.assertEqual(main(['--path', self.path + '.missing']), 1)
+
+    def test_reader_does_not_import_gui_modules(self):
+        code = ("import sys, status_file; "
+                "print(sorted(m for m in ('tkinter', 'pygame', 'PIL', 'loguru') if m in sys.modules))")
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout
+        self.assertEqual(output.strip(), '[]')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import unittest
+import urllib.error
+import urllib.request
+
+from status_server import StatusServer
+
+
+class TestStatusServer(unittest.TestCase):
+
+    def setUp(self):
+        self.subscribed = threading.Event()
+        self.server = StatusServer(0, on_subscribe=self.subscribed.set).start()
+        self.addCleanup(self.server.stop)
+
+    def open_stream(self):
+        stream = socket.create_connection(('127.0.0.1', self.server.port), timeout=5)
+        self.addCleanup(stream.close)
+        stream.sendall(b'GET /events HTTP/1.1\r\nHost: localhost\r\n\r\n')
+        reader = stream.makefile('rb')
+        self.addCleanup(reader.close)
+        while reader.readline() != b'\r\n':  # Skip the response headers
+            pass
+        return reader
+
+    def read_event(self, reader):
+        lines = []
+        while True:
+            line = reader.readline().decode().rstrip('\n')
+            if not line:
+                return lines
+            lines.append(line)
+
+    def test_snapshot_endpoint(self):
+        self.server.publish({'state': 'Working', 'time_remaining': 1500})
+        with urllib.request.urlopen(f'http://127.0.0.1:{self.server.port}/status', timeout=5) as response:
+            self.assertEqual(response.headers['Content-Type'], 'application/json')
+            self.assertEqual(json.load(response), {'state': 'Working', 'time_remaining': 1500})
+
+    def test_streams_share_each_published_frame(self):
+        self.server.publish({'state': 'Ready'}, 'state')
+        readers = [self.open_stream(), self.open_stream()]
+        for reader in readers:
+            self.assertEqual(self.read_event(reader), ['event: state', 'data: {"state":"Ready"}'])
+        self.assertTrue(self.subscribed.is_set())
+        self.assertEqual(self.server.subscribers, 2)
+
+        self.server.publish({'state': 'Working', 'time_remaining': 1499}, 'tick')
+        for reader in readers:
+            self.assertEqual(self.read_event(reader), ['event: tick', 'data: {"state":"Working","time_remaining":1499}'])
+
+    def test_unknown_path(self):
+        with self.assertRaises(urllib.error.HTTPError) as raised:
+            urllib.request.urlopen(f'http://127.0.0.1:{self.server.port}/', timeout=5)
+        self.assertEqual(raised.exception.code, 404)
+
+
+class TestImportCost(unittest.TestCase):
+
+    def test_http_server_is_only_imported_when_a_server_is_built(self):
+        # Both servers are opt-in, so plain app startup shouldn't pay for http.server
+        code = "import sys, metrics, status_server; print('http.server' in sys.modules)"
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout
+        self.assertEqual(output.strip(), 'False')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks'))
+
+import headless  # noqa: E402
+
+toggle_switch = headless.load_toggle_switch()
+
+
+class TestToggleSwitch(unittest.TestCase):
+
+    def setUp(self):
+        self.variable = headless.BooleanVarStub(False)
+        self.command = MagicMock()
+        self.now = 0.0
+        self.switch = toggle_switch.ToggleSwitch(headless.CanvasStub(), self.variable, command=self.command)
+        self.switch.clock = lambda: self.now
+
+    def knob_x(self):
+        return self.switch.coords(self.switch._knob)[0]
+
+    def run_frames(self):
+        while self.switch.pending:
+            self.switch.run_pending()
+            self.now += self.switch.frame_ms / 1000
+
+    def test_items_are_created_once(self):
+        self.assertEqual(self.switch.created, 4)
+        for _ in range(5):
+            self.variable.set(not self.variable.get())
+            self.run_frames()
+        self.assertEqual(self.switch.created, 4)
+        self.assertEqual(len(self.switch.items), 4)
+
+    def test_knob_slides_across_frames(self):
+        self.variable.set(True)
+        positions = []
+        while self.switch.pending:
+            self.switch.run_pending()
+            positions.append(self.knob_x())
+            self.now += self.switch.frame_ms / 1000
+        self.assertEqual(positions[-1], 44 - 18 - 2)  # Right end
+        self.assertEqual(positions, sorted(positions))
+        self.assertGreater(len(set(positions)), 3)
+        self.assertEqual(self.switch.items[self.switch._knob][2]['fill'], self.switch.knob_color_on)
+
+    def test_late_frames_do_not_lengthen_the_slide(self):
+        self.variable.set(True)
+        self.switch.run_pending()
+        self.now += 1.0  # The event loop stalled for a second
+        self.run_frames()
+        self.assertEqual(self.knob_x(), 44 - 18 - 2)
+
+    def test_command_runs_once_per_event_loop_turn(self):
+        for _ in range(3):
+            self.variable.set(not self.variable.get())
+        self.command.assert_not_called()
+        self.run_frames()
+        self.command.assert_called_once()
+
+    def test_destroy_runs_a_pending_command_and_drops_the_trace(self):
+        self.variable.set(True)
+        self.switch.destroy()
+        self.command.assert_called_once()
+        self.assertEqual(self.variable.traces, {})
+
+    def test_without_animation_the_knob_jumps(self):
+        self.switch.animation_ms = 0
+        self.variable.set(True)
+        self.assertEqual(self.knob_x(), 44 - 18 - 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
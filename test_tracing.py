@@ -0,0 +1,81 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from startup_profile import StartupProfiler
+from tracing import NULL_SPAN, Tracer, traced
+
+
+class TestTracer(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, 'trace.json')
+
+    def test_disabled_tracer_returns_shared_null_span(self):
+        tracer = Tracer()
+        self.assertIs(tracer.span('go'), NULL_SPAN)
+        with tracer.span('go'):
+            pass
+        self.assertEqual(tracer.events, [])
+
+    def test_nested_spans_are_contained_in_their_parent(self):
+        tracer = Tracer(self.path)
+        with tracer.span('transition_state', kind='Skip'):
+            with tracer.span('play_sound'):
+                pass
+        child, parent = tracer.events
+        self.assertEqual((parent['name'], child['name']), ('transition_state', 'play_sound'))
+        self.assertEqual(parent['args'], {'kind': 'Skip'})
+        self.assertLessEqual(parent['ts'], child['ts'])
+        self.assertGreaterEqual(parent['ts'] + parent['dur'], child['ts'] + child['dur'])
+
+    def test_write_produces_chrome_trace_json(self):
+        tracer = Tracer(self.path)
+        with tracer.span('go'):
+            pass
+
+        def preload():
+            with tracer.span('preload'):
+                pass
+
+        worker = threading.Thread(target=preload, name='worker')
+        worker.start()
+        worker.join()
+        tracer.write()
+        with open(self.path) as f:
+            trace = json.load(f)
+        spans = [event for event in trace['traceEvents'] if event['ph'] == 'X']
+        self.assertEqual([span['name'] for span in spans], ['go', 'preload'])
+        self.assertNotEqual(spans[0]['tid'], spans[1]['tid'])
+        thread_names = {event['args']['name'] for event in trace['traceEvents'] if event['ph'] == 'M'}
+        self.assertIn('worker', thread_names)
+
+    def test_traced_decorator_follows_the_global_tracer(self):
+        @traced('step')
+        def step():
+            return 42
+
+        tracer = Tracer()
+        with patch('tracing.TRACER', tracer):
+            self.assertEqual(step(), 42)
+            self.assertEqual(tracer.events, [])
+            tracer.enable(self.path)
+            self.assertEqual(step(), 42)
+        self.assertEqual([event['name'] for event in tracer.events], ['step'])
+
+    def test_startup_phases_are_forwarded_as_spans(self):
+        tracer = Tracer(self.path)
+        profiler = StartupProfiler(tracer=tracer)
+        with profiler.phase('tk init'):
+            pass
+        self.assertEqual(profiler.phases, [])  # --profile-startup itself is still off
+        self.assertEqual([(event['name'], event['cat']) for event in tracer.events], [('tk init', 'startup')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,13 +1,25 @@
+import time
 import tkinter as tk
 
 class ToggleSwitch(tk.Canvas):
-    def __init__(self, parent, variable, command=None, width=44, height=22, **kwargs):
+    """Pill-shaped on/off switch bound to a BooleanVar.
+
+    The canvas items are created once and then moved and recoloured in place. A toggle slides
+    the knob over `animation_ms`, with one `after` frame per `frame_ms`. Each frame places the
+    knob by elapsed time, so late frames make the slide choppier but not longer. `command` runs
+    once per event-loop turn, however many times the variable was written in it.
+    """
+
+    def __init__(self, parent, variable, command=None, width=44, height=22, animation_ms=120, frame_ms=16, **kwargs):
         super().__init__(parent, width=width, height=height, borderwidth=0, highlightthickness=0, **kwargs)
 
         self.variable = variable
         self.command = command
         self.width = width
         self.height = height
+        self.animation_ms = animation_ms
+        self.frame_ms = frame_ms
+        self.clock = time.monotonic
         self.knob_diameter = height - 4  # Knob slightly smaller than canvas height, with 2px padding top/bottom
         self.track_color_on = '#abdbe3'  # Light Blue (button_bg, for better contrast with window bg)
         self.track_color_off = '#cccccc'  # Light Gray
@@ -16,58 +28,91 @@ class ToggleSwitch(tk.Canvas):
 
         self.configure(bg=self.master.cget('bg')) # Match parent background
 
-        self.bind("<Button-1>", self._on_click)
-        self.variable.trace_add("write", self._on_variable_change) # Update visuals if var changes externally
+        self._position = 1.0 if self.variable.get() else 0.0  # Knob position: 0 is off (left), 1 is on (right)
+        self._target = self._position
+        self._animation = None  # (start time, start position) while the knob is sliding
+        self._frame_id = None
+        self._command_id = None
+        self._colors = None
+        self._create_items()
 
-        self._draw_switch()
-
-    def _draw_switch(self):
-        self.delete("all")
-        current_state = self.variable.get()
+        self.bind("<Button-1>", self._on_click)
+        self._trace_id = self.variable.trace_add("write", self._on_variable_change) # Update visuals if var changes externally
 
-        # Track
-        track_x1 = 0
-        track_y1 = 0
-        track_x2 = self.width
-        track_y2 = self.height
+    def _create_items(self):
+        """Creates the track (two end caps and a middle) and the knob. Called once."""
         radius = self.height / 2
+        self._track_items = (
+            self.create_oval(0, 0, 2 * radius, self.height),
+            self.create_oval(self.width - 2 * radius, 0, self.width, self.height),
+            self.create_rectangle(radius, 0, self.width - radius, self.height),
+        )
+        self._knob = self.create_oval(*self._knob_coords(self._position))
+        self._draw_switch()
 
-        track_color = self.track_color_on if current_state else self.track_color_off
-
-        # Simplified rounded rectangle for track (pill shape)
-        # Left semi-circle
-        self.create_oval(track_x1, track_y1, track_x1 + 2 * radius, track_y2, fill=track_color, outline=track_color)
-        # Right semi-circle
-        self.create_oval(track_x2 - 2 * radius, track_y1, track_x2, track_y2, fill=track_color, outline=track_color)
-        # Center rectangle
-        self.create_rectangle(track_x1 + radius, track_y1, track_x2 - radius, track_y2, fill=track_color, outline=track_color)
-
-        # Knob
+    def _knob_coords(self, position):
         knob_x_padding = 2  # Padding from the edge of the track
-        knob_y = (self.height - self.knob_diameter) / 2 # Centered vertically
+        travel = self.width - self.knob_diameter - 2 * knob_x_padding
+        knob_x1 = knob_x_padding + travel * position
+        knob_y1 = (self.height - self.knob_diameter) / 2  # Centered vertically
+        return knob_x1, knob_y1, knob_x1 + self.knob_diameter, knob_y1 + self.knob_diameter
 
-        if current_state:  # ON state - knob on the right
-            knob_x1 = self.width - self.knob_diameter - knob_x_padding
-            knob_color = self.knob_color_on
-        else:  # OFF state - knob on the left
-            knob_x1 = knob_x_padding
-            knob_color = self.knob_color_off
-
-        knob_x2 = knob_x1 + self.knob_diameter
-        knob_y1 = knob_y
-        knob_y2 = knob_y + self.knob_diameter
-
-        self.create_oval(knob_x1, knob_y1, knob_x2, knob_y2, fill=knob_color, outline=knob_color)
+    def _draw_switch(self):
+        """Brings the items in line with the knob position, touching only what changed."""
+        on = self._target >= 0.5
+        colors = (self.track_color_on, self.knob_color_on) if on else (self.track_color_off, self.knob_color_off)
+        if colors != self._colors:
+            track_color, knob_color = colors
+            for item in self._track_items:
+                self.itemconfig(item, fill=track_color, outline=track_color)
+            self.itemconfig(self._knob, fill=knob_color, outline=knob_color)
+            self._colors = colors
+        self.coords(self._knob, *self._knob_coords(self._position))
 
     def _on_click(self, event):
         current_state = self.variable.get()
         self.variable.set(not current_state)
-        # The trace on self.variable will call _draw_switch and the command
+        # The trace on self.variable will animate the switch and schedule the command
 
     def _on_variable_change(self, *args):
+        target = 1.0 if self.variable.get() else 0.0
+        if target != self._target:
+            self._target = target
+            if self.animation_ms > 0:
+                self._animation = (self.clock(), self._position)
+                if self._frame_id is None:
+                    self._next_frame()
+            else:
+                self._position = target
+                self._draw_switch()
+        if self.command and self._command_id is None:
+            self._command_id = self.after_idle(self._run_command)
+
+    def _next_frame(self):
+        start, start_position = self._animation
+        progress = min(1.0, (self.clock() - start) * 1000 / self.animation_ms)
+        self._position = start_position + (self._target - start_position) * progress
         self._draw_switch()
-        if self.command:
-            self.command()
+        if progress < 1.0:
+            self._frame_id = self.after(self.frame_ms, self._next_frame)
+        else:
+            self._frame_id = None
+            self._animation = None
+
+    def _run_command(self):
+        self._command_id = None
+        self.command()
+
+    def destroy(self):
+        # Pending callbacks die with the widget, so a change made just before closing is saved now
+        self.variable.trace_remove("write", self._trace_id)
+        if self._frame_id is not None:
+            self.after_cancel(self._frame_id)
+            self._frame_id = None
+        if self._command_id is not None:
+            self.after_cancel(self._command_id)
+            self._run_command()
+        super().destroy()
 
 if __name__ == '__main__':
     # Example Usage
@@ -0,0 +1,88 @@
+"""Opt-in span tracing, written as Chrome Trace Event JSON (open in chrome://tracing or Perfetto).
+
+Enabled with --trace FILE or the PYMODORO_TRACE environment variable. When disabled, span()
+returns a shared no-op context manager and @traced calls straight through.
+"""
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+
+from loguru import logger
+
+from startup_profile import PROCESS_START
+
+NULL_SPAN = contextlib.nullcontext()
+
+
+class _Span:
+    __slots__ = ('tracer', 'name', 'args', 'start')
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.tracer.complete(self.name, self.start, time.perf_counter(), self.args)
+
+
+class Tracer:
+    def __init__(self, path=None):
+        self.path = path
+        self.enabled = path is not None
+        self.events = []
+        self._thread_names = {}
+        self._pid = os.getpid()
+
+    def enable(self, path):
+        self.path = path
+        self.enabled = True
+
+    def span(self, name, **args):
+        if not self.enabled:
+            return NULL_SPAN
+        return _Span(self, name, args)
+
+    def complete(self, name, start, end, args=None, category='ui'):
+        """Records a finished span from perf_counter() timestamps, on the calling thread's track."""
+        tid = threading.get_ident()
+        if tid not in self._thread_names:
+            self._thread_names[tid] = threading.current_thread().name
+        event = {'name': name, 'cat': category, 'ph': 'X', 'pid': self._pid, 'tid': tid,
+                 'ts': (start - PROCESS_START) * 1e6, 'dur': (end - start) * 1e6}
+        if args:
+            event['args'] = args
+        self.events.append(event)  # list.append is atomic, so worker threads can record too
+
+    def write(self):
+        thread_names = [{'name': 'thread_name', 'ph': 'M', 'pid': self._pid, 'tid': tid, 'args': {'name': name}}
+                        for tid, name in list(self._thread_names.items())]
+        try:
+            with open(self.path, 'w') as f:
+                json.dump({'traceEvents': thread_names + list(self.events), 'displayTimeUnit': 'ms'}, f)
+            logger.info("Wrote {} trace spans to {}", len(self.events), self.path)
+        except OSError as e:
+            logger.error("Error writing trace to {}: {}", self.path, e)
+
+
+TRACER = Tracer(os.environ.get('PYMODORO_TRACE') or None)
+
+
+def traced(name):
+    """Decorator recording each call as a span named `name`; nested calls show up as child spans."""
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not TRACER.enabled:
+                return function(*args, **kwargs)
+            with _Span(TRACER, name, None):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator